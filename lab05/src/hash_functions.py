@@ -5,8 +5,11 @@
 2. Полиномиальная хеш-функция
 3. DJB2
 Все функции возвращают индекс в пределах размера хеш-таблицы.
+На их основе построено двойное хеширование double_hash_indices.
 """
 
+from typing import List
+
 
 def simple_hash(key: str, table_size: int) -> int:
     """
@@ -51,6 +54,23 @@ def djb2_hash(key: str, table_size: int) -> int:
     return hash_value % table_size
 
 
+def double_hash_indices(key: str, count: int, table_size: int) -> List[int]:
+    """
+    Двойное хеширование: count индексов g_i = (h1 + i*h2) % table_size,
+    где h1 - DJB2, h2 - полиномиальная функция (шаг не равен нулю).
+    Применимость: несколько "независимых" хешей по цене двух
+    (схема Кирша-Митценмахера, фильтр Блума).
+    Сложность: O(n + count), где n - длина строки.
+    :param key: строковый ключ
+    :param count: количество индексов
+    :param table_size: размер таблицы (битового массива)
+    :return: список индексов
+    """
+    h1 = djb2_hash(key, table_size)
+    h2 = 1 + polynomial_hash(key, max(1, table_size - 1))
+    return [(h1 + i * h2) % table_size for i in range(count)]
+
+
 # Пример тестирования функций
 if __name__ == "__main__":
     test_keys = ["apple", "banana", "orange", "grape"]
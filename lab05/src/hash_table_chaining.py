@@ -1,16 +1,21 @@
 """
 Модуль с реализацией хеш-таблицы с методом цепочек (Chaining).
-Поддерживает операции вставки, поиска и удаления.
+Поддерживает операции вставки, поиска и удаления, протокол MutableMapping
+и пакетные операции update / get_many / delete_many.
 Все операции имеют среднюю сложность O(1 + α), где α - коэффициент заполнения.
 """
 
+from collections.abc import Iterable, Iterator, MutableMapping
 from typing import Any, List, Optional, Callable
 from hash_functions import simple_hash
 
 
-class HashTableChaining:
+class HashTableChaining(MutableMapping):
     """Хеш-таблица с методом цепочек."""
 
+    # Коэффициент заполнения, до которого update() заранее расширяет таблицу
+    MAX_BULK_LOAD_FACTOR: float = 1.0
+
     def __init__(self, size: int = 10,
                  hash_func: Callable[[str, int], int] = simple_hash) -> None:
         """
@@ -22,6 +27,7 @@ class HashTableChaining:
         self.size: int = size
         self.table: List[List[tuple[str, Any]]] = [[] for _ in range(size)]
         self.hash_func = hash_func
+        self.count: int = 0
 
     def insert(self, key: str, value: Any) -> None:
         """
@@ -41,6 +47,7 @@ class HashTableChaining:
                 return
         # Добавление нового элемента
         self.table[index].append((key, value))
+        self.count += 1
 
     def search(self, key: str) -> Optional[Any]:
         """
@@ -72,9 +79,155 @@ class HashTableChaining:
         for i, (k, _) in enumerate(self.table[index]):
             if k == key:
                 del self.table[index][i]
+                self.count -= 1
+                return True
+        return False
+
+    def probe_length(self, key: str) -> int:
+        """
+        Количество сравнений ключей при поиске (для отсутствующего ключа -
+        длина всей цепочки). Для анализа.
+
+        :param key: ключ
+        :return: число просмотренных элементов цепочки
+        """
+        bucket = self.table[self.hash_func(key, self.size)]
+        for i, (k, _) in enumerate(bucket):
+            if k == key:
+                return i + 1
+        return len(bucket)
+
+    def resize(self, new_size: int) -> None:
+        """
+        Перестраивает таблицу с новым количеством цепочек.
+
+        Сложность: O(n + new_size)
+
+        :param new_size: новый размер хеш-таблицы
+        """
+        hash_func = self.hash_func
+        new_table: List[List[tuple[str, Any]]] = [[] for _ in range(new_size)]
+        for bucket in self.table:
+            for entry in bucket:
+                new_table[hash_func(entry[0], new_size)].append(entry)
+        self.table = new_table
+        self.size = new_size
+
+    def _reserve(self, extra: int) -> None:
+        """Расширяет таблицу один раз так, чтобы вместить ещё extra ключей."""
+        needed = self.count + extra
+        if needed > self.size * self.MAX_BULK_LOAD_FACTOR:
+            self.resize(int(needed / self.MAX_BULK_LOAD_FACTOR) + 1)
+
+    def update(self, other: Any = (), /, **kwargs: Any) -> None:
+        """
+        Пакетная вставка пар ключ-значение.
+
+        Таблица расширяется не более одного раза, индексы всех ключей
+        вычисляются одним проходом до вставки.
+        Сложность: O(m) в среднем, где m - число вставляемых пар.
+
+        :param other: отображение или итерируемое пар (ключ, значение)
+        """
+        items = dict(other, **kwargs)
+        self._reserve(len(items))
+        hash_func, size, table = self.hash_func, self.size, self.table
+        indices = [hash_func(key, size) for key in items]
+        added = 0
+        for (key, value), index in zip(items.items(), indices):
+            bucket = table[index]
+            for i, (k, _) in enumerate(bucket):
+                if k == key:
+                    bucket[i] = (key, value)
+                    break
+            else:
+                bucket.append((key, value))
+                added += 1
+        self.count += added
+
+    def get_many(self, keys: Iterable[str],
+                 default: Any = None) -> List[Any]:
+        """
+        Пакетный поиск.
+
+        Сложность: O(m * (1 + α)), где m - число ключей.
+
+        :param keys: ключи для поиска
+        :param default: значение для отсутствующих ключей
+        :return: список значений в порядке ключей
+        """
+        hash_func, size, table = self.hash_func, self.size, self.table
+        keys = list(keys)
+        indices = [hash_func(key, size) for key in keys]
+        result = []
+        for key, index in zip(keys, indices):
+            for k, v in table[index]:
+                if k == key:
+                    result.append(v)
+                    break
+            else:
+                result.append(default)
+        return result
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Пакетное удаление.
+
+        Сложность: O(m * (1 + α)), где m - число ключей.
+
+        :param keys: ключи для удаления
+        :return: количество действительно удалённых элементов
+        """
+        hash_func, size, table = self.hash_func, self.size, self.table
+        keys = list(keys)
+        indices = [hash_func(key, size) for key in keys]
+        removed = 0
+        for key, index in zip(keys, indices):
+            bucket = table[index]
+            for i, (k, _) in enumerate(bucket):
+                if k == key:
+                    del bucket[i]
+                    removed += 1
+                    break
+        self.count -= removed
+        return removed
+
+    def clear(self) -> None:
+        """Удаляет все элементы, сохраняя размер таблицы. Сложность: O(size)"""
+        self.table = [[] for _ in range(self.size)]
+        self.count = 0
+
+    def __getitem__(self, key: str) -> Any:
+        """Значение по ключу; KeyError, если ключа нет (в отличие от search)"""
+        for k, v in self.table[self.hash_func(key, self.size)]:
+            if k == key:
+                return v
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.insert(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        for k, _ in self.table[self.hash_func(key, self.size)]:
+            if k == key:
                 return True
         return False
 
+    def __iter__(self) -> Iterator[str]:
+        for bucket in self.table:
+            for k, _ in bucket:
+                yield k
+
+    def __len__(self) -> int:
+        """Количество элементов. Сложность: O(1)."""
+        return self.count
+
     def get_chain_lengths(self) -> List[int]:
         """Возвращает список длин цепочек."""
         return [len(bucket) for bucket in self.table]
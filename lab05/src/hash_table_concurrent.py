@@ -0,0 +1,241 @@
+"""
+Модуль с потокобезопасной хеш-таблицей на основе HashTableChaining.
+Используется разбиение блокировок (lock striping): таблица делится на
+сегменты, каждый сегмент - HashTableChaining со своим диапазоном цепочек
+и своей блокировкой. Запись блокирует только один сегмент, расширение
+сегмента не мешает писателям остальных сегментов.
+Чтение выполняется без блокировок: под GIL CPython чтение элемента списка,
+append и присваивание по индексу атомарны, а удаление и расширение публикуют
+новые списки одним присваиванием.
+Все операции имеют среднюю сложность O(1 + α).
+"""
+
+import threading
+from collections.abc import Iterable, Iterator, MutableMapping
+from typing import Any, Callable, Dict, List, Optional
+from hash_functions import simple_hash, djb2_hash
+from hash_table_chaining import HashTableChaining
+
+
+class _Segment(HashTableChaining):
+    """
+    Сегмент конкурентной таблицы.
+    Изменяется только под self.lock; удаление заменяет цепочку копией,
+    чтобы читатель без блокировки не пропустил сдвинутый элемент.
+    """
+
+    def __init__(self, size: int,
+                 hash_func: Callable[[str, int], int]) -> None:
+        super().__init__(size, hash_func)
+        self.lock = threading.Lock()
+
+    def delete(self, key: str) -> bool:
+        """Удаление с копированием цепочки (copy-on-write)."""
+        table = self.table
+        index = self.hash_func(key, len(table))
+        bucket = table[index]
+        for i, (k, _) in enumerate(bucket):
+            if k == key:
+                table[index] = bucket[:i] + bucket[i + 1:]
+                self.count -= 1
+                return True
+        return False
+
+    def lookup(self, key: str, default: Any = None) -> Any:
+        """
+        Поиск без блокировки.
+        Размер берётся из самого списка цепочек, поэтому даже во время
+        расширения индекс и таблица всегда согласованы.
+        """
+        table = self.table
+        for k, v in table[self.hash_func(key, len(table))]:
+            if k == key:
+                return v
+        return default
+
+
+# Маркер отсутствующего ключа для поиска без блокировки
+_MISSING = object()
+
+
+class ConcurrentHashTableChaining(MutableMapping):
+    """Потокобезопасная хеш-таблица с цепочками и разбиением блокировок."""
+
+    # Коэффициент заполнения сегмента, при превышении которого он расширяется
+    MAX_LOAD_FACTOR: float = 1.0
+
+    def __init__(self, size: int = 64,
+                 hash_func: Callable[[str, int], int] = simple_hash,
+                 num_stripes: int = 16) -> None:
+        """
+        Инициализация таблицы.
+
+        :param size: начальное суммарное количество цепочек
+        :param hash_func: хеш-функция для выбора цепочки внутри сегмента
+        :param num_stripes: количество сегментов (блокировок);
+        лучше степень двойки - размеры сегментов всегда нечётны,
+        и выбор сегмента не коррелирует с выбором цепочки
+        """
+        # Нечётный размер сегмента: остатки по num_stripes и по размеру
+        # сегмента независимы, цепочки внутри сегмента заполняются равномерно
+        segment_size = max(1, size // num_stripes) | 1
+        self.num_stripes: int = num_stripes
+        self.hash_func = hash_func
+        self.segments: List[_Segment] = [
+            _Segment(segment_size, hash_func) for _ in range(num_stripes)
+        ]
+
+    @property
+    def size(self) -> int:
+        """Суммарное количество цепочек во всех сегментах."""
+        return sum(segment.size for segment in self.segments)
+
+    def _segment_for(self, key: str) -> _Segment:
+        """Сегмент, отвечающий за ключ."""
+        return self.segments[djb2_hash(key, self.num_stripes)]
+
+    def _grow_if_needed(self, segment: _Segment) -> None:
+        """Расширяет сегмент; вызывается под его блокировкой."""
+        if segment.count > segment.size * self.MAX_LOAD_FACTOR:
+            segment.resize(2 * segment.size + 1)
+
+    def insert(self, key: str, value: Any) -> None:
+        """
+        Вставка элемента. Блокирует только сегмент ключа.
+
+        Средняя сложность: O(1 + α)
+
+        :param key: ключ для вставки
+        :param value: значение
+        """
+        segment = self._segment_for(key)
+        with segment.lock:
+            segment.insert(key, value)
+            self._grow_if_needed(segment)
+
+    def search(self, key: str) -> Optional[Any]:
+        """
+        Поиск элемента без блокировок.
+
+        Средняя сложность: O(1 + α)
+
+        :param key: ключ для поиска
+        :return: значение или None, если ключ не найден
+        """
+        return self._segment_for(key).lookup(key)
+
+    def delete(self, key: str) -> bool:
+        """
+        Удаление элемента. Блокирует только сегмент ключа.
+
+        Средняя сложность: O(1 + α)
+
+        :param key: ключ для удаления
+        :return: True, если элемент был удалён, иначе False
+        """
+        segment = self._segment_for(key)
+        with segment.lock:
+            return segment.delete(key)
+
+    def probe_length(self, key: str) -> int:
+        """Количество сравнений ключей при поиске. Для анализа."""
+        return self._segment_for(key).probe_length(key)
+
+    def _group_by_segment(self, keys: Iterable[str]) -> Dict[int, List[str]]:
+        """Раскладывает ключи по номерам сегментов."""
+        groups: Dict[int, List[str]] = {}
+        num_stripes = self.num_stripes
+        for key in keys:
+            groups.setdefault(djb2_hash(key, num_stripes), []).append(key)
+        return groups
+
+    def update(self, other: Any = (), /, **kwargs: Any) -> None:
+        """
+        Пакетная вставка: каждая блокировка сегмента берётся один раз.
+
+        :param other: отображение или итерируемое пар (ключ, значение)
+        """
+        items = dict(other, **kwargs)
+        for index, keys in self._group_by_segment(items).items():
+            segment = self.segments[index]
+            with segment.lock:
+                segment.update((key, items[key]) for key in keys)
+                self._grow_if_needed(segment)
+
+    def get_many(self, keys: Iterable[str],
+                 default: Any = None) -> List[Any]:
+        """
+        Пакетный поиск без блокировок.
+
+        :param keys: ключи для поиска
+        :param default: значение для отсутствующих ключей
+        :return: список значений в порядке ключей
+        """
+        segments, num_stripes = self.segments, self.num_stripes
+        return [segments[djb2_hash(key, num_stripes)].lookup(key, default)
+                for key in keys]
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Пакетное удаление: каждая блокировка сегмента берётся один раз.
+
+        :param keys: ключи для удаления
+        :return: количество действительно удалённых элементов
+        """
+        removed = 0
+        for index, group in self._group_by_segment(keys).items():
+            segment = self.segments[index]
+            with segment.lock:
+                for key in group:
+                    removed += segment.delete(key)
+        return removed
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._segment_for(key).lookup(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.insert(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return (isinstance(key, str) and
+                self._segment_for(key).lookup(key, _MISSING) is not _MISSING)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Слабо согласованная итерация без блокировок: ключи, изменённые
+        во время обхода, могут как попасть, так и не попасть в результат.
+        """
+        for segment in self.segments:
+            for bucket in segment.table:
+                for k, _ in bucket:
+                    yield k
+
+    def __len__(self) -> int:
+        """Количество элементов. Сложность: O(num_stripes)."""
+        return sum(segment.count for segment in self.segments)
+
+
+# Пример использования из нескольких потоков
+if __name__ == "__main__":
+    ht = ConcurrentHashTableChaining(size=16, num_stripes=4)
+
+    def worker(worker_id: int) -> None:
+        for i in range(1000):
+            ht.insert(f"w{worker_id}_{i}", i)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print("Элементов:", len(ht))
+    print("Цепочек:", ht.size)
+    print("Поиск 'w3_999':", ht.search("w3_999"))
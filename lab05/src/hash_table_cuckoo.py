@@ -0,0 +1,287 @@
+"""
+Модуль с реализацией кукушкиной хеш-таблицы (Cuckoo Hashing).
+Каждый ключ может находиться только в одной из d корзин (по одной на
+хеш-функцию), корзина содержит 4 ячейки, плюс небольшой общий stash.
+Поиск и удаление просматривают не более 4*d + STASH_SIZE ячеек - O(1)
+в худшем случае. Вставка вытесняет ключи из корзин ограниченное число раз,
+при неудаче кладёт ключ в stash, а при переполнении stash перестраивает
+таблицу с увеличенным размером. Вставка - амортизированно O(1).
+"""
+
+import random
+from collections.abc import Iterator, MutableMapping
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from hash_functions import djb2_hash, polynomial_hash
+
+HashFunc = Callable[[str, int], int]
+
+
+class HashTableCuckoo(MutableMapping):
+    """Кукушкина хеш-таблица с корзинами по 4 ячейки и stash."""
+
+    BUCKET_SIZE: int = 4
+    # Максимальное число вытеснений при одной вставке
+    MAX_KICKS: int = 100
+    STASH_SIZE: int = 4
+    # Коэффициент заполнения, после которого таблица расширяется заранее
+    MAX_LOAD_FACTOR: float = 0.9
+
+    def __init__(self, size: int = 16,
+                 hash_funcs: Sequence[HashFunc] = (djb2_hash,
+                                                   polynomial_hash),
+                 seed: int = 0) -> None:
+        """
+        Инициализация таблицы.
+
+        :param size: начальное количество ячеек (округляется до корзин)
+        :param hash_funcs: две или больше хеш-функции из hash_functions
+        :param seed: seed генератора для выбора вытесняемой ячейки
+        """
+        if len(hash_funcs) < 2:
+            raise ValueError("Нужно не меньше двух хеш-функций")
+        self.hash_funcs: Tuple[HashFunc, ...] = tuple(hash_funcs)
+        self.count: int = 0
+        self.stash: List[Tuple[str, Any]] = []
+        self.rehash_count: int = 0
+        self._rng = random.Random(seed)
+        self._allocate(max(1, -(-size // self.BUCKET_SIZE)))
+
+    def _allocate(self, num_buckets: int) -> None:
+        """Создаёт пустые массивы ключей и значений."""
+        self.num_buckets: int = num_buckets
+        self.size: int = num_buckets * self.BUCKET_SIZE
+        self.keys: List[Optional[str]] = [None] * self.size
+        self.values: List[Any] = [None] * self.size
+
+    def _find(self, key: str) -> int:
+        """
+        Индекс ячейки с ключом или -1 (stash не просматривается).
+        Сложность: O(d * BUCKET_SIZE).
+        """
+        keys, num_buckets, width = self.keys, self.num_buckets, \
+            self.BUCKET_SIZE
+        for hash_func in self.hash_funcs:
+            base = hash_func(key, num_buckets) * width
+            for slot in range(base, base + width):
+                if keys[slot] == key:
+                    return slot
+        return -1
+
+    def _stash_index(self, key: str) -> int:
+        for i, (k, _) in enumerate(self.stash):
+            if k == key:
+                return i
+        return -1
+
+    def _free_slot(self, key: str, skip: int = -1) -> int:
+        """Свободная ячейка в корзинах ключа (кроме корзины skip) или -1."""
+        keys, num_buckets, width = self.keys, self.num_buckets, \
+            self.BUCKET_SIZE
+        for hash_func in self.hash_funcs:
+            bucket = hash_func(key, num_buckets)
+            if bucket == skip:
+                continue
+            base = bucket * width
+            for slot in range(base, base + width):
+                if keys[slot] is None:
+                    return slot
+        return -1
+
+    def _place(self, key: str, value: Any) -> Optional[Tuple[str, Any]]:
+        """
+        Размещает пару вытеснениями (random walk).
+
+        :return: None при успехе, иначе пара, оставшаяся без места
+        """
+        keys, values = self.keys, self.values
+        skip = -1
+        for _ in range(self.MAX_KICKS):
+            slot = self._free_slot(key, skip)
+            if slot >= 0:
+                keys[slot], values[slot] = key, value
+                return None
+            # Все корзины заняты: вытесняем случайную ячейку одной из них
+            buckets = [h(key, self.num_buckets) for h in self.hash_funcs]
+            choices = [b for b in buckets if b != skip] or buckets
+            skip = self._rng.choice(choices)
+            slot = skip * self.BUCKET_SIZE + \
+                self._rng.randrange(self.BUCKET_SIZE)
+            key, keys[slot] = keys[slot], key
+            value, values[slot] = values[slot], value
+        return key, value
+
+    def _rehash(self, num_buckets: int) -> None:
+        """
+        Перестраивает таблицу с num_buckets корзинами; если какой-то ключ
+        снова не помещается, размер удваивается. Сложность: O(n) амортизир.
+        """
+        items = [(k, v) for k, v in zip(self.keys, self.values)
+                 if k is not None] + self.stash
+        while True:
+            self.rehash_count += 1
+            self._allocate(num_buckets)
+            self.stash = []
+            for key, value in items:
+                leftover = self._place(key, value)
+                if leftover is not None:
+                    if len(self.stash) >= self.STASH_SIZE:
+                        break
+                    self.stash.append(leftover)
+            else:
+                return
+            num_buckets *= 2
+
+    def resize(self, new_size: int) -> None:
+        """
+        Перестраивает таблицу под new_size ячеек.
+
+        :param new_size: новое количество ячеек
+        """
+        self._rehash(max(1, -(-new_size // self.BUCKET_SIZE)))
+
+    def insert(self, key: str, value: Any) -> None:
+        """
+        Вставка элемента в таблицу.
+
+        Амортизированная сложность: O(1)
+        Худший случай: O(n) при перестроении.
+
+        :param key: ключ для вставки
+        :param value: значение
+        """
+        slot = self._find(key)
+        if slot >= 0:
+            self.values[slot] = value
+            return
+        index = self._stash_index(key)
+        if index >= 0:
+            self.stash[index] = (key, value)
+            return
+        if self.count + 1 > self.size * self.MAX_LOAD_FACTOR:
+            self._rehash(2 * self.num_buckets)
+        leftover = self._place(key, value)
+        while leftover is not None:
+            if len(self.stash) < self.STASH_SIZE:
+                self.stash.append(leftover)
+                break
+            self._rehash(2 * self.num_buckets)
+            leftover = self._place(*leftover)
+        self.count += 1
+
+    def search(self, key: str) -> Optional[Any]:
+        """
+        Поиск элемента по ключу.
+
+        Сложность: O(1) в худшем случае - не больше d корзин и stash.
+
+        :param key: ключ для поиска
+        :return: значение или None, если ключ не найден
+        """
+        slot = self._find(key)
+        if slot >= 0:
+            return self.values[slot]
+        for k, v in self.stash:
+            if k == key:
+                return v
+        return None
+
+    def delete(self, key: str) -> bool:
+        """
+        Удаление элемента по ключу. Освободившееся место сразу
+        предлагается элементам из stash.
+
+        Сложность: O(1) в худшем случае.
+
+        :param key: ключ для удаления
+        :return: True, если элемент был удалён, иначе False
+        """
+        slot = self._find(key)
+        if slot >= 0:
+            self.keys[slot] = self.values[slot] = None
+            for i, (k, v) in enumerate(self.stash):
+                free = self._free_slot(k)
+                if free >= 0:
+                    self.keys[free], self.values[free] = k, v
+                    del self.stash[i]
+                    break
+        else:
+            index = self._stash_index(key)
+            if index < 0:
+                return False
+            del self.stash[index]
+        self.count -= 1
+        return True
+
+    def probe_length(self, key: str) -> int:
+        """
+        Количество просмотренных ячеек при поиске (не больше
+        d * BUCKET_SIZE + STASH_SIZE). Для анализа.
+        """
+        keys, num_buckets, width = self.keys, self.num_buckets, \
+            self.BUCKET_SIZE
+        probes = 0
+        for hash_func in self.hash_funcs:
+            base = hash_func(key, num_buckets) * width
+            for slot in range(base, base + width):
+                probes += 1
+                if keys[slot] == key:
+                    return probes
+        for k, _ in self.stash:
+            probes += 1
+            if k == key:
+                break
+        return probes
+
+    def __getitem__(self, key: str) -> Any:
+        slot = self._find(key)
+        if slot >= 0:
+            return self.values[slot]
+        index = self._stash_index(key)
+        if index < 0:
+            raise KeyError(key)
+        return self.stash[index][1]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.insert(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and (
+            self._find(key) >= 0 or self._stash_index(key) >= 0)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.keys:
+            if key is not None:
+                yield key
+        for key, _ in self.stash:
+            yield key
+
+    def __len__(self) -> int:
+        """Количество элементов. Сложность: O(1)."""
+        return self.count
+
+    def __str__(self) -> str:
+        """Вывод таблицы для визуальной проверки."""
+        width = self.BUCKET_SIZE
+        result = []
+        for bucket in range(self.num_buckets):
+            base = bucket * width
+            result.append(f"{bucket}: {self.keys[base:base + width]}")
+        result.append(f"stash: {self.stash}")
+        return "\n".join(result)
+
+
+# Пример тестирования
+if __name__ == "__main__":
+    ht = HashTableCuckoo(size=8)
+    fruits = ["apple", "banana", "orange", "grape", "lemon",
+              "kiwi", "mango", "peach", "plum", "lime"]
+    for fruit in fruits:
+        ht.insert(fruit, len(fruit))
+    print(ht)
+    print("\nПоиск 'mango':", ht.search("mango"))
+    print("Удаление 'apple':", ht.delete("apple"))
+    print("Элементов:", len(ht), "перестроений:", ht.rehash_count)
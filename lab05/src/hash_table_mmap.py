@@ -0,0 +1,404 @@
+"""
+Модуль с персистентной хеш-таблицей на диске (открытая адресация, mmap).
+Индекс - отображённый в память файл фиксированных ячеек
+(хеш ключа, смещение записи, длина записи), данные - файл с дозаписью
+записей "ключ + значение". Открытие таблицы читает только заголовок: O(1),
+без перестроения. Поиск безопасен из нескольких процессов при одном писателе.
+Средняя сложность операций O(1), компактизация - O(n).
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Iterator, MutableMapping
+from typing import BinaryIO, Optional, Tuple
+from hash_functions import polynomial_hash
+
+# Заголовок индекса: сигнатура, версия, резерв, ёмкость, число элементов,
+# число удалённых ячеек, поколение файла данных
+_HEADER = struct.Struct("<8sIIQQQQ")
+# Ячейка индекса: 64-битный хеш ключа, смещение записи, длина записи
+_SLOT = struct.Struct("<QQI")
+# Заголовок записи в файле данных: длина ключа, длина значения
+_RECORD = struct.Struct("<II")
+
+_MAGIC = b"LAB05IDX"
+_VERSION = 1
+# Длина 0 - пустая ячейка, _TOMBSTONE - удалённая
+_TOMBSTONE = 0xFFFFFFFF
+# Модуль хеша: простое число Мерсенна 2^61 - 1
+_HASH_MOD = (1 << 61) - 1
+_MASK64 = (1 << 64) - 1
+
+
+def _key_hash(key: str) -> int:
+    """
+    64-битный хеш, одинаковый во всех процессах (в отличие от hash()).
+    Полиномиальный хеш перемешивается финализатором MurmurHash3 (fmix64):
+    у похожих ключей ("user:1", "user:2") иначе получаются соседние
+    значения и длинные кластеры при линейном пробировании.
+    """
+    h = polynomial_hash(key, _HASH_MOD)
+    h = ((h ^ (h >> 33)) * 0xFF51AFD7ED558CCD) & _MASK64
+    h = ((h ^ (h >> 33)) * 0xC4CEB9FE1A85EC53) & _MASK64
+    return h ^ (h >> 33)
+
+
+class MmapHashTable(MutableMapping):
+    """Хеш-таблица на диске: индекс в mmap + файл данных с дозаписью."""
+
+    # Коэффициент заполнения индекса (с удалёнными ячейками) до расширения
+    MAX_LOAD_FACTOR: float = 0.7
+
+    def __init__(self, path: str, capacity: int = 1024,
+                 readonly: bool = False) -> None:
+        """
+        Открывает существующую таблицу или создаёт новую.
+
+        Сложность открытия: O(1) - читается только заголовок индекса.
+
+        :param path: базовый путь; индекс хранится в path + ".idx",
+        данные - в path + ".<поколение>.dat"
+        :param capacity: ёмкость индекса для новой таблицы
+        :param readonly: открыть только для чтения (процессы-читатели)
+        """
+        self.path = path
+        self.readonly = readonly
+        self._index_path = path + ".idx"
+        if not os.path.exists(self._index_path):
+            if readonly:
+                raise FileNotFoundError(self._index_path)
+            self._create_index(self._index_path, capacity, generation=0)
+            open(self._data_path(0), "wb").close()
+        self._data_file: Optional[BinaryIO] = None
+        self._data: Optional[mmap.mmap] = None
+        self._open()
+
+    def _data_path(self, generation: int) -> str:
+        return f"{self.path}.{generation}.dat"
+
+    @staticmethod
+    def _create_index(index_path: str, capacity: int,
+                      generation: int) -> None:
+        """Создаёт пустой файл индекса."""
+        with open(index_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0, capacity, 0, 0,
+                                 generation))
+            f.truncate(_HEADER.size + capacity * _SLOT.size)
+
+    def _open(self) -> None:
+        """Отображает индекс и файл данных в память."""
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        with open(self._index_path, "rb" if self.readonly else "r+b") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=access)
+        magic, version, _, capacity, _, _, generation = \
+            _HEADER.unpack_from(self._index, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{self._index_path}: неизвестный формат")
+        self._capacity: int = capacity
+        self._generation: int = generation
+        data_path = self._data_path(generation)
+        if not self.readonly:
+            self._data_file = open(data_path, "ab")
+        self._data_end = os.path.getsize(data_path)
+        self._map_data()
+
+    def _map_data(self) -> None:
+        """(Пере)отображает файл данных целиком."""
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        if self._data_file is not None:
+            self._data_file.flush()
+        with open(self._data_path(self._generation), "rb") as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _read_header(self) -> Tuple[int, int]:
+        """(число элементов, число удалённых ячеек)"""
+        _, _, _, _, count, tombstones, _ = _HEADER.unpack_from(self._index, 0)
+        return count, tombstones
+
+    def _write_header(self, count: int, tombstones: int) -> None:
+        _HEADER.pack_into(self._index, 0, _MAGIC, _VERSION, 0,
+                          self._capacity, count, tombstones, self._generation)
+
+    def _record(self, offset: int, length: int) -> Tuple[bytes, bytes]:
+        """Читает запись (ключ, значение) из файла данных."""
+        if self._data is None or offset + length > len(self._data):
+            # Запись дописана после отображения: сбрасываем буфер и
+            # отображаем файл заново
+            self._map_data()
+        data = self._data
+        if data is None or offset + length > len(data):
+            raise ValueError(f"{self._data_path(self._generation)}: ячейка "
+                             f"индекса указывает за конец файла данных")
+        key_len, value_len = _RECORD.unpack_from(data, offset)
+        start = offset + _RECORD.size
+        return (data[start:start + key_len],
+                data[start + key_len:start + key_len + value_len])
+
+    def _find(self, key: str) -> Tuple[int, int, int]:
+        """
+        Линейное пробирование индекса.
+
+        :return: (ячейка с ключом или -1, первая свободная ячейка или -1,
+                  хеш ключа)
+        """
+        key_bytes = key.encode("utf-8")
+        h = _key_hash(key)
+        index, capacity = self._index, self._capacity
+        slot = h % capacity
+        free = -1
+        for _ in range(capacity):
+            slot_hash, offset, length = _SLOT.unpack_from(
+                index, _HEADER.size + slot * _SLOT.size)
+            if length == 0:
+                return -1, slot if free < 0 else free, h
+            if length == _TOMBSTONE:
+                if free < 0:
+                    free = slot
+            elif slot_hash == h and \
+                    self._record(offset, length)[0] == key_bytes:
+                return slot, free, h
+            slot += 1
+            if slot == capacity:
+                slot = 0
+        return -1, free, h
+
+    def _write_slot(self, slot: int, h: int, offset: int,
+                    length: int) -> None:
+        """
+        Записывает ячейку: сначала хеш и смещение, затем длину, которая
+        делает ячейку видимой читателям из других процессов.
+        """
+        pos = _HEADER.size + slot * _SLOT.size
+        struct.pack_into("<QQ", self._index, pos, h, offset)
+        struct.pack_into("<I", self._index, pos + 16, length)
+
+    def _check_writable(self) -> None:
+        if self.readonly:
+            raise PermissionError("Таблица открыта только для чтения")
+
+    def insert(self, key: str, value: bytes) -> None:
+        """
+        Вставка или обновление: запись дописывается в файл данных,
+        ячейка индекса указывает на новую запись.
+
+        Средняя сложность: O(1)
+
+        :param key: ключ
+        :param value: значение (bytes)
+        """
+        self._check_writable()
+        count, tombstones = self._read_header()
+        if count + tombstones + 1 > self._capacity * self.MAX_LOAD_FACTOR:
+            self._rebuild_index(2 * (count + 1))
+            count, tombstones = self._read_header()
+        found, free, h = self._find(key)
+
+        key_bytes = key.encode("utf-8")
+        record = _RECORD.pack(len(key_bytes), len(value)) + key_bytes + value
+        offset = self._data_end
+        assert self._data_file is not None
+        self._data_file.write(record)
+        # Запись должна попасть в файл до публикации ячейки: иначе читатель
+        # из другого процесса увидит смещение за концом файла данных
+        self._data_file.flush()
+        self._data_end += len(record)
+
+        if found >= 0:
+            self._write_slot(found, h, offset, len(record))
+            return
+        if free < 0:
+            raise RuntimeError("Индекс переполнен")
+        pos = _HEADER.size + free * _SLOT.size
+        if _SLOT.unpack_from(self._index, pos)[2] == _TOMBSTONE:
+            tombstones -= 1
+        self._write_slot(free, h, offset, len(record))
+        self._write_header(count + 1, tombstones)
+
+    def search(self, key: str) -> Optional[bytes]:
+        """
+        Поиск значения по ключу.
+
+        Средняя сложность: O(1)
+
+        :param key: ключ
+        :return: значение или None, если ключ не найден
+        """
+        found = self._find(key)[0]
+        if found < 0:
+            return None
+        _, offset, length = _SLOT.unpack_from(
+            self._index, _HEADER.size + found * _SLOT.size)
+        return self._record(offset, length)[1]
+
+    def delete(self, key: str) -> bool:
+        """
+        Удаление: ячейка помечается удалённой, запись остаётся в файле
+        данных до компактизации.
+
+        Средняя сложность: O(1)
+
+        :param key: ключ
+        :return: True, если элемент был удалён, иначе False
+        """
+        self._check_writable()
+        found = self._find(key)[0]
+        if found < 0:
+            return False
+        self._write_slot(found, 0, 0, _TOMBSTONE)
+        count, tombstones = self._read_header()
+        self._write_header(count - 1, tombstones + 1)
+        return True
+
+    def _live_slots(self) -> Iterator[Tuple[int, int, int]]:
+        """Живые ячейки индекса: (хеш, смещение, длина)."""
+        index = self._index
+        for slot in range(self._capacity):
+            entry = _SLOT.unpack_from(index, _HEADER.size + slot * _SLOT.size)
+            if entry[2] != 0 and entry[2] != _TOMBSTONE:
+                yield entry
+
+    def _write_index(self, index_path: str, capacity: int, generation: int,
+                     slots: Iterator[Tuple[int, int, int]]) -> None:
+        """Создаёт файл индекса и заполняет его готовыми ячейками."""
+        self._create_index(index_path, capacity, generation)
+        with open(index_path, "r+b") as f:
+            new_index = mmap.mmap(f.fileno(), 0)
+            count = 0
+            for h, offset, length in slots:
+                slot = h % capacity
+                while _SLOT.unpack_from(
+                        new_index, _HEADER.size + slot * _SLOT.size)[2]:
+                    slot = (slot + 1) % capacity
+                _SLOT.pack_into(new_index, _HEADER.size + slot * _SLOT.size,
+                                h, offset, length)
+                count += 1
+            _HEADER.pack_into(new_index, 0, _MAGIC, _VERSION, 0, capacity,
+                              count, 0, generation)
+            new_index.flush()
+            new_index.close()
+
+    def _replace_index(self, tmp_path: str) -> None:
+        """Атомарно подменяет индекс и переоткрывает таблицу."""
+        self._close_maps()
+        os.replace(tmp_path, self._index_path)
+        self._open()
+
+    def _capacity_for(self, count: int) -> int:
+        """Ёмкость индекса, при которой count элементов не превышают α."""
+        return max(16, int(count / self.MAX_LOAD_FACTOR) + 1)
+
+    def _rebuild_index(self, count: int) -> None:
+        """
+        Перестраивает индекс под count элементов, удалённые ячейки исчезают.
+        Ключи не перечитываются: хеши хранятся в ячейках.
+        Сложность: O(capacity).
+        """
+        tmp_path = self._index_path + ".tmp"
+        self._write_index(tmp_path, self._capacity_for(count),
+                          self._generation, self._live_slots())
+        self._replace_index(tmp_path)
+
+    def compact(self) -> None:
+        """
+        Компактизация: живые записи переписываются в новый файл данных
+        следующего поколения, индекс строится заново и подменяется атомарно.
+        Читатели со старым индексом продолжают работать со старыми файлами
+        до refresh(). Сложность: O(n + capacity).
+        """
+        self._check_writable()
+        generation = self._generation + 1
+        relocated = []
+        with open(self._data_path(generation), "wb") as out:
+            position = 0
+            for h, offset, length in self._live_slots():
+                key, value = self._record(offset, length)
+                out.write(_RECORD.pack(len(key), len(value)) + key + value)
+                relocated.append((h, position, length))
+                position += length
+        old_data_path = self._data_path(self._generation)
+        tmp_path = self._index_path + ".tmp"
+        self._write_index(tmp_path, self._capacity_for(2 * len(relocated)),
+                          generation, iter(relocated))
+        self._replace_index(tmp_path)
+        os.remove(old_data_path)
+
+    def refresh(self) -> None:
+        """Переоткрывает таблицу (читателю - увидеть расширение индекса)."""
+        self._close_maps()
+        self._open()
+
+    def flush(self) -> None:
+        """Сбрасывает индекс и данные на диск."""
+        if self._data_file is not None:
+            self._data_file.flush()
+            os.fsync(self._data_file.fileno())
+        if not self.readonly:
+            self._index.flush()
+
+    def _close_maps(self) -> None:
+        if self._data_file is not None:
+            self._data_file.close()
+            self._data_file = None
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        self._index.close()
+
+    def close(self) -> None:
+        """Сбрасывает изменения и закрывает файлы."""
+        if self._index.closed:
+            return
+        self.flush()
+        self._close_maps()
+
+    def __enter__(self) -> "MmapHashTable":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __getitem__(self, key: str) -> bytes:
+        value = self.search(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: bytes) -> None:
+        self.insert(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key)[0] >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for _, offset, length in list(self._live_slots()):
+            yield self._record(offset, length)[0].decode("utf-8")
+
+    def __len__(self) -> int:
+        """Количество элементов из заголовка. Сложность: O(1)."""
+        return self._read_header()[0]
+
+
+# Пример использования
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base = os.path.join(tmp_dir, "fruits")
+        with MmapHashTable(base, capacity=8) as table:
+            for fruit in ["apple", "banana", "orange", "grape", "lemon"]:
+                table.insert(fruit, fruit.upper().encode())
+            table.delete("orange")
+
+        # Повторное открытие без перестроения
+        with MmapHashTable(base, readonly=True) as table:
+            print("Элементов:", len(table))
+            print("Поиск 'banana':", table.search("banana"))
+            print("Поиск 'orange':", table.search("orange"))
@@ -1,37 +1,129 @@
 """
 Модуль с реализацией хеш-таблицы с открытой адресацией.
 Поддерживает линейное пробирование и
-двойное хеширование для разрешения коллизий.
+двойное хеширование для разрешения коллизий,
+протокол MutableMapping и пакетные операции update / get_many / delete_many.
 Все операции имеют среднюю сложность O(1), худшую O(n).
 """
 
-from typing import Any, Optional
+from collections.abc import Iterable, Iterator, MutableMapping
+from typing import Any, Callable, List, Optional, Tuple
 from hash_functions import simple_hash, djb2_hash
 
+# Маркер удалённой ячейки: не прерывает последовательность проб при поиске
+_DELETED = object()
 
-class HashTableOpenAddressing:
+
+def _next_prime(n: int) -> int:
+    """Наименьшее простое число, не меньшее n (перебор делителей)."""
+    candidate = max(n, 2)
+    while True:
+        divisor = 2
+        while divisor * divisor <= candidate:
+            if candidate % divisor == 0:
+                break
+            divisor += 1
+        else:
+            return candidate
+        candidate += 1
+
+
+class HashTableOverflowError(Exception):
+    """Для ключа не нашлось свободной ячейки в последовательности проб."""
+
+    def __init__(self) -> None:
+        super().__init__("Хеш-таблица переполнена")
+
+
+class HashTableOpenAddressing(MutableMapping):
     """Хеш-таблица с открытой адресацией."""
 
-    def __init__(self, size: int = 10) -> None:
+    # Коэффициент заполнения, до которого update() заранее расширяет таблицу
+    MAX_BULK_LOAD_FACTOR: float = 0.75
+
+    def __init__(self, size: int = 10, method: str = "linear",
+                 hash_func: Callable[[str, int], int] = simple_hash) -> None:
         """
         Инициализация таблицы.
 
         :param size: размер хеш-таблицы
+        :param method: метод пробирования по умолчанию ("linear" / "double"),
+        используется операциями протокола MutableMapping и пакетными методами
+        :param hash_func: основная хеш-функция (начало последовательности
+        проб), по умолчанию simple_hash; шаг двойного хеширования - djb2
         """
         self.size: int = size
-        self.table: list[Optional[tuple[str, Any]]] = [None] * size
+        self.hash_func = hash_func
+        # Ячейка: None (пусто), _DELETED или кортеж (ключ, значение)
+        self.table: list[Any] = [None] * size
+        self.method: str = method
+        self.count: int = 0
 
     def _probe_linear(self, key: str, i: int) -> int:
         """Линейное пробирование: (h + i) % size"""
-        return (simple_hash(key, self.size) + i) % self.size
+        return (self.hash_func(key, self.size) + i) % self.size
 
     def _probe_double(self, key: str, i: int) -> int:
         """Двойное хеширование: (h1 + i*h2) % size"""
-        h1 = simple_hash(key, self.size)
+        h1 = self.hash_func(key, self.size)
         h2 = 1 + djb2_hash(key, self.size - 1)
         return (h1 + i * h2) % self.size
 
-    def insert(self, key: str, value: Any, method: str = "linear") -> None:
+    def _probe_start(self, key: str, method: str) -> Tuple[int, int]:
+        """
+        Начало и шаг последовательности проб: i-я проба = (h + i*step) % size.
+        Хеши ключа вычисляются один раз, а не на каждой пробе.
+        """
+        h1 = self.hash_func(key, self.size)
+        if method == "linear":
+            return h1, 1
+        return h1, 1 + djb2_hash(key, self.size - 1)
+
+    def _locate(self, key: str, method: str) -> Tuple[int, int]:
+        """Проходит последовательность проб ключа, см. _scan."""
+        h, step = self._probe_start(key, method)
+        return self._scan(key, h, step)
+
+    def _scan(self, key: str, h: int, step: int) -> Tuple[int, int]:
+        """
+        Проходит последовательность проб с заданными началом и шагом.
+
+        :return: (индекс ячейки с ключом или -1,
+                  индекс первой ячейки, пригодной для вставки, или -1)
+        """
+        table, size = self.table, self.size
+        free = -1
+        for i in range(size):
+            index = (h + i * step) % size
+            entry = table[index]
+            if entry is None:
+                return -1, index if free < 0 else free
+            if entry is _DELETED:
+                if free < 0:
+                    free = index
+            elif entry[0] == key:
+                return index, free
+        return -1, free
+
+    def probe_length(self, key: str, method: Optional[str] = None) -> int:
+        """
+        Количество ячеек, просматриваемых при поиске ключа
+        (для отсутствующего ключа - до пустой ячейки). Для анализа.
+
+        :param key: ключ
+        :param method: метод пробирования
+        :return: длина последовательности проб
+        """
+        table, size = self.table, self.size
+        h, step = self._probe_start(key, method or self.method)
+        for i in range(size):
+            entry = table[(h + i * step) % size]
+            if entry is None or (entry is not _DELETED and entry[0] == key):
+                return i + 1
+        return size
+
+    def insert(self, key: str, value: Any,
+               method: Optional[str] = None) -> None:
         """
         Вставка элемента в таблицу.
 
@@ -41,18 +133,19 @@ class HashTableOpenAddressing:
         :param key: ключ для вставки
         :param value: значение
         :param method: "linear" для
-        линейного пробирования, "double" для двойного хеширования
+        линейного пробирования, "double" для двойного хеширования;
+        по умолчанию self.method
         """
-        for i in range(self.size):
-            index = (self._probe_linear(key, i) if method == "linear"
-                     else self._probe_double(key, i))
-            entry = self.table[index]
-            if entry is None or entry[0] == key:
-                self.table[index] = (key, value)
-                return
-        raise Exception("Хеш-таблица переполнена")
+        found, free = self._locate(key, method or self.method)
+        if found >= 0:
+            self.table[found] = (key, value)
+            return
+        if free < 0:
+            raise HashTableOverflowError()
+        self.table[free] = (key, value)
+        self.count += 1
 
-    def search(self, key: str, method: str = "linear") -> Optional[Any]:
+    def search(self, key: str, method: Optional[str] = None) -> Optional[Any]:
         """
         Поиск элемента по ключу.
 
@@ -63,19 +156,14 @@ class HashTableOpenAddressing:
         :param method: метод пробирования
         :return: значение или None, если ключ не найден
         """
-        for i in range(self.size):
-            index = (self._probe_linear(key, i) if method == "linear"
-                     else self._probe_double(key, i))
-            entry = self.table[index]
-            if entry is None:
-                return None
-            if entry[0] == key:
-                return entry[1]
-        return None
+        found, _ = self._locate(key, method or self.method)
+        return self.table[found][1] if found >= 0 else None
 
-    def delete(self, key: str, method: str = "linear") -> bool:
+    def delete(self, key: str, method: Optional[str] = None) -> bool:
         """
         Удаление элемента по ключу.
+        Ячейка помечается как удалённая, чтобы не разрывать цепочку проб
+        для ключей, вставленных после удаляемого.
 
         Средняя сложность: O(1)
         Худший случай: O(n)
@@ -84,22 +172,149 @@ class HashTableOpenAddressing:
         :param method: метод пробирования
         :return: True, если элемент был удалён, иначе False
         """
-        for i in range(self.size):
-            index = (self._probe_linear(key, i) if method == "linear"
-                     else self._probe_double(key, i))
-            entry = self.table[index]
-            if entry is None:
-                return False
-            if entry[0] == key:
-                self.table[index] = None
-                return True
-        return False
+        found, _ = self._locate(key, method or self.method)
+        if found < 0:
+            return False
+        self.table[found] = _DELETED
+        self.count -= 1
+        return True
+
+    def _entries(self) -> Iterator[Tuple[str, Any]]:
+        """Живые пары (ключ, значение) в порядке ячеек."""
+        for entry in self.table:
+            if entry is not None and entry is not _DELETED:
+                yield entry
+
+    def resize(self, new_size: int) -> None:
+        """
+        Перестраивает таблицу с новым размером методом self.method.
+        Удалённые ячейки при этом исчезают.
+
+        Сложность: O(n + new_size)
+
+        :param new_size: новый размер хеш-таблицы
+        """
+        if new_size < self.count:
+            raise ValueError("Новый размер меньше числа элементов")
+        entries = list(self._entries())
+        self.size = new_size
+        self.table = [None] * new_size
+        self.count = 0
+        for key, value in entries:
+            self.insert(key, value)
+
+    def _reserve(self, extra: int) -> None:
+        """
+        Расширяет таблицу один раз так, чтобы вместить ещё extra ключей.
+        Новый размер - простое число: тогда любой шаг двойного хеширования
+        1..size-1 взаимно прост с размером и пробы обходят всю таблицу.
+        По той же причине при двойном хешировании составной размер
+        заменяется ближайшим простым, даже если места хватает.
+        """
+        needed = self.count + extra
+        if needed > self.size * self.MAX_BULK_LOAD_FACTOR:
+            self.resize(_next_prime(int(needed / self.MAX_BULK_LOAD_FACTOR)
+                                    + 1))
+        elif self.method == "double" and _next_prime(self.size) != self.size:
+            self.resize(_next_prime(self.size))
+
+    def update(self, other: Any = (), /, **kwargs: Any) -> None:
+        """
+        Пакетная вставка пар ключ-значение методом self.method.
+
+        Таблица расширяется не более одного раза, начала последовательностей
+        проб всех ключей вычисляются одним проходом до вставки.
+        Сложность: O(m) в среднем, где m - число вставляемых пар.
+
+        :param other: отображение или итерируемое пар (ключ, значение)
+        """
+        items = dict(other, **kwargs)
+        self._reserve(len(items))
+        method, table = self.method, self.table
+        starts = [self._probe_start(key, method) for key in items]
+        added = 0
+        for (key, value), (h, step) in zip(items.items(), starts):
+            found, free = self._scan(key, h, step)
+            if found >= 0:
+                table[found] = (key, value)
+            elif free >= 0:
+                table[free] = (key, value)
+                added += 1
+            else:
+                self.count += added
+                raise HashTableOverflowError()
+        self.count += added
+
+    def get_many(self, keys: Iterable[str],
+                 default: Any = None) -> List[Any]:
+        """
+        Пакетный поиск методом self.method.
+
+        Сложность: O(m) в среднем, где m - число ключей.
+
+        :param keys: ключи для поиска
+        :param default: значение для отсутствующих ключей
+        :return: список значений в порядке ключей
+        """
+        table = self.table
+        located = [self._locate(key, self.method)[0] for key in keys]
+        return [table[i][1] if i >= 0 else default for i in located]
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Пакетное удаление методом self.method.
+
+        Сложность: O(m) в среднем, где m - число ключей.
+
+        :param keys: ключи для удаления
+        :return: количество действительно удалённых элементов
+        """
+        table = self.table
+        removed = 0
+        for key in keys:
+            found, _ = self._locate(key, self.method)
+            if found >= 0:
+                table[found] = _DELETED
+                removed += 1
+        self.count -= removed
+        return removed
+
+    def clear(self) -> None:
+        """Удаляет все элементы, сохраняя размер таблицы. Сложность: O(size)"""
+        self.table = [None] * self.size
+        self.count = 0
+
+    def __getitem__(self, key: str) -> Any:
+        """Значение по ключу; KeyError, если ключа нет (в отличие от search)"""
+        found, _ = self._locate(key, self.method)
+        if found < 0:
+            raise KeyError(key)
+        return self.table[found][1]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.insert(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._locate(key, self.method)[0] >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for key, _ in self._entries():
+            yield key
+
+    def __len__(self) -> int:
+        """Количество элементов. Сложность: O(1)."""
+        return self.count
 
     def __str__(self) -> str:
         """Вывод таблицы для визуальной проверки."""
         result = []
         for i, entry in enumerate(self.table):
-            result.append(f"{i}: {entry}")
+            shown = "DELETED" if entry is _DELETED else entry
+            result.append(f"{i}: {shown}")
         return "\n".join(result)
 
 
@@ -0,0 +1,280 @@
+"""
+Модуль с вероятностными фильтрами принадлежности и обёрткой,
+которая ставит фильтр перед любой хеш-таблицей из lab05.
+1. Фильтр Блума: битовый массив bytearray, k индексов двойным хешированием.
+   Ложных отрицаний нет, ложные срабатывания - с заданной вероятностью.
+2. Фильтр с кукушкиным хешированием (cuckoo filter): отпечатки ключей
+   в корзинах по 4, поддерживает удаление.
+Фильтр отвечает "точно нет" без обхода цепочки или последовательности проб.
+"""
+
+import math
+import random
+from array import array
+from collections.abc import Iterator
+from typing import Any, Optional, Union
+from hash_functions import djb2_hash, polynomial_hash, double_hash_indices
+from hash_table_chaining import HashTableChaining
+from hash_table_open_addressing import HashTableOpenAddressing
+
+
+class BloomFilter:
+    """Фильтр Блума на bytearray."""
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01) -> None:
+        """
+        Размер битового массива и число хешей выбираются оптимально:
+        m = -n ln p / (ln 2)^2, k = m / n * ln 2.
+
+        :param capacity: ожидаемое количество ключей n
+        :param fp_rate: допустимая вероятность ложного срабатывания p
+        """
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate должен быть в интервале (0, 1)")
+        capacity = max(1, capacity)
+        self.num_bits: int = max(8, math.ceil(
+            -capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.num_hashes: int = max(1, round(
+            self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count: int = 0
+
+    def add(self, key: str) -> bool:
+        """
+        Добавляет ключ. Сложность: O(k).
+
+        :return: всегда True (фильтр Блума не переполняется, растёт только
+        вероятность ложных срабатываний)
+        """
+        bits = self.bits
+        for index in double_hash_indices(key, self.num_hashes,
+                                         self.num_bits):
+            bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        """Возможно ли, что ключ добавлен. Сложность: O(k)."""
+        bits = self.bits
+        for index in double_hash_indices(key, self.num_hashes,
+                                         self.num_bits):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def estimated_fp_rate(self) -> float:
+        """Оценка вероятности ложного срабатывания при текущем заполнении."""
+        return (1 - math.exp(-self.num_hashes * self.count /
+                             self.num_bits)) ** self.num_hashes
+
+
+class CuckooFilter:
+    """Фильтр с кукушкиным хешированием: отпечатки в корзинах по 4."""
+
+    BUCKET_SIZE: int = 4
+    # Максимальное число вытеснений при вставке
+    MAX_KICKS: int = 500
+
+    def __init__(self, capacity: int, fingerprint_bits: int = 16,
+                 seed: int = 0) -> None:
+        """
+        Вероятность ложного срабатывания примерно 2 * 4 / 2^fingerprint_bits.
+
+        :param capacity: ожидаемое количество ключей
+        :param fingerprint_bits: длина отпечатка, 4..16 бит
+        :param seed: seed генератора случайных вытеснений
+        """
+        if not 4 <= fingerprint_bits <= 16:
+            raise ValueError("fingerprint_bits должен быть от 4 до 16")
+        # Число корзин - степень двойки, чтобы i2 = i1 XOR h(fp) было
+        # обратимым; целевое заполнение до 95%
+        needed = max(1, math.ceil(capacity / (self.BUCKET_SIZE * 0.95)))
+        self.num_buckets: int = 1 << (needed - 1).bit_length()
+        self.fingerprint_mod: int = (1 << fingerprint_bits) - 1
+        # Отпечаток 0 означает пустую ячейку
+        self.slots = array("H", bytes(2 * self.num_buckets *
+                                      self.BUCKET_SIZE))
+        self.count: int = 0
+        # Отпечаток, вытесненный при неудачной вставке: без него фильтр
+        # дал бы ложное отрицание
+        self.victim: Optional[tuple[int, int]] = None
+        self._rng = random.Random(seed)
+
+    def _fingerprint_and_index(self, key: str) -> tuple[int, int]:
+        fingerprint = 1 + polynomial_hash(key, self.fingerprint_mod)
+        return fingerprint, djb2_hash(key, self.num_buckets)
+
+    def _alt_index(self, index: int, fingerprint: int) -> int:
+        """Вторая корзина: i XOR h(отпечаток), симметрично для обеих."""
+        mixed = (fingerprint * 0x5BD1E995) & 0xFFFFFFFF
+        return index ^ ((mixed ^ (mixed >> 15)) & (self.num_buckets - 1))
+
+    def _bucket_put(self, index: int, fingerprint: int) -> bool:
+        slots, base = self.slots, index * self.BUCKET_SIZE
+        for slot in range(base, base + self.BUCKET_SIZE):
+            if slots[slot] == 0:
+                slots[slot] = fingerprint
+                return True
+        return False
+
+    def _bucket_has(self, index: int, fingerprint: int) -> bool:
+        base = index * self.BUCKET_SIZE
+        return fingerprint in self.slots[base:base + self.BUCKET_SIZE]
+
+    def add(self, key: str) -> bool:
+        """
+        Добавляет ключ. Амортизированная сложность: O(1).
+
+        :return: False, если фильтр заполнен (ключ при этом всё равно
+        учтён через victim, ложных отрицаний нет, но дальнейшие вставки
+        невозможны)
+        """
+        if self.victim is not None:
+            return False
+        fingerprint, i1 = self._fingerprint_and_index(key)
+        i2 = self._alt_index(i1, fingerprint)
+        if self._bucket_put(i1, fingerprint) or \
+                self._bucket_put(i2, fingerprint):
+            self.count += 1
+            return True
+
+        index = self._rng.choice((i1, i2))
+        for _ in range(self.MAX_KICKS):
+            slot = index * self.BUCKET_SIZE + \
+                self._rng.randrange(self.BUCKET_SIZE)
+            fingerprint, self.slots[slot] = self.slots[slot], fingerprint
+            index = self._alt_index(index, fingerprint)
+            if self._bucket_put(index, fingerprint):
+                self.count += 1
+                return True
+        self.victim = (index, fingerprint)
+        self.count += 1
+        return False
+
+    def __contains__(self, key: str) -> bool:
+        """Возможно ли, что ключ добавлен. Сложность: O(1)."""
+        fingerprint, i1 = self._fingerprint_and_index(key)
+        if self._bucket_has(i1, fingerprint):
+            return True
+        i2 = self._alt_index(i1, fingerprint)
+        if self._bucket_has(i2, fingerprint):
+            return True
+        victim = self.victim
+        return victim is not None and victim[1] == fingerprint and \
+            victim[0] in (i1, i2)
+
+    def remove(self, key: str) -> bool:
+        """
+        Удаляет один отпечаток ключа. Удалять можно только добавленные
+        ключи, иначе можно стереть отпечаток другого ключа.
+        Сложность: O(1).
+        """
+        fingerprint, i1 = self._fingerprint_and_index(key)
+        victim = self.victim
+        for index in (i1, self._alt_index(i1, fingerprint)):
+            base = index * self.BUCKET_SIZE
+            for slot in range(base, base + self.BUCKET_SIZE):
+                if self.slots[slot] == fingerprint:
+                    self.slots[slot] = 0
+                    self.count -= 1
+                    # Освободилось место - возвращаем вытесненный отпечаток
+                    if victim is not None:
+                        self.victim = None
+                        self.count -= 1
+                        self._reinsert(*victim)
+                    return True
+        if victim is not None and victim[1] == fingerprint and \
+                victim[0] in (i1, self._alt_index(i1, fingerprint)):
+            self.victim = None
+            self.count -= 1
+            return True
+        return False
+
+    def _reinsert(self, index: int, fingerprint: int) -> None:
+        if self._bucket_put(index, fingerprint) or self._bucket_put(
+                self._alt_index(index, fingerprint), fingerprint):
+            self.count += 1
+        else:
+            self.victim = (index, fingerprint)
+            self.count += 1
+
+
+TableType = Union[HashTableChaining, HashTableOpenAddressing]
+FilterType = Union[BloomFilter, CuckooFilter]
+
+
+class FilteredHashTable:
+    """
+    Фильтр перед хеш-таблицей: search по ключу, которого точно нет,
+    возвращает None без обращения к таблице.
+    """
+
+    def __init__(self, table: TableType,
+                 membership_filter: FilterType) -> None:
+        """
+        :param table: любая таблица lab05 (её ключи добавляются в фильтр)
+        :param membership_filter: BloomFilter или CuckooFilter
+        """
+        self.table = table
+        self.filter = membership_filter
+        # Фильтр переполнен - дальше все запросы идут в таблицу
+        self.bypass: bool = False
+        # Сколько промахов отсечено фильтром
+        self.filtered_misses: int = 0
+        for key in table:
+            self._filter_add(key)
+
+    def _filter_add(self, key: str) -> None:
+        if not self.bypass and not self.filter.add(key):
+            self.bypass = True
+
+    def insert(self, key: str, value: Any) -> None:
+        """Вставка в фильтр и таблицу."""
+        if key not in self.table:
+            self._filter_add(key)
+        self.table.insert(key, value)
+
+    def search(self, key: str) -> Optional[Any]:
+        """Поиск: сначала фильтр, затем таблица."""
+        if not self.bypass and key not in self.filter:
+            self.filtered_misses += 1
+            return None
+        return self.table.search(key)
+
+    def delete(self, key: str) -> bool:
+        """
+        Удаление из таблицы; из фильтра - если он это поддерживает
+        (у фильтра Блума ключ остаётся ложным срабатыванием).
+        """
+        removed = self.table.delete(key)
+        if removed and isinstance(self.filter, CuckooFilter):
+            self.filter.remove(key)
+        return removed
+
+    def __contains__(self, key: str) -> bool:
+        if not self.bypass and key not in self.filter:
+            return False
+        return key in self.table
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+# Пример использования
+if __name__ == "__main__":
+    ht = HashTableChaining(size=101)
+    for i in range(1000):
+        ht.insert(f"user{i}", i)
+
+    for flt in (BloomFilter(capacity=1000, fp_rate=0.01),
+                CuckooFilter(capacity=1000)):
+        filtered = FilteredHashTable(ht, flt)
+        misses = [f"ghost{i}" for i in range(10000)]
+        for key in misses:
+            filtered.search(key)
+        print(f"{type(flt).__name__}: отсечено "
+              f"{filtered.filtered_misses} из {len(misses)} промахов, "
+              f"user7 -> {filtered.search('user7')}")
@@ -0,0 +1,237 @@
+"""
+Модуль со статической минимальной совершенной хеш-таблицей (схема CHD:
+"compress, hash and displace").
+Строится один раз по фиксированному набору ключей: n ключей занимают ровно
+n ячеек без коллизий, пустых корзин и цепочек нет. Поиск - одно вычисление
+хеша ключа, одно чтение смещения и одно сравнение ключа.
+Построение: O(n) в среднем, поиск: O(1) в худшем случае.
+"""
+
+import struct
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from hash_functions import polynomial_hash
+
+_HASH_MOD = (1 << 61) - 1
+_MASK64 = (1 << 64) - 1
+# Основания полиномиального хеша: при неудаче построения берётся следующее
+_SEEDS = [31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+
+# Заголовок файла: сигнатура, версия, основание хеша, n, число корзин
+_HEADER = struct.Struct("<8sIIQQ")
+_MAGIC = b"LAB05MPH"
+_VERSION = 1
+
+
+def _fmix64(h: int) -> int:
+    """Финализатор MurmurHash3: перемешивает все биты 64-битного числа."""
+    h = ((h ^ (h >> 33)) * 0xFF51AFD7ED558CCD) & _MASK64
+    h = ((h ^ (h >> 33)) * 0xC4CEB9FE1A85EC53) & _MASK64
+    return h ^ (h >> 33)
+
+
+def _key_hashes(key: str, seed: int) -> Tuple[int, int]:
+    """
+    Единственное вычисление хеша ключа; второе 64-битное значение
+    получается из первого умножением на золотое сечение (2^64 / φ).
+    """
+    h = _fmix64(polynomial_hash(key, _HASH_MOD, seed))
+    return h, (h * 0x9E3779B97F4A7C15) & _MASK64
+
+
+class MinimalPerfectHashTable:
+    """Статическая хеш-таблица на минимальной совершенной хеш-функции."""
+
+    # Среднее число ключей в корзине (λ в статье CHD)
+    KEYS_PER_BUCKET: int = 5
+    # Предел суммарного перебора смещений за одну попытку построения
+    MAX_DISPLACEMENT_TRIES: int = 1 << 24
+
+    def __init__(self, seed: int, displacements: array,
+                 keys: List[str], values: List[Any]) -> None:
+        """Используйте build() или load()."""
+        self.seed = seed
+        self.displacements = displacements
+        self.keys = keys
+        self.values = values
+        self.n: int = len(keys)
+        self.num_buckets: int = len(displacements)
+
+    @classmethod
+    def build(cls, keys: Sequence[str],
+              values: Optional[Sequence[Any]] = None
+              ) -> "MinimalPerfectHashTable":
+        """
+        Строит таблицу по набору уникальных ключей.
+
+        Корзины обрабатываются от больших к меньшим; для каждой ищется
+        смещение (d0, d1), при котором позиции (f1 + d0*f2 + d1) % n всех её
+        ключей свободны. d1 выбирается так, чтобы первый ключ корзины сразу
+        попал в свободную позицию, поэтому корзина из одного ключа
+        размещается с первой попытки.
+        Средняя сложность: O(n)
+
+        :param keys: уникальные ключи
+        :param values: значения в порядке ключей (по умолчанию - номера)
+        :return: построенная таблица
+        """
+        if len(set(keys)) != len(keys):
+            raise ValueError("Ключи должны быть уникальными")
+        if values is None:
+            values = range(len(keys))
+        if len(values) != len(keys):
+            raise ValueError("Количество значений не совпадает с ключами")
+        for seed in _SEEDS:
+            placement = cls._place(keys, seed)
+            if placement is not None:
+                displacements, positions = placement
+                n = len(keys)
+                slot_keys: List[str] = [""] * n
+                slot_values: List[Any] = [None] * n
+                for key, value, pos in zip(keys, values, positions):
+                    slot_keys[pos] = key
+                    slot_values[pos] = value
+                return cls(seed, displacements, slot_keys, slot_values)
+        raise RuntimeError("Не удалось построить совершенную хеш-функцию")
+
+    @classmethod
+    def _place(cls, keys: Sequence[str],
+               seed: int) -> Optional[Tuple[array, List[int]]]:
+        """
+        Одна попытка построения с заданным основанием хеша.
+
+        :return: (массив смещений, позиции ключей) или None при неудаче
+        """
+        n = len(keys)
+        num_buckets = max(1, -(-n // cls.KEYS_PER_BUCKET))
+        buckets: Dict[int, List[int]] = {}
+        f1s, f2s = [0] * n, [0] * n
+        for i, key in enumerate(keys):
+            h1, h2 = _key_hashes(key, seed)
+            buckets.setdefault(h1 % num_buckets, []).append(i)
+            f1s[i], f2s[i] = (h1 >> 32) % n, (h2 >> 32) % n
+
+        displacements = array("Q", bytes(8 * num_buckets))
+        positions = [0] * n
+        taken = bytearray(n)
+        # Свободные позиции и индекс каждой из них в списке (удаление за O(1))
+        free = list(range(n))
+        where = list(range(n))
+        order = sorted(buckets.items(), key=lambda b: len(b[1]),
+                       reverse=True)
+        tries = 0
+        for bucket, members in order:
+            first, rest = members[0], members[1:]
+            placed = None
+            # Первый ключ корзины сразу ставится в свободную позицию p
+            # подбором d1, проверяются только остальные ключи
+            for d0 in range(n):
+                base = (f1s[first] + d0 * f2s[first]) % n
+                for p in reversed(free):
+                    d1 = (p - base) % n
+                    slots = [p]
+                    for i in rest:
+                        q = (f1s[i] + d0 * f2s[i] + d1) % n
+                        if taken[q] or q in slots:
+                            break
+                        slots.append(q)
+                    else:
+                        placed = d0 * n + d1, slots
+                        break
+                    tries += 1
+                    if tries > cls.MAX_DISPLACEMENT_TRIES:
+                        return None
+                if placed is not None:
+                    break
+            if placed is None:
+                return None
+            displacements[bucket], slots = placed
+            for i, p in zip(members, slots):
+                taken[p] = 1
+                positions[i] = p
+                last = free.pop()
+                if last != p:
+                    free[where[p]] = last
+                    where[last] = where[p]
+        return displacements, positions
+
+    def index_of(self, key: str) -> int:
+        """
+        Позиция ключа в массиве значений или -1.
+        Сложность: O(1) - один хеш ключа и одно сравнение.
+        """
+        n = self.n
+        if n == 0:
+            return -1
+        h1, h2 = _key_hashes(key, self.seed)
+        d0, d1 = divmod(self.displacements[h1 % self.num_buckets], n)
+        pos = ((h1 >> 32) % n + d0 * ((h2 >> 32) % n) + d1) % n
+        return pos if self.keys[pos] == key else -1
+
+    def search(self, key: str) -> Optional[Any]:
+        """
+        Поиск значения по ключу.
+        Сложность: O(1) в худшем случае.
+
+        :return: значение или None, если ключа нет в наборе
+        """
+        pos = self.index_of(key)
+        return self.values[pos] if pos >= 0 else None
+
+    def __contains__(self, key: str) -> bool:
+        return self.index_of(key) >= 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет таблицу в бинарный файл: заголовок, массив смещений,
+        ключи и значения (строки) как смещения + UTF-8 блоки.
+        """
+        if not all(isinstance(v, str) for v in self.values):
+            raise TypeError("Сохранять можно только строковые значения")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, self.seed, self.n,
+                                 self.num_buckets))
+            f.write(self.displacements.tobytes())
+            for strings in (self.keys, self.values):
+                blobs = [s.encode("utf-8") for s in strings]
+                offsets = array("Q", [0])
+                for blob in blobs:
+                    offsets.append(offsets[-1] + len(blob))
+                f.write(offsets.tobytes())
+                f.write(b"".join(blobs))
+
+    @classmethod
+    def load(cls, path: str) -> "MinimalPerfectHashTable":
+        """Загружает таблицу без перестроения. Сложность: O(n)."""
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed, n, num_buckets = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path}: неизвестный формат")
+        pos = _HEADER.size
+        displacements = array("Q")
+        displacements.frombytes(data[pos:pos + 8 * num_buckets])
+        pos += 8 * num_buckets
+        columns = []
+        for _ in range(2):
+            offsets = array("Q")
+            offsets.frombytes(data[pos:pos + 8 * (n + 1)])
+            pos += 8 * (n + 1)
+            blob = data[pos:pos + offsets[-1]]
+            pos += offsets[-1]
+            columns.append([blob[offsets[i]:offsets[i + 1]].decode("utf-8")
+                            for i in range(n)])
+        return cls(seed, displacements, columns[0], columns[1])
+
+
+# Пример использования
+if __name__ == "__main__":
+    fruits = ["apple", "banana", "orange", "grape", "lemon", "kiwi"]
+    mph = MinimalPerfectHashTable.build(fruits, [f.upper() for f in fruits])
+    for fruit in fruits:
+        print(f"{fruit}: позиция {mph.index_of(fruit)}, "
+              f"значение {mph.search(fruit)}")
+    print("Поиск 'pear':", mph.search("pear"))
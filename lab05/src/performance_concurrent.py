@@ -0,0 +1,117 @@
+"""
+Модуль для бенчмаркинга многопоточного доступа к хеш-таблицам.
+Измеряет пропускную способность (операций в секунду) в зависимости
+от числа потоков для нагрузок с преобладанием чтения и записи.
+Сравнивает таблицу с разбиением блокировок с таблицей под одной
+глобальной блокировкой.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple, Union
+from hash_table_chaining import HashTableChaining
+from hash_table_concurrent import ConcurrentHashTableChaining
+
+# Операция нагрузки: (является_ли_чтением, ключ)
+Operation = Tuple[bool, str]
+
+
+class GlobalLockHashTable:
+    """Базовый вариант: HashTableChaining под одной блокировкой."""
+
+    def __init__(self, size: int = 64) -> None:
+        self.table = HashTableChaining(size=size)
+        self.lock = threading.Lock()
+
+    def insert(self, key: str, value: Any) -> None:
+        with self.lock:
+            self.table.insert(key, value)
+            # Та же политика расширения, что и у конкурентной таблицы
+            if self.table.count > self.table.size:
+                self.table.resize(2 * self.table.size + 1)
+
+    def search(self, key: str) -> Optional[Any]:
+        with self.lock:
+            return self.table.search(key)
+
+
+TableType = Union[GlobalLockHashTable, ConcurrentHashTableChaining]
+
+
+def make_workload(n_ops: int, keys: List[str],
+                  read_ratio: float, seed: int) -> List[Operation]:
+    """Генерирует заранее список операций, чтобы не замерять random."""
+    rng = random.Random(seed)
+    return [(rng.random() < read_ratio, rng.choice(keys))
+            for _ in range(n_ops)]
+
+
+def measure_throughput(table_factory: Callable[[], TableType],
+                       n_threads: int, read_ratio: float,
+                       total_ops: int = 200_000,
+                       n_keys: int = 10_000) -> float:
+    """
+    Измеряет пропускную способность таблицы.
+
+    :param table_factory: callable, возвращающий новый экземпляр таблицы
+    :param n_threads: количество потоков
+    :param read_ratio: доля операций чтения (остальное - вставки)
+    :param total_ops: суммарное количество операций по всем потокам
+    :param n_keys: размер пространства ключей, заполняемого заранее
+    :return: операций в секунду
+    """
+    table = table_factory()
+    keys = [f"key_{i}" for i in range(n_keys)]
+    for i, key in enumerate(keys):
+        table.insert(key, i)
+
+    per_thread = total_ops // n_threads
+    workloads = [make_workload(per_thread, keys, read_ratio, seed=t)
+                 for t in range(n_threads)]
+    # Все потоки стартуют одновременно, главный поток засекает время
+    barrier = threading.Barrier(n_threads + 1)
+
+    def worker(ops: List[Operation]) -> None:
+        insert, search = table.insert, table.search
+        barrier.wait()
+        for is_read, key in ops:
+            if is_read:
+                search(key)
+            else:
+                insert(key, 0)
+
+    threads = [threading.Thread(target=worker, args=(ops,))
+               for ops in workloads]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return per_thread * n_threads / elapsed
+
+
+if __name__ == "__main__":
+    thread_counts = [1, 2, 4, 8, 16]
+    workloads = {"read-heavy (90% чтений)": 0.9,
+                 "write-heavy (10% чтений)": 0.1}
+    factories: dict[str, Callable[[], TableType]] = {
+        "Global lock": lambda: GlobalLockHashTable(size=1024),
+        "Striped (16)": lambda: ConcurrentHashTableChaining(
+            size=1024, num_stripes=16),
+    }
+
+    print("=== Пропускная способность (тыс. операций/с) ===")
+    for workload_name, ratio in workloads.items():
+        print(f"\nНагрузка: {workload_name}")
+        header = f"{'Потоки':<8}" + "".join(f"{n:>16}" for n in factories)
+        print(header)
+        print("-" * len(header))
+        for n_threads in thread_counts:
+            row = f"{n_threads:<8}"
+            for factory in factories.values():
+                ops = measure_throughput(factory, n_threads, ratio)
+                row += f"{ops / 1000:>16.1f}"
+            print(row)
@@ -0,0 +1,70 @@
+"""
+Модуль для бенчмаркинга фильтров принадлежности перед хеш-таблицами.
+Измеряет пропускную способность поиска (запросов в секунду) при разной
+доле промахов для таблицы без фильтра, с фильтром Блума и с cuckoo filter.
+"""
+
+import random
+import time
+from typing import Callable, Dict, List, Union
+from hash_functions import djb2_hash
+from hash_table_chaining import HashTableChaining
+from hash_table_open_addressing import HashTableOpenAddressing
+from membership_filters import BloomFilter, CuckooFilter, FilteredHashTable
+
+SearchTarget = Union[HashTableChaining, HashTableOpenAddressing,
+                     FilteredHashTable]
+
+MISS_RATIOS = [0.0, 0.5, 0.9, 0.99]
+
+
+def make_queries(present: List[str], n_queries: int,
+                 miss_ratio: float, seed: int = 3) -> List[str]:
+    """Запросы с заданной долей отсутствующих ключей."""
+    rng = random.Random(seed)
+    return [f"miss_{i}" if rng.random() < miss_ratio else rng.choice(present)
+            for i in range(n_queries)]
+
+
+def queries_per_second(target: SearchTarget, queries: List[str]) -> float:
+    """Пропускная способность поиска."""
+    search = target.search
+    start = time.perf_counter()
+    for key in queries:
+        search(key)
+    return len(queries) / (time.perf_counter() - start)
+
+
+def run_benchmark(name: str, table_factory: Callable[[], SearchTarget],
+                  n_keys: int, n_queries: int = 20_000) -> None:
+    """Печатает таблицу пропускной способности для одной таблицы."""
+    table = table_factory()
+    present = [f"key_{i}" for i in range(n_keys)]
+    table.update((key, i) for i, key in enumerate(present))
+    variants: Dict[str, SearchTarget] = {
+        "без фильтра": table,
+        "Bloom 1%": FilteredHashTable(table, BloomFilter(n_keys, 0.01)),
+        "Cuckoo 16 бит": FilteredHashTable(table, CuckooFilter(n_keys)),
+    }
+
+    print(f"\n{name}, ключей: {n_keys} (тыс. запросов/с)")
+    header = f"{'Доля промахов':<14}" + "".join(f"{v:>16}" for v in variants)
+    print(header)
+    print("-" * len(header))
+    for miss_ratio in MISS_RATIOS:
+        queries = make_queries(present, n_queries, miss_ratio)
+        row = f"{miss_ratio:<14}"
+        for target in variants.values():
+            row += f"{queries_per_second(target, queries) / 1000:>16.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    n = 20_000
+    run_benchmark("Chaining (djb2, α ≈ 1)",
+                  lambda: HashTableChaining(size=n, hash_func=djb2_hash), n)
+    # При update таблица расширяется до α = 0.75; simple_hash даёт длинные
+    # кластеры, и каждый промах проходит кластер целиком
+    run_benchmark("Open Addressing (linear, simple_hash, α ≈ 0.75)",
+                  lambda: HashTableOpenAddressing(size=n), n,
+                  n_queries=2_000)
@@ -2,21 +2,61 @@
 Модуль для бенчмаркинга производительности хеш-таблиц.
 Измеряет время вставки, поиска и удаления элементов
 для разных реализаций хеш-таблиц при различных коэффициентах заполнения.
+Развёртка sweep() перебирает все таблицы, методы пробирования и хеш-функции
+и сохраняет единый "длинный" (tidy) CSV для plot_hash_results.py.
 """
 
+import csv
+import random
+import string
+import sys
 import time
-from typing import Callable, Tuple, Union
+from typing import (Any, Callable, Dict, List, Optional, Sequence, Tuple,
+                    Union)
+from hash_functions import simple_hash, polynomial_hash, djb2_hash
 from hash_table_chaining import HashTableChaining
+from hash_table_concurrent import ConcurrentHashTableChaining
+from hash_table_cuckoo import HashTableCuckoo
 from hash_table_open_addressing import HashTableOpenAddressing
 
 # Тип для фабрики таблицы — возвращает либо Chaining, либо Open Addressing
-TableType = Union[HashTableChaining, HashTableOpenAddressing]
+TableType = Union[HashTableChaining, HashTableOpenAddressing,
+                  ConcurrentHashTableChaining, HashTableCuckoo]
+HashFunc = Callable[[str, int], int]
+
+SWEEP_CSV = "hash_sweep.csv"
+SWEEP_LOAD_FACTORS = [0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99]
+SWEEP_HASH_FUNCTIONS: Dict[str, HashFunc] = {
+    "simple": simple_hash,
+    "polynomial": polynomial_hash,
+    "djb2": djb2_hash,
+}
+# Таблицы развёртки: имя -> фабрика (размер, хеш-функция) -> таблица
+SWEEP_TABLES: Dict[str, Callable[[int, HashFunc], TableType]] = {
+    "chaining": lambda size, h: HashTableChaining(size, h),
+    "open_linear": lambda size, h: HashTableOpenAddressing(size, "linear", h),
+    "open_double": lambda size, h: HashTableOpenAddressing(size, "double", h),
+    "concurrent": lambda size, h: ConcurrentHashTableChaining(
+        size, h, num_stripes=1),
+    # Вторая хеш-функция кукушкиной таблицы - djb2 (или polynomial,
+    # если первая уже djb2)
+    "cuckoo": lambda size, h: HashTableCuckoo(
+        size, (h, polynomial_hash if h is djb2_hash else djb2_hash)),
+}
+# load_factor - заданный коэффициент, actual_load_factor - фактический
+# после вставки: кукушкина таблица расширяется при α > MAX_LOAD_FACTOR
+SWEEP_FIELDS = ["table", "hash_function", "load_factor",
+                "actual_load_factor", "access", "operation", "n_keys",
+                "ns_per_op", "avg_probes", "max_probes", "bytes_per_entry",
+                "resize_ms"]
 
 
 def benchmark_table(
     table_factory: Callable[[], TableType],
     n_ops: int = 1000,
-    load_factor: float = 0.5
+    load_factor: float = 0.5,
+    bulk: bool = False,
+    latencies: Optional[Dict[str, List[int]]] = None
 ) -> Tuple[float, float, float]:
     """
     Измеряет время выполнения трёх основных операций:
@@ -27,19 +67,64 @@ def benchmark_table(
     :param table_factory: callable, возвращающий новый экземпляр таблицы
     :param n_ops: количество операций для замера
     :param load_factor: коэффициент заполнения таблицы перед замерами
+    :param bulk: замерять пакетные update / get_many / delete_many
+    вместо поэлементных insert / search / delete
+    :param latencies: если передан, каждая поэлементная операция замеряется
+    отдельно, и её время в наносекундах добавляется в списки
+    latencies["insert"], latencies["search"], latencies["delete"]
+    (для хвостовых перцентилей, см. percentile)
     :return: кортеж (время_вставки, время_поиска, время_удаления) в секундах
+    :raises ValueError: если таблица с открытой адресацией не вместит
+    предзаполнение и n_ops новых ключей
     """
     tbl = table_factory()
 
     # Предварительно заполняем таблицу до приблизительного load_factor
     capacity = tbl.size
     prefill_count = int(capacity * load_factor)
+    if (isinstance(tbl, HashTableOpenAddressing) and not bulk and
+            prefill_count + n_ops > capacity):
+        raise ValueError(f"{prefill_count} + {n_ops} ключей не помещаются "
+                         f"в таблицу размера {capacity}")
     for i in range(prefill_count):
         tbl.insert(f"pre{i}", i)
 
     # Генерируем ключи для тестирования
     test_keys = [f"key_{i}" for i in range(n_ops)]
 
+    if bulk:
+        pairs = [(k, i) for i, k in enumerate(test_keys)]
+
+        start = time.perf_counter()
+        tbl.update(pairs)
+        t_insert = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tbl.get_many(test_keys)
+        t_search = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tbl.delete_many(test_keys)
+        t_delete = time.perf_counter() - start
+        return t_insert, t_search, t_delete
+
+    if latencies is not None:
+        clock = time.perf_counter_ns
+        totals = []
+        for name, op in (("insert", lambda k: tbl.insert(k, 0)),
+                         ("search", tbl.search),
+                         ("delete", tbl.delete)):
+            samples = latencies.setdefault(name, [])
+            total = 0
+            for k in test_keys:
+                t0 = clock()
+                op(k)
+                elapsed = clock() - t0
+                samples.append(elapsed)
+                total += elapsed
+            totals.append(total / 1e9)
+        return totals[0], totals[1], totals[2]
+
     # Вставка
     start = time.perf_counter()
     for i, k in enumerate(test_keys):
@@ -61,6 +146,161 @@ def benchmark_table(
     return t_insert, t_search, t_delete
 
 
+def percentile(samples: Sequence[int], q: float) -> float:
+    """
+    Перцентиль q (0..100) выборки методом ближайшего ранга.
+
+    :param samples: замеры, например задержки из benchmark_table
+    :param q: уровень, например 99 для p99
+    """
+    if not samples:
+        raise ValueError("Пустая выборка")
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[min(len(ordered), int(rank)) - 1]
+
+
+def generate_keys(count: int, length: int = 8,
+                  seed: int = 42) -> List[str]:
+    """Уникальные случайные строковые ключи."""
+    rng = random.Random(seed)
+    keys: Dict[str, None] = {}
+    while len(keys) < count:
+        keys["".join(rng.choices(string.ascii_lowercase, k=length))] = None
+    return list(keys)
+
+
+def access_sequence(keys: Sequence[str], n_queries: int, access: str,
+                    seed: int = 7, zipf_s: float = 1.1) -> List[str]:
+    """
+    Последовательность запросов к ключам.
+
+    :param access: "uniform" - равномерно, "zipf" - вероятность ключа ранга r
+    пропорциональна 1 / r^zipf_s (ранги назначаются случайно)
+    """
+    rng = random.Random(seed)
+    if access == "uniform":
+        return rng.choices(keys, k=n_queries)
+    ranked = list(keys)
+    rng.shuffle(ranked)
+    weights = [1 / (rank ** zipf_s) for rank in range(1, len(ranked) + 1)]
+    return rng.choices(ranked, weights=weights, k=n_queries)
+
+
+def structure_bytes(tbl: TableType) -> int:
+    """
+    Память служебной структуры таблицы: массив ячеек, цепочки и кортежи
+    (ключ, значение). Сами ключи и значения не учитываются.
+    """
+    if isinstance(tbl, ConcurrentHashTableChaining):
+        return sum(structure_bytes(segment) for segment in tbl.segments)
+    if isinstance(tbl, HashTableCuckoo):
+        return (sys.getsizeof(tbl.keys) + sys.getsizeof(tbl.values) +
+                sys.getsizeof(tbl.stash) +
+                sum(sys.getsizeof(entry) for entry in tbl.stash))
+    total = sys.getsizeof(tbl.table)
+    for slot in tbl.table:
+        if isinstance(slot, list):
+            total += sys.getsizeof(slot)
+            total += sum(sys.getsizeof(entry) for entry in slot)
+        elif isinstance(slot, tuple):
+            total += sys.getsizeof(slot)
+    return total
+
+
+def time_per_op(func: Callable[[str], Any], keys: Sequence[str]) -> float:
+    """Среднее время одного вызова func в наносекундах."""
+    start = time.perf_counter_ns()
+    for key in keys:
+        func(key)
+    return (time.perf_counter_ns() - start) / max(1, len(keys))
+
+
+def resize_cost_ms(tbl: TableType) -> Union[float, str]:
+    """
+    Время удвоения таблицы в миллисекундах (таблица изменяется).
+    Конкурентная таблица расширяется посегментно, поэтому прочерк.
+    """
+    if isinstance(tbl, ConcurrentHashTableChaining):
+        return ""
+    start = time.perf_counter()
+    tbl.resize(2 * tbl.size + 1)
+    return (time.perf_counter() - start) * 1000
+
+
+def sweep(size: int = 1009, n_queries: int = 2000,
+          load_factors: Sequence[float] = SWEEP_LOAD_FACTORS
+          ) -> List[Dict[str, Any]]:
+    """
+    Развёртка по таблицам, хеш-функциям, коэффициентам заполнения
+    и распределениям запросов.
+
+    Для каждой конфигурации записывается строка на операцию:
+    insert (последовательная вставка до load_factor), hit (успешный поиск)
+    и miss (неуспешный поиск) - время, средняя и максимальная длина
+    цепочки/последовательности проб, память на элемент и стоимость расширения.
+    Таблица может расшириться при вставке (кукушкиная - при
+    α > HashTableCuckoo.MAX_LOAD_FACTOR), поэтому рядом с заданным
+    load_factor записывается фактический len(table) / size.
+
+    :param size: начальный размер таблиц (простое число)
+    :param n_queries: количество запросов поиска на замер
+    :param load_factors: коэффициенты заполнения
+    :return: список строк-словарей с полями SWEEP_FIELDS
+    """
+    rows: List[Dict[str, Any]] = []
+    all_keys = generate_keys(2 * size)
+    for table_name, factory in SWEEP_TABLES.items():
+        for hash_name, hash_func in SWEEP_HASH_FUNCTIONS.items():
+            for load_factor in load_factors:
+                n_keys = max(1, int(size * load_factor))
+                present = all_keys[:n_keys]
+                absent = all_keys[size:size + n_keys]
+                tbl = factory(size, hash_func)
+
+                insert_ns = time_per_op(
+                    lambda k: tbl.insert(k, k), present)
+                insert_probes = [tbl.probe_length(k) for k in present]
+                common = {
+                    "table": table_name,
+                    "hash_function": hash_name,
+                    "load_factor": load_factor,
+                    "actual_load_factor": len(tbl) / tbl.size,
+                    "n_keys": n_keys,
+                    "bytes_per_entry": structure_bytes(tbl) / n_keys,
+                }
+                config_rows = [dict(
+                    common, access="sequential", operation="insert",
+                    ns_per_op=insert_ns,
+                    avg_probes=sum(insert_probes) / n_keys,
+                    max_probes=max(insert_probes))]
+
+                for access in ("uniform", "zipf"):
+                    for operation, pool in (("hit", present),
+                                            ("miss", absent)):
+                        queries = access_sequence(pool, n_queries, access)
+                        probes = [tbl.probe_length(k) for k in queries]
+                        config_rows.append(dict(
+                            common, access=access, operation=operation,
+                            ns_per_op=time_per_op(tbl.search, queries),
+                            avg_probes=sum(probes) / len(probes),
+                            max_probes=max(probes)))
+
+                resize_ms = resize_cost_ms(tbl)
+                for row in config_rows:
+                    row["resize_ms"] = resize_ms
+                rows.extend(config_rows)
+    return rows
+
+
+def write_csv(rows: List[Dict[str, Any]], path: str = SWEEP_CSV) -> None:
+    """Сохраняет строки развёртки в CSV."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SWEEP_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
 if __name__ == "__main__":
     # Коэффициенты заполнения, для которых будем тестировать
     load_factors = [0.1, 0.3, 0.5, 0.7, 0.9]
@@ -79,14 +319,54 @@ if __name__ == "__main__":
         print(f"  Chaining (вставка, поиск, "
               f"удаление): {t_ins:.6f}, {t_sch:.6f}, {t_del:.6f}")
 
-        # Тестируем Open Addressing с линейным пробированием
-        try:
+        # Тестируем Chaining с пакетными операциями
+        t_ins, t_sch, t_del = benchmark_table(
+            lambda: HashTableChaining(size=1009),
+            n_ops=500,
+            load_factor=factor,
+            bulk=True
+        )
+        print(f"  Chaining, пакетно (вставка, поиск, "
+              f"удаление): {t_ins:.6f}, {t_sch:.6f}, {t_del:.6f}")
+
+        # Тестируем Open Addressing: 100 новых ключей помещаются
+        # в таблицу при любом α <= 0.9
+        for method in ("linear", "double"):
             t_ins, t_sch, t_del = benchmark_table(
-                lambda: HashTableOpenAddressing(size=1009),
-                n_ops=500,
+                lambda: HashTableOpenAddressing(size=1009, method=method),
+                n_ops=100,
                 load_factor=factor
             )
-            print(f"  Open Addressing (Linear) "
+            print(f"  Open Addressing ({method}, 100 оп.) "
                   f"(вст., поис., уд.): {t_ins:.6f}, {t_sch:.6f}, {t_del:.6f}")
-        except Exception as e:
-            print(f"  Open Addressing (Linear) — ошибка при α={factor}: {e}")
+
+    # Хвостовые задержки: кукушкина таблица ограничивает поиск d корзинами
+    # и stash, поэтому её p99 не растёт с α, в отличие от цепочек и проб
+    print("\n=== Задержка поиска, нс (среднее / p99) ===")
+    tail_tables: Dict[str, Callable[[], TableType]] = {
+        "Chaining": lambda: HashTableChaining(size=1009),
+        "Open Addressing (double)":
+            lambda: HashTableOpenAddressing(size=1009, method="double"),
+        "Cuckoo (djb2 + polynomial)": lambda: HashTableCuckoo(size=1012),
+    }
+    print(f"{'Таблица':<28}" + "".join(f"{f'α = {factor}':>18}"
+                                       for factor in (0.5, 0.9)))
+    for name, factory in tail_tables.items():
+        row = f"{name:<28}"
+        for factor in (0.5, 0.9):
+            latencies: Dict[str, List[int]] = {}
+            # Замер повторяется, чтобы в p99 попал хвост распределения,
+            # а не единичные выбросы
+            for _ in range(20):
+                benchmark_table(factory, n_ops=100, load_factor=factor,
+                                latencies=latencies)
+            search_ns = latencies["search"]
+            mean_ns = sum(search_ns) / len(search_ns)
+            row += f"{f'{mean_ns:.0f} / {percentile(search_ns, 99):.0f}':>18}"
+        print(row)
+
+    print(f"\n=== Развёртка по α {SWEEP_LOAD_FACTORS[0]}..."
+          f"{SWEEP_LOAD_FACTORS[-1]} ===")
+    sweep_rows = sweep()
+    write_csv(sweep_rows)
+    print(f"Сохранено строк: {len(sweep_rows)} -> {SWEEP_CSV}")
@@ -0,0 +1,104 @@
+"""
+Модуль для бенчмаркинга персистентной хеш-таблицы MmapHashTable.
+Сравнивает холодный старт (открытие + первый поиск) с перестроением
+HashTableChaining из текстового дампа и задержку поиска в обеих таблицах.
+Дополнительно измеряет поиск из нескольких процессов-читателей.
+"""
+
+import os
+import random
+import tempfile
+import time
+from multiprocessing import Pool
+from typing import List, Tuple
+from hash_functions import djb2_hash
+from hash_table_chaining import HashTableChaining
+from hash_table_mmap import MmapHashTable
+
+
+def write_dump(path: str, n_keys: int) -> List[str]:
+    """Пишет дамп "ключ<TAB>значение" и возвращает список ключей."""
+    keys = [f"user:{i:09d}" for i in range(n_keys)]
+    with open(path, "w", encoding="utf-8") as f:
+        for i, key in enumerate(keys):
+            f.write(f"{key}\tvalue-{i}\n")
+    return keys
+
+
+def build_mmap_table(base: str, dump_path: str, n_keys: int) -> float:
+    """Однократно строит таблицу на диске из дампа, возвращает время."""
+    start = time.perf_counter()
+    with MmapHashTable(base, capacity=2 * n_keys) as table:
+        with open(dump_path, encoding="utf-8") as f:
+            for line in f:
+                key, value = line.rstrip("\n").split("\t")
+                table.insert(key, value.encode("utf-8"))
+    return time.perf_counter() - start
+
+
+def rebuild_chaining(dump_path: str, n_keys: int) -> HashTableChaining:
+    """Перестроение HashTableChaining из дампа (как при каждом старте)."""
+    table = HashTableChaining(size=n_keys, hash_func=djb2_hash)
+    with open(dump_path, encoding="utf-8") as f:
+        table.update(line.rstrip("\n").split("\t") for line in f)
+    return table
+
+
+def lookup_ns(search, keys: List[str]) -> float:
+    """Средняя задержка поиска в наносекундах."""
+    start = time.perf_counter_ns()
+    for key in keys:
+        search(key)
+    return (time.perf_counter_ns() - start) / len(keys)
+
+
+def reader_process(args: Tuple[str, List[str]]) -> int:
+    """Процесс-читатель: открывает таблицу только для чтения и ищет ключи."""
+    base, keys = args
+    with MmapHashTable(base, readonly=True) as table:
+        return sum(table.search(key) is not None for key in keys)
+
+
+def run_benchmark(n_keys: int, n_lookups: int = 20_000,
+                  n_readers: int = 4) -> None:
+    """Выполняет все замеры для одного размера и печатает строку."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dump_path = os.path.join(tmp_dir, "dump.tsv")
+        base = os.path.join(tmp_dir, "table")
+        keys = write_dump(dump_path, n_keys)
+        query = random.Random(1).choices(keys, k=n_lookups)
+        build_s = build_mmap_table(base, dump_path, n_keys)
+
+        start = time.perf_counter()
+        table = MmapHashTable(base, readonly=True)
+        table.search(query[0])
+        mmap_open_ms = (time.perf_counter() - start) * 1000
+        mmap_ns = lookup_ns(table.search, query)
+        table.close()
+
+        start = time.perf_counter()
+        chaining = rebuild_chaining(dump_path, n_keys)
+        chaining.search(query[0])
+        rebuild_ms = (time.perf_counter() - start) * 1000
+        chaining_ns = lookup_ns(chaining.search, query)
+
+        chunks = [(base, query[i::n_readers]) for i in range(n_readers)]
+        start = time.perf_counter()
+        with Pool(n_readers) as pool:
+            found = sum(pool.map(reader_process, chunks))
+        multi_s = time.perf_counter() - start
+        assert found == n_lookups
+
+    print(f"{n_keys:<10} | {build_s:>9.2f} | {mmap_open_ms:>12.3f} | "
+          f"{rebuild_ms:>13.1f} | {mmap_ns:>10.0f} | {chaining_ns:>12.0f} | "
+          f"{n_lookups / multi_s / 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    print("Холодный старт mmap против перестроения HashTableChaining")
+    print(f"{'Ключей':<10} | {'Запись, с':>9} | {'mmap откр, мс':>12} | "
+          f"{'Перестр., мс':>13} | {'mmap, нс':>10} | "
+          f"{'Chaining, нс':>12} | {'4 проц, тыс/с':>14}")
+    print("-" * 100)
+    for size in [10_000, 100_000, 500_000]:
+        run_benchmark(size)
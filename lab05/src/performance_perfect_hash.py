@@ -0,0 +1,86 @@
+"""
+Модуль для бенчмаркинга минимальной совершенной хеш-таблицы.
+Сравнивает время построения, байты служебной структуры на ключ
+и время поиска с таблицами lab05 на одном и том же наборе ключей.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable, List, Tuple
+from hash_functions import djb2_hash
+from hash_table_chaining import HashTableChaining
+from hash_table_open_addressing import HashTableOpenAddressing
+from perfect_hash import MinimalPerfectHashTable
+from performance_hash import structure_bytes
+
+
+def mph_bytes(table: MinimalPerfectHashTable) -> int:
+    """Память MPH: массив смещений и массивы ссылок на ключи и значения."""
+    return (sys.getsizeof(table.displacements) +
+            sys.getsizeof(table.keys) + sys.getsizeof(table.values))
+
+
+def measure(build: Callable[[], Any], search_name: str,
+            queries: List[str]) -> Tuple[Any, float, float]:
+    """(таблица, время построения в с, время поиска в нс на запрос)"""
+    start = time.perf_counter()
+    table = build()
+    build_s = time.perf_counter() - start
+    search = getattr(table, search_name)
+    start = time.perf_counter_ns()
+    for key in queries:
+        search(key)
+    return table, build_s, (time.perf_counter_ns() - start) / len(queries)
+
+
+def run_benchmark(n_keys: int, n_queries: int = 50_000) -> None:
+    """Печатает строки сравнения для одного размера набора ключей."""
+    keys = [f"item:{i}" for i in range(n_keys)]
+    values = [f"v{i}" for i in range(n_keys)]
+    queries = random.Random(5).choices(keys, k=n_queries)
+
+    def build_chaining() -> HashTableChaining:
+        table = HashTableChaining(size=n_keys, hash_func=djb2_hash)
+        table.update(zip(keys, values))
+        return table
+
+    def build_open() -> HashTableOpenAddressing:
+        table = HashTableOpenAddressing(size=n_keys, method="double",
+                                        hash_func=djb2_hash)
+        table.update(zip(keys, values))
+        return table
+
+    rows = []
+    mph, build_s, search_ns = measure(
+        lambda: MinimalPerfectHashTable.build(keys, values), "search",
+        queries)
+    rows.append(("MPH (CHD)", build_s, mph_bytes(mph), search_ns))
+    for name, build in (("Chaining (djb2)", build_chaining),
+                        ("Open Addressing (double)", build_open)):
+        table, build_s, search_ns = measure(build, "search", queries)
+        rows.append((name, build_s, structure_bytes(table), search_ns))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "keys.mph")
+        mph.save(path)
+        file_bytes = os.path.getsize(path)
+        start = time.perf_counter()
+        MinimalPerfectHashTable.load(path)
+        load_s = time.perf_counter() - start
+
+    print(f"\nКлючей: {n_keys} (файл MPH: {file_bytes / n_keys:.1f} "
+          f"байт/ключ, загрузка {load_s:.3f} с)")
+    print(f"{'Таблица':<26} | {'Построение, с':>13} | "
+          f"{'Байт/ключ':>10} | {'Поиск, нс':>10}")
+    print("-" * 68)
+    for name, build_s, size_bytes, search_ns in rows:
+        print(f"{name:<26} | {build_s:>13.3f} | "
+              f"{size_bytes / n_keys:>10.1f} | {search_ns:>10.0f}")
+
+
+if __name__ == "__main__":
+    for size in [10_000, 100_000, 500_000]:
+        run_benchmark(size)
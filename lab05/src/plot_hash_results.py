@@ -3,13 +3,17 @@
 Измеряет время вставки и поиск,
 строит графики зависимости от коэффициента заполнения.
 Строит гистограммы распределения коллизий для разных хеш-функций.
+Строит графики по CSV развёртки из performance_hash.py (если он есть).
 """
 
+import csv
+import os
 import random
 import string
 import time
 import matplotlib.pyplot as plt
-from typing import Callable, List
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple
 
 from hash_functions import simple_hash, polynomial_hash, djb2_hash
 from hash_table_chaining import HashTableChaining
@@ -75,6 +79,66 @@ def collisions_chaining(keys: List[str], hash_func:
     return ht.get_chain_lengths()
 
 
+def plot_sweep(path: str = "hash_sweep.csv", access: str = "uniform",
+               hash_function: str = "djb2") -> None:
+    """
+    Графики по CSV развёртки performance_hash.sweep(), по линии на таблицу.
+    По оси X - фактический коэффициент заполнения (actual_load_factor):
+    кукушкина таблица при большом заданном α расширяется.
+    Для успешного и неуспешного поиска - время операции, средняя
+    и максимальная длина проб; по строкам вставки - память на элемент
+    и время удвоения таблицы.
+
+    :param path: путь к CSV
+    :param access: распределение запросов ("uniform" / "zipf")
+    :param hash_function: хеш-функция, для которой строятся графики
+    """
+    fields = ["ns_per_op", "avg_probes", "max_probes",
+              "bytes_per_entry", "resize_ms"]
+    series: Dict[Tuple[str, str], List[Tuple[float, ...]]] = \
+        defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if row["hash_function"] != hash_function or \
+                    row["access"] not in (access, "sequential"):
+                continue
+            # Прочерк (конкурентная таблица без resize_ms) - NaN,
+            # matplotlib пропускает такие точки
+            series[(row["operation"], row["table"])].append(
+                (float(row["actual_load_factor"]),) +
+                tuple(float(row[field] or "nan") for field in fields))
+
+    # (операция, номер поля в точке, подпись оси Y)
+    panels = [
+        ("hit", 1, 'Время операции (нс)'),
+        ("miss", 1, 'Время операции (нс)'),
+        ("hit", 2, 'Средняя длина проб'),
+        ("miss", 2, 'Средняя длина проб'),
+        ("hit", 3, 'Максимальная длина проб'),
+        ("miss", 3, 'Максимальная длина проб'),
+        ("insert", 4, 'Память на элемент (байт)'),
+        ("insert", 5, 'Время удвоения (мс)'),
+    ]
+    plt.figure(figsize=(12, 16))
+    for index, (operation, field, label) in enumerate(panels, 1):
+        plt.subplot(len(panels) // 2, 2, index)
+        for (op, table), points in sorted(series.items()):
+            if op != operation:
+                continue
+            points.sort()
+            plt.plot([p[0] for p in points], [p[field] for p in points],
+                     marker='o', label=table)
+        plt.xlabel('Фактический коэффициент заполнения')
+        plt.ylabel(label)
+        plt.yscale('log')
+        title = operation if operation != "insert" else "вставка"
+        plt.title(f'{title}, {hash_function}, {access}')
+        plt.grid(True)
+        plt.legend()
+    plt.tight_layout()
+    plt.show()
+
+
 if __name__ == "__main__":
     keys = generate_keys(NUM_KEYS)
 
@@ -125,3 +189,7 @@ if __name__ == "__main__":
         plt.yscale('log')  # логарифмическая шкала для наглядности
     plt.tight_layout()
     plt.show()
+
+    # Графики развёртки, если CSV уже получен запуском performance_hash.py
+    if os.path.exists("hash_sweep.csv"):
+        plot_sweep("hash_sweep.csv")
@@ -4,8 +4,17 @@
 Каждый тест возвращает True при успехе, иначе — False.
 """
 
+import os
+import tempfile
+import threading
 from hash_table_chaining import HashTableChaining
-from hash_table_open_addressing import HashTableOpenAddressing
+from hash_table_open_addressing import (HashTableOpenAddressing,
+                                        HashTableOverflowError)
+from hash_table_concurrent import ConcurrentHashTableChaining
+from hash_table_cuckoo import HashTableCuckoo
+from hash_table_mmap import MmapHashTable
+from membership_filters import BloomFilter, CuckooFilter, FilteredHashTable
+from perfect_hash import MinimalPerfectHashTable
 
 
 def test_chaining_insert_search() -> bool:
@@ -108,6 +117,269 @@ def test_chaining_collision_handling() -> bool:
     return True
 
 
+def test_mapping_protocol() -> bool:
+    """
+    Проверяет протокол MutableMapping: отличие "нет ключа" от значения None,
+    счётчик элементов и итерацию по ключам.
+    """
+    for table in (HashTableChaining(size=3),
+                  HashTableOpenAddressing(size=7)):
+        table["none"] = None
+        table["one"] = 1
+        table["one"] = 11
+
+        assert len(table) == 2
+        assert "none" in table
+        assert table["none"] is None
+        assert "missing" not in table
+        try:
+            table["missing"]
+            assert False, "ожидался KeyError"
+        except KeyError:
+            pass
+
+        assert sorted(table) == ["none", "one"]
+        del table["none"]
+        assert len(table) == 1
+        assert dict(table.items()) == {"one": 11}
+
+    return True
+
+
+def test_open_addressing_delete_keeps_probe_chain() -> bool:
+    """
+    Удаление из середины кластера не должно скрывать ключи за ним.
+    """
+    table = HashTableOpenAddressing(size=7)
+    # "ab" и "ba" имеют одинаковый simple_hash и попадают в один кластер
+    table.insert("ab", 1)
+    table.insert("ba", 2)
+    assert table.delete("ab") is True
+    assert table.search("ba") == 2
+
+    table.insert("ba", 3)
+    assert len(table) == 1
+    assert table.search("ba") == 3
+
+    return True
+
+
+def test_open_addressing_overflow_and_probes() -> bool:
+    """
+    Переполнение сообщается явным исключением, длина проб растёт
+    вместе с кластером.
+    """
+    table = HashTableOpenAddressing(size=3)
+    for key in ("ab", "ba", "c"):
+        table.insert(key, 0)
+    # "ab" и "ba" конкурируют за одну ячейку, "ba" смещён на одну пробу
+    assert table.probe_length("ab") == 1
+    assert table.probe_length("ba") == 2
+    try:
+        table.insert("d", 0)
+        assert False, "ожидалось HashTableOverflowError"
+    except HashTableOverflowError:
+        pass
+
+    return True
+
+
+def test_bulk_operations() -> bool:
+    """
+    Тестирует пакетные update / get_many / delete_many с расширением таблицы.
+    """
+    for table in (HashTableChaining(size=2),
+                  HashTableOpenAddressing(size=3)):
+        pairs = [(f"k{i}", i) for i in range(50)]
+        table.update(pairs)
+
+        assert len(table) == 50
+        assert table.size >= 50
+        assert table.get_many(["k0", "k49", "nope"], default=-1) == [0, 49, -1]
+
+        assert table.delete_many(["k0", "k1", "nope"]) == 2
+        assert len(table) == 48
+        assert table.search("k0") is None
+        assert table.search("k2") == 2
+
+    return True
+
+
+def test_bulk_update_double_hashing() -> bool:
+    """
+    update() с двойным хешированием не переполняет таблицу, которую
+    сам расширил: размер после расширения простой, и шаг проб взаимно
+    прост с ним.
+    """
+    for size in (2, 10):
+        for n in range(1, 400):
+            table = HashTableOpenAddressing(size=size, method="double")
+            table.update((f"k{i}", i) for i in range(n))
+            assert len(table) == n
+            assert table.search(f"k{n - 1}") == n - 1
+
+    return True
+
+
+def test_concurrent_inserts() -> bool:
+    """
+    Параллельные вставки из нескольких потоков не теряют элементы,
+    а сегменты расширяются по мере заполнения.
+    """
+    table = ConcurrentHashTableChaining(size=8, num_stripes=4)
+
+    def worker(worker_id: int) -> None:
+        for i in range(500):
+            table.insert(f"t{worker_id}_{i}", i)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(table) == 2000
+    assert table.size >= 2000
+    assert table.search("t3_499") == 499
+    assert table.delete("t3_499") is True
+    assert "t3_499" not in table
+    assert len(table) == 1999
+
+    return True
+
+
+def test_mmap_table_persistence() -> bool:
+    """
+    Таблица на диске переживает переоткрытие, расширение индекса
+    и компактизацию.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base = os.path.join(tmp_dir, "table")
+        with MmapHashTable(base, capacity=4) as table:
+            for i in range(100):
+                table.insert(f"key{i}", str(i).encode())
+            table.insert("key0", b"updated")
+            assert table.delete("key1") is True
+            assert table.delete("key1") is False
+
+        with MmapHashTable(base, readonly=True) as reader:
+            assert len(reader) == 99
+            assert reader.search("key0") == b"updated"
+            assert reader.search("key1") is None
+            assert reader["key99"] == b"99"
+
+        with MmapHashTable(base) as table:
+            table.compact()
+            assert len(table) == 99
+            assert table.search("key50") == b"50"
+            assert sorted(table)[:2] == ["key0", "key10"]
+
+        with MmapHashTable(base, readonly=True) as reader:
+            assert reader.search("key0") == b"updated"
+
+    return True
+
+
+def test_mmap_reader_sees_writer_inserts() -> bool:
+    """
+    Читатель, открытый до вставки, находит ключ, вставленный писателем
+    позже: запись попадает в файл данных раньше ячейки индекса.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base = os.path.join(tmp_dir, "table")
+        with MmapHashTable(base, capacity=64) as writer:
+            writer.insert("a", b"1")
+            with MmapHashTable(base, readonly=True) as reader:
+                assert reader.search("a") == b"1"
+                writer.insert("b", b"2")
+                assert reader.search("b") == b"2"
+                writer.insert("a", b"updated")
+                assert reader["a"] == b"updated"
+
+    return True
+
+
+def test_membership_filters() -> bool:
+    """
+    Фильтры не дают ложных отрицаний; cuckoo filter поддерживает удаление,
+    обёртка отсекает промахи до обращения к таблице.
+    """
+    keys = [f"key{i}" for i in range(500)]
+    bloom = BloomFilter(capacity=500, fp_rate=0.01)
+    cuckoo = CuckooFilter(capacity=500)
+    for key in keys:
+        bloom.add(key)
+        assert cuckoo.add(key) is True
+    assert all(key in bloom and key in cuckoo for key in keys)
+
+    assert cuckoo.remove("key0") is True
+    assert "key0" not in cuckoo
+    assert "key1" in cuckoo
+
+    table = HashTableChaining(size=50)
+    table.update((key, i) for i, key in enumerate(keys))
+    filtered = FilteredHashTable(table, CuckooFilter(capacity=600))
+    assert filtered.search("key42") == 42
+    assert filtered.search("ghost") is None
+    assert filtered.filtered_misses == 1
+    filtered.insert("new", 1)
+    assert filtered.search("new") == 1
+    assert filtered.delete("new") is True
+    assert "new" not in filtered
+
+    return True
+
+
+def test_minimal_perfect_hash() -> bool:
+    """
+    MPH раскладывает n ключей ровно по n позициям и переживает
+    сохранение в файл.
+    """
+    keys = [f"word{i}" for i in range(1000)]
+    table = MinimalPerfectHashTable.build(keys, [k.upper() for k in keys])
+
+    assert sorted(table.index_of(k) for k in keys) == list(range(1000))
+    assert table.search("word7") == "WORD7"
+    assert table.search("missing") is None
+    assert "missing" not in table
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "words.mph")
+        table.save(path)
+        loaded = MinimalPerfectHashTable.load(path)
+    assert len(loaded) == 1000
+    assert all(loaded.search(k) == k.upper() for k in keys)
+
+    return True
+
+
+def test_cuckoo_table() -> bool:
+    """
+    Кукушкина таблица растёт при заполнении, поиск не выходит за
+    d корзин и stash, удаление не ломает остальные ключи.
+    """
+    table = HashTableCuckoo(size=4)
+    for i in range(2000):
+        table.insert(f"key{i}", i)
+    table.insert("key5", "updated")
+
+    assert len(table) == 2000
+    assert table.rehash_count > 0
+    assert table.search("key5") == "updated"
+    assert table.search("missing") is None
+    max_probes = 2 * HashTableCuckoo.BUCKET_SIZE + HashTableCuckoo.STASH_SIZE
+    assert all(table.probe_length(f"key{i}") <= max_probes
+               for i in range(2000))
+
+    for i in range(0, 2000, 2):
+        assert table.delete(f"key{i}") is True
+    assert table.delete("key0") is False
+    assert len(table) == 1000
+    assert sorted(table) == sorted(f"key{i}" for i in range(1, 2000, 2))
+
+    return True
+
+
 if __name__ == "__main__":
     all_tests = [
         ("Chaining Insert/Search", test_chaining_insert_search),
@@ -116,6 +388,20 @@ if __name__ == "__main__":
         ("Open Addressing Double Hashing",
          test_open_addressing_double_hashing),
         ("Chaining Collision Handling", test_chaining_collision_handling),
+        ("Mapping Protocol", test_mapping_protocol),
+        ("Open Addressing Delete Keeps Probe Chain",
+         test_open_addressing_delete_keeps_probe_chain),
+        ("Open Addressing Overflow And Probes",
+         test_open_addressing_overflow_and_probes),
+        ("Bulk Operations", test_bulk_operations),
+        ("Bulk Update Double Hashing", test_bulk_update_double_hashing),
+        ("Concurrent Inserts", test_concurrent_inserts),
+        ("Mmap Table Persistence", test_mmap_table_persistence),
+        ("Mmap Reader Sees Writer Inserts",
+         test_mmap_reader_sees_writer_inserts),
+        ("Membership Filters", test_membership_filters),
+        ("Minimal Perfect Hash", test_minimal_perfect_hash),
+        ("Cuckoo Table", test_cuckoo_table),
     ]
 
     passed = 0
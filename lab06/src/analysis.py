@@ -1,23 +1,161 @@
-import sys
+import bisect
+import os
 import random
+import tempfile
+import threading
+import time
 import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type
 import matplotlib.pyplot as plt
-from binary_search_tree import BinarySearchTree
+from binary_search_tree import BinarySearchTree, TreeNode
+from balanced_trees import AVLTree, RedBlackTree
+from array_bst import ArrayBST
+from bplus_tree import BPlusTree
+from skip_list import ConcurrentSkipList, SkipList
+from self_adjusting_trees import SplayTree, Treap
+from tree_traversal import TreeTraversal
+from tree_serialization import dump, load
 
-# Увеличиваем лимит рекурсии для работы с глубокими деревьями (sorted input)
-sys.setrecursionlimit(20000)
+# Наибольший размер отсортированного входа для несбалансированного BST:
+# его построение занимает O(N^2)
+BST_SORTED_LIMIT = 5000
 
 
-def measure_search_time(elements: list, search_ops: int = 1000) -> float:
+class DictTreeNode:
     """
-    Создает дерево из elements и замеряет время поиска.
+    Прежний узел BST: без __slots__, атрибуты хранятся в словаре.
     """
-    bst = BinarySearchTree()
+
+    def __init__(self, key: int) -> None:
+        self.val: int = key
+        self.left: Optional['DictTreeNode'] = None
+        self.right: Optional['DictTreeNode'] = None
+
+
+class RecursiveBST(BinarySearchTree):
+    """
+    Прежняя рекурсивная реализация BST на узлах DictTreeNode -
+    для сравнения с итеративной версией и ArrayBST.
+    """
+
+    def insert(self, key: int) -> None:
+        if self.root is None:
+            self.root = DictTreeNode(key)
+        else:
+            self._insert_recursive(self.root, key)
+
+    def _insert_recursive(self, node: DictTreeNode, key: int) -> None:
+        if key < node.val:
+            if node.left is None:
+                node.left = DictTreeNode(key)
+            else:
+                self._insert_recursive(node.left, key)
+        else:
+            if node.right is None:
+                node.right = DictTreeNode(key)
+            else:
+                self._insert_recursive(node.right, key)
+
+    def search(self, key: int) -> Optional[DictTreeNode]:
+        return self._search_recursive(self.root, key)
+
+    def _search_recursive(self, node: Optional[DictTreeNode],
+                          key: int) -> Optional[DictTreeNode]:
+        if node is None or node.val == key:
+            return node
+        if key < node.val:
+            return self._search_recursive(node.left, key)
+        return self._search_recursive(node.right, key)
+
+    def delete(self, key: int) -> None:
+        self.root = self._delete_recursive(self.root, key)
+
+    def _delete_recursive(self, node: Optional[DictTreeNode],
+                          key: int) -> Optional[DictTreeNode]:
+        if node is None:
+            return node
+        if key < node.val:
+            node.left = self._delete_recursive(node.left, key)
+        elif key > node.val:
+            node.right = self._delete_recursive(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            elif node.right is None:
+                return node.left
+            temp = self.find_min(node.right)
+            node.val = temp.val
+            node.right = self._delete_recursive(node.right, temp.val)
+        return node
+
+
+class CountingKey(int):
+    """
+    Целый ключ, который считает все свои сравнения - для подсчета
+    среднего числа сравнений на поиск в любом дереве.
+    """
+
+    comparisons = 0
+
+    def __lt__(self, other):
+        CountingKey.comparisons += 1
+        return int.__lt__(self, other)
+
+    def __le__(self, other):
+        CountingKey.comparisons += 1
+        return int.__le__(self, other)
+
+    def __gt__(self, other):
+        CountingKey.comparisons += 1
+        return int.__gt__(self, other)
+
+    def __ge__(self, other):
+        CountingKey.comparisons += 1
+        return int.__ge__(self, other)
+
+    def __eq__(self, other):
+        CountingKey.comparisons += 1
+        return int.__eq__(self, other)
+
+    def __ne__(self, other):
+        CountingKey.comparisons += 1
+        return int.__ne__(self, other)
+
+    __hash__ = int.__hash__
+
+
+def make_search_keys(elements: list, count: int, access: str = 'uniform',
+                     zipf_s: float = 1.1) -> list:
+    """
+    Ключи для поиска: 'uniform' - равновероятно, 'zipf' - ключ ранга r
+    запрашивается с вероятностью, пропорциональной 1 / r^zipf_s.
+    Ранги назначаются случайно, поэтому частые ключи могут лежать
+    глубоко в дереве.
+    """
+    if access == 'uniform':
+        return [random.choice(elements) for _ in range(count)]
+    if access != 'zipf':
+        raise ValueError(f'unknown access pattern: {access}')
+    ranked = random.sample(elements, len(elements))
+    weights = [1 / rank ** zipf_s for rank in range(1, len(ranked) + 1)]
+    return random.choices(ranked, weights=weights, k=count)
+
+
+def measure_search_time(elements: list, search_ops: int = 1000,
+                        tree_class: Callable[[], BinarySearchTree]
+                        = BinarySearchTree,
+                        access: str = 'uniform') -> float:
+    """
+    Создает дерево tree_class из elements и замеряет время поиска
+    ключей с распределением access ('uniform' или 'zipf').
+    """
+    bst = tree_class()
     for el in elements:
         bst.insert(el)
 
-    # Генерация случайных ключей для поиска
-    search_keys = [random.choice(elements) for _ in range(search_ops)]
+    # Генерация ключей для поиска
+    search_keys = make_search_keys(elements, search_ops, access)
 
     # Функция для timeit
     def run_search():
@@ -30,62 +168,465 @@ def measure_search_time(elements: list, search_ops: int = 1000) -> float:
 
 
 def run_experiments():
-    # Размеры массивов для теста (5+ размеров для оценки "4")
-    sizes = [100, 500, 1000, 2000, 5000, 7500]
+    # Размеры массивов для теста: до 10^6 элементов
+    sizes = [1000, 5000, 10_000, 50_000, 100_000, 500_000, 1_000_000]
 
-    times_random = []
-    times_sorted = []
+    trees: Dict[str, Type[BinarySearchTree]] = {
+        'BST': BinarySearchTree,
+        'AVL': AVLTree,
+        'RB': RedBlackTree,
+    }
+    # times[(дерево, вход)] - время по размерам, None - замер не проводился
+    times: Dict[Tuple[str, str], List[Optional[float]]] = {
+        (name, kind): [] for name in trees for kind in ('random', 'sorted')
+    }
 
     print('Starting performance analysis...')
-    print(f"{'Size':<10} | {'Random (sec)':<15} | {'Sorted (sec)':<15}")
-    print("-" * 45)
+    header = f"{'Size':<10}" + "".join(
+        f" | {f'{name} {kind}':<12}" for name, kind in times)
+    print(header)
+    print("-" * len(header))
 
     for size in sizes:
         # 1. Случайные данные (Сбалансированное дерево в среднем случае)
         random_data = list(range(size))
         random.shuffle(random_data)
-        t_rand = measure_search_time(random_data)
-        times_random.append(t_rand)
-
-        # 2. Отсортированные данные (Вырожденное дерево -> связный список)
-        # Берем меньший размер для sorted, иначе рекурсия упадет или будет
-        # очень долго (O(N) поиск). Для корректного сравнения на графике
-        # обычно ограничивают sorted, но здесь оставим равные size,
-        # но будьте готовы к долгому выполнению на больших N.
-        # Для безопасности на больших N ограничим sorted данные до 3000
-        if size <= 3000:
-            sorted_data = list(range(size))
-            t_sort = measure_search_time(sorted_data)
-            times_sorted.append(t_sort)
-        else:
-            times_sorted.append(None)
+        # 2. Отсортированные данные (у обычного BST - связный список)
+        sorted_data = list(range(size))
 
-        print(f"{size:<10} | {t_rand:<15.6f} | "
-              f"{str(t_sort) if size <= 3000 else 'Skipped':<15}")
+        row = f"{size:<10}"
+        for (name, kind), column in times.items():
+            # Построение вырожденного BST стоит O(N^2), поэтому только
+            # у него sorted-замеры ограничены; AVL и RB меряются везде
+            if name == 'BST' and kind == 'sorted' and \
+                    size > BST_SORTED_LIMIT:
+                column.append(None)
+                row += f" | {'Skipped':<12}"
+                continue
+            data = random_data if kind == 'random' else sorted_data
+            t = measure_search_time(data, tree_class=trees[name])
+            column.append(t)
+            row += f" | {t:<12.6f}"
+        print(row)
 
     # Построение графиков
     plt.figure(figsize=(10, 6))
 
-    # График для случайных данных
-    plt.plot(sizes, times_random, label='Random Input (Avg O(log N))',
-             marker='o', color='green')
-
-    # График для отсортированных данных (фильтруем None)
-    valid_sorted_sizes = [s for s, t in zip(sizes, times_sorted) if t]
-    valid_sorted_times = [t for t in times_sorted if t]
+    colors = {'BST': 'red', 'AVL': 'green', 'RB': 'blue'}
+    for (name, kind), column in times.items():
+        # Фильтруем None (пропущенные замеры)
+        valid_sizes = [s for s, t in zip(sizes, column) if t is not None]
+        valid_times = [t for t in column if t is not None]
+        plt.plot(valid_sizes, valid_times, label=f'{name}, {kind} input',
+                 marker='o' if kind == 'random' else 'x',
+                 color=colors[name],
+                 linestyle='-' if kind == 'random' else '--')
 
-    plt.plot(valid_sorted_sizes, valid_sorted_times,
-             label='Sorted Input (Worst O(N))',
-             marker='x', color='red', linestyle='--')
-
-    plt.title('BST Search Performance: Random vs Sorted Input')
+    plt.title('Search Performance: BST vs AVL vs Red-Black Tree')
     plt.xlabel('Number of Elements (N)')
     plt.ylabel('Time for 1000 searches (seconds)')
+    plt.xscale('log')
     plt.legend()
     plt.grid(True)
     plt.savefig('bst_performance.png')
     print("\nГрафик сохранен как 'bst_performance.png'")
 
 
+def measure_memory_per_node(tree_factory: Callable[[], object],
+                            keys: List[int]) -> float:
+    """
+    Память (байт на узел), выделенная при построении дерева из keys.
+    Сами ключи созданы заранее и не учитываются.
+    """
+    tracemalloc.start()
+    tree = tree_factory()
+    for key in keys:
+        tree.insert(key)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(keys)
+
+
+def measure_ops_per_second(tree_factory: Callable[[], object],
+                           keys: List[int]) -> Tuple[float, float, float]:
+    """
+    Пропускная способность (операций в секунду) вставки, поиска
+    и удаления всех keys.
+    """
+    tree = tree_factory()
+    rates = []
+    for operation in ('insert', 'search', 'delete'):
+        method = getattr(tree, operation)
+        start = time.perf_counter()
+        for key in keys:
+            method(key)
+        rates.append(len(keys) / (time.perf_counter() - start))
+    return rates[0], rates[1], rates[2]
+
+
+def run_memory_experiments(size: int = 100_000):
+    """
+    Сравнение прежнего рекурсивного BST (узлы с __dict__), итеративного
+    BST на узлах с __slots__ и ArrayBST на параллельных массивах.
+    """
+    keys = list(range(size))
+    random.shuffle(keys)
+    factories: Dict[str, Callable[[], object]] = {
+        'Recursive BST (__dict__)': RecursiveBST,
+        'Iterative BST (__slots__)': BinarySearchTree,
+        'ArrayBST (array)': ArrayBST,
+    }
+
+    print(f"\nMemory and throughput, {size} random keys")
+    print(f"{'Tree':<28} | {'bytes/node':<10} | {'insert/s':<10} | "
+          f"{'search/s':<10} | {'delete/s':<10}")
+    print("-" * 80)
+    for name, factory in factories.items():
+        per_node = measure_memory_per_node(factory, keys)
+        insert_rate, search_rate, delete_rate = \
+            measure_ops_per_second(factory, keys)
+        print(f"{name:<28} | {per_node:<10.1f} | {insert_rate:<10.0f} | "
+              f"{search_rate:<10.0f} | {delete_rate:<10.0f}")
+
+
+def run_traversal_experiments(degenerate_size: int = 800,
+                              balanced_size: int = 100_000):
+    """
+    Сравнение прежних обходов (рекурсия и res + ...) с ленивыми
+    генераторами и обходом Морриса на вырожденном и случайном дереве.
+    Размер вырожденного дерева ограничен лимитом рекурсии прежних методов.
+    """
+    degenerate = BinarySearchTree()
+    for key in range(degenerate_size):
+        degenerate.insert(key)
+    balanced = BinarySearchTree()
+    keys = list(range(balanced_size))
+    random.shuffle(keys)
+    for key in keys:
+        balanced.insert(key)
+
+    methods: Dict[str, Callable[[Optional[TreeNode]], object]] = {
+        'in_order (recursive)': TreeTraversal.in_order,
+        'iter_in_order': TreeTraversal.iter_in_order,
+        'morris_in_order': TreeTraversal.morris_in_order,
+        'pre_order (recursive)': TreeTraversal.pre_order,
+        'iter_pre_order': TreeTraversal.iter_pre_order,
+        'post_order (recursive)': TreeTraversal.post_order,
+        'iter_post_order': TreeTraversal.iter_post_order,
+        'iter_level_order': TreeTraversal.iter_level_order,
+    }
+
+    print("\nTraversal time (sec)")
+    print(f"{'Method':<24} | {f'Degenerate N={degenerate_size}':<20} | "
+          f"{f'Random N={balanced_size}':<20}")
+    print("-" * 70)
+    for name, method in methods.items():
+        row = f"{name:<24}"
+        for tree in (degenerate, balanced):
+            # list() дочитывает генераторы до конца
+            t = timeit.timeit(lambda: list(method(tree.root)), number=1)
+            row += f" | {t:<20.6f}"
+        print(row)
+
+
+def run_order_statistics_experiments(size: int = 100_000,
+                                     queries: int = 10_000,
+                                     window: int = 100):
+    """
+    Порядковые статистики и запросы по диапазону: красно-черное дерево
+    с размерами поддеревьев против отсортированного списка и bisect.
+    Последняя строка - вставки вперемешку с запросами rank: списку
+    каждая вставка обходится в O(N) сдвигов.
+    """
+    keys = random.sample(range(10 * size), size)
+    tree = RedBlackTree()
+    for key in keys:
+        tree.insert(key)
+    start = time.perf_counter()
+    ordered = sorted(keys)
+    sort_time = time.perf_counter() - start
+
+    ks = [random.randrange(size) for _ in range(queries)]
+    probes = [random.randrange(10 * size) for _ in range(queries)]
+
+    cases: Dict[str, Tuple[Callable[[], object], Callable[[], object]]] = {
+        'select(k)': (
+            lambda: [tree.select(k) for k in ks],
+            lambda: [ordered[k] for k in ks]),
+        'rank(key)': (
+            lambda: [tree.rank(p) for p in probes],
+            lambda: [bisect.bisect_left(ordered, p) for p in probes]),
+        'count_range': (
+            lambda: [tree.count_range(p, p + window) for p in probes],
+            lambda: [bisect.bisect_right(ordered, p + window) -
+                     bisect.bisect_left(ordered, p) for p in probes]),
+        'range_iter': (
+            lambda: [list(tree.range_iter(p, p + window)) for p in probes],
+            lambda: [ordered[bisect.bisect_left(ordered, p):
+                             bisect.bisect_right(ordered, p + window)]
+                     for p in probes]),
+    }
+
+    print(f"\nOrder statistics, N={size}, {queries} queries (sec); "
+          f"sorting the list took {sort_time:.6f}")
+    print(f"{'Query':<22} | {'Red-black tree':<15} | "
+          f"{'sorted + bisect':<15}")
+    print("-" * 58)
+    for name, (tree_run, list_run) in cases.items():
+        print(f"{name:<22} | {timeit.timeit(tree_run, number=1):<15.6f} | "
+              f"{timeit.timeit(list_run, number=1):<15.6f}")
+
+    new_keys = [10 * size + i for i in random.sample(range(size), queries)]
+
+    def tree_mixed():
+        for key, probe in zip(new_keys, probes):
+            tree.insert(key)
+            tree.rank(probe)
+
+    def list_mixed():
+        for key, probe in zip(new_keys, probes):
+            bisect.insort(ordered, key)
+            bisect.bisect_left(ordered, probe)
+
+    tree_time = timeit.timeit(tree_mixed, number=1)
+    list_time = timeit.timeit(list_mixed, number=1)
+    print(f"{'insert + rank':<22} | {tree_time:<15.6f} | {list_time:<15.6f}")
+
+
+def insert_all(tree_class: Type[BinarySearchTree],
+               keys: List[int]) -> BinarySearchTree:
+    """Строит дерево повторными вставками."""
+    tree = tree_class()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def run_build_experiments(sizes: Sequence[int] = (1_000, 10_000, 100_000,
+                                                  1_000_000)):
+    """
+    Время построения дерева: N вставок против from_sorted (O(N))
+    и from_iterable (сортировка + O(N)).
+    """
+    print("\nBuild time (sec)")
+    columns = ['BST insert random', 'BST insert sorted',
+               'AVL insert sorted', 'RB insert sorted',
+               'from_sorted', 'from_iterable']
+    print(f"{'Size':<10}" + "".join(f" | {c:<17}" for c in columns))
+    print("-" * (10 + 20 * len(columns)))
+    for size in sizes:
+        sorted_keys = list(range(size))
+        random_keys = sorted_keys[:]
+        random.shuffle(random_keys)
+        builds: List[Optional[Callable[[], object]]] = [
+            lambda: insert_all(BinarySearchTree, random_keys),
+            # N вставок по возрастанию в BST - O(N^2)
+            (lambda: insert_all(BinarySearchTree, sorted_keys))
+            if size <= BST_SORTED_LIMIT else None,
+            lambda: insert_all(AVLTree, sorted_keys),
+            lambda: insert_all(RedBlackTree, sorted_keys),
+            lambda: BinarySearchTree.from_sorted(sorted_keys),
+            lambda: BinarySearchTree.from_iterable(random_keys),
+        ]
+        row = f"{size:<10}"
+        for build in builds:
+            if build is None:
+                row += f" | {'Skipped':<17}"
+            else:
+                row += f" | {timeit.timeit(build, number=1):<17.6f}"
+        print(row)
+
+
+def run_bplus_experiments(size: int = 1_000_000,
+                          fanouts: Sequence[int] = (4, 16, 64, 256),
+                          lookups: int = 100_000, scans: int = 1000,
+                          scan_width: int = 1000):
+    """
+    Точечный поиск и просмотр диапазонов: B+-дерево с разной
+    арностью против сбалансированного бинарного дерева (from_sorted).
+    """
+    keys = list(range(size))
+    lookup_keys = [random.randrange(size) for _ in range(lookups)]
+    scan_starts = [random.randrange(size - scan_width) for _ in range(scans)]
+
+    trees: Dict[str, object] = {
+        'Balanced BST': BinarySearchTree.from_sorted(keys),
+    }
+    for fanout in fanouts:
+        trees[f'B+ tree, fanout {fanout}'] = \
+            BPlusTree.from_sorted(keys, fanout)
+
+    print(f"\nB+ tree, N={size}: {lookups} lookups, "
+          f"{scans} scans of {scan_width} keys (sec)")
+    print(f"{'Tree':<22} | {'Lookups':<10} | {'Range scans':<10}")
+    print("-" * 50)
+    for name, tree in trees.items():
+        def run_lookups():
+            for key in lookup_keys:
+                tree.search(key)
+
+        def run_scans():
+            for lo in scan_starts:
+                for _ in tree.range_iter(lo, lo + scan_width - 1):
+                    pass
+
+        print(f"{name:<22} | {timeit.timeit(run_lookups, number=1):<10.6f}"
+              f" | {timeit.timeit(run_scans, number=1):<10.6f}")
+
+
+def run_skip_list_experiments(size: int = 100_000, readers: int = 4):
+    """
+    Список с пропусками против BST и красно-черного дерева: пропускная
+    способность операций, поиск по возрастающим ключам с пальцем и чтение
+    из нескольких потоков во время вставок одного писателя.
+    """
+    keys = list(range(size))
+    random.shuffle(keys)
+    factories: Dict[str, Callable[[], object]] = {
+        'BST': BinarySearchTree,
+        'Red-black tree': RedBlackTree,
+        'Skip list, p=1/2': lambda: SkipList(0.5),
+        'Skip list, p=1/4': lambda: SkipList(0.25),
+    }
+
+    print(f"\nSkip list, {size} random keys (operations per second)")
+    print(f"{'Structure':<20} | {'insert/s':<10} | {'search/s':<10} | "
+          f"{'delete/s':<10}")
+    print("-" * 60)
+    for name, factory in factories.items():
+        rates = measure_ops_per_second(factory, keys)
+        print(f"{name:<20}" + "".join(f" | {r:<10.0f}" for r in rates))
+
+    # Запросы подряд по возрастанию: каждый следующий ключ - сосед
+    # предыдущего, палец избавляет от спуска с верхнего уровня
+    skip_list = SkipList()
+    for key in keys:
+        skip_list.insert(key)
+    ascending = list(range(size))
+    t_plain = timeit.timeit(
+        lambda: [skip_list.search(k) for k in ascending], number=1)
+    t_finger = timeit.timeit(
+        lambda: [skip_list.finger_search(k) for k in ascending], number=1)
+    print(f"Ascending lookups ({len(ascending)}): search {t_plain:.6f} s, "
+          f"finger_search {t_finger:.6f} s")
+
+    shared = ConcurrentSkipList()
+    for key in keys[:size // 2]:
+        shared.insert(key)
+    done = threading.Event()
+    reads = [0] * readers
+
+    def reader(index: int):
+        lookups = keys[:size // 2]
+        while not done.is_set():
+            for key in lookups[:1000]:
+                shared.search(key)
+            reads[index] += 1000
+            random.shuffle(lookups)
+
+    threads = [threading.Thread(target=reader, args=(i,))
+               for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    for key in keys[size // 2:]:
+        shared.insert(key)
+    elapsed = time.perf_counter() - start
+    done.set()
+    for thread in threads:
+        thread.join()
+    print(f"ConcurrentSkipList: 1 writer inserted {size - size // 2} keys "
+          f"in {elapsed:.3f} s while {readers} readers did "
+          f"{sum(reads) / elapsed:.0f} lookups/s")
+
+
+def run_skewed_experiments(size: int = 100_000, searches: int = 100_000):
+    """
+    Поиск при равномерном и Zipf-распределении запросов: среднее число
+    сравнений ключей на поиск и время. Splay-дерево и treap с частотными
+    приоритетами поднимают частые ключи к корню.
+    """
+    elements = [CountingKey(key) for key in range(size)]
+    random.shuffle(elements)
+    factories: Dict[str, Callable[[], BinarySearchTree]] = {
+        'BST': BinarySearchTree,
+        'Red-black tree': RedBlackTree,
+        'Splay tree': SplayTree,
+        'Treap (random)': Treap,
+        'Treap (frequency)': lambda: Treap(by_frequency=True),
+    }
+
+    print(f"\nSkewed access, N={size}, {searches} searches")
+    print(f"{'Tree':<18} | {'uniform cmp':<11} | {'zipf cmp':<11} | "
+          f"{'uniform sec':<11} | {'zipf sec':<11}")
+    print("-" * 75)
+    for name, factory in factories.items():
+        comparisons, times = [], []
+        for access in ('uniform', 'zipf'):
+            tree = factory()
+            for key in elements:
+                tree.insert(key)
+            search_keys = make_search_keys(elements, searches, access)
+            CountingKey.comparisons = 0
+            start = time.perf_counter()
+            for key in search_keys:
+                tree.search(key)
+            times.append(time.perf_counter() - start)
+            comparisons.append(CountingKey.comparisons / searches)
+        print(f"{name:<18} | {comparisons[0]:<11.1f} | "
+              f"{comparisons[1]:<11.1f} | {times[0]:<11.6f} | "
+              f"{times[1]:<11.6f}")
+
+
+def run_serialization_experiments(size: int = 1_000_000):
+    """
+    Восстановление дерева после перезапуска: загрузка двоичного снимка
+    (O(N), без сравнений) против повторной вставки ключей в порядке
+    прямого обхода, которая дает ту же форму. Для вырожденного BST
+    повторная вставка квадратична.
+    """
+    rng = random.Random(0)
+    cases: List[Tuple[str, Type[BinarySearchTree], List[int]]] = [
+        ('BST, random', BinarySearchTree, rng.sample(range(size * 10), size)),
+        ('BST, sorted', BinarySearchTree, list(range(BST_SORTED_LIMIT))),
+        ('Red-black tree', RedBlackTree, rng.sample(range(size * 10), size)),
+    ]
+    fd, path = tempfile.mkstemp(suffix='.bst')
+    os.close(fd)
+
+    print("\nSnapshot reload vs replayed inserts")
+    print(f"{'Tree':<16} | {'N':<8} | {'bytes/node':<10} | "
+          f"{'dump sec':<9} | {'load sec':<9} | {'insert sec':<10}")
+    print("-" * 78)
+    try:
+        for name, tree_class, keys in cases:
+            tree = insert_all(tree_class, keys)
+            start = time.perf_counter()
+            dump(tree, path)
+            t_dump = time.perf_counter() - start
+            per_node = os.path.getsize(path) / len(keys)
+
+            start = time.perf_counter()
+            restored = load(path, tree_class)
+            t_load = time.perf_counter() - start
+
+            preorder = list(TreeTraversal.iter_pre_order(restored.root))
+            start = time.perf_counter()
+            insert_all(tree_class, preorder)
+            t_insert = time.perf_counter() - start
+            print(f"{name:<16} | {len(keys):<8} | {per_node:<10.2f} | "
+                  f"{t_dump:<9.3f} | {t_load:<9.3f} | {t_insert:<10.3f}")
+    finally:
+        os.remove(path)
+
+
 if __name__ == '__main__':
     run_experiments()
+    run_memory_experiments()
+    run_traversal_experiments()
+    run_order_statistics_experiments()
+    run_build_experiments()
+    run_bplus_experiments()
+    run_skip_list_experiments()
+    run_skewed_experiments()
+    run_serialization_experiments()
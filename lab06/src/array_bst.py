@@ -0,0 +1,163 @@
+from array import array
+from typing import Optional
+
+# Отсутствующий узел
+NIL = -1
+
+
+class ArrayBST:
+    """
+    Бинарное дерево поиска в виде "структуры массивов": узел - это индекс
+    в параллельных массивах keys, left и right. Освобожденные индексы
+    связываются в список свободных узлов через массив left и используются
+    повторно. Узел занимает 16 байт (8 на ключ и по 4 на ссылки) вместо
+    отдельного Python-объекта.
+    """
+
+    def __init__(self) -> None:
+        self.keys = array('q')
+        self.left = array('i')
+        self.right = array('i')
+        self.root: int = NIL
+        # Голова списка свободных узлов
+        self.free: int = NIL
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _new_node(self, key: int) -> int:
+        """
+        Выделяет узел из списка свободных или в конце массивов.
+
+        Сложность: O(1) амортизированно.
+        """
+        self.size += 1
+        node = self.free
+        if node == NIL:
+            self.keys.append(key)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            return len(self.keys) - 1
+        self.free = self.left[node]
+        self.keys[node] = key
+        self.left[node] = NIL
+        self.right[node] = NIL
+        return node
+
+    def _release(self, node: int) -> None:
+        """Возвращает узел в список свободных. Сложность: O(1)."""
+        self.size -= 1
+        self.left[node] = self.free
+        self.free = node
+
+    def insert(self, key: int) -> None:
+        """
+        Вставляет значение в дерево.
+
+        Временная сложность:
+            - Средняя: O(log N)
+            - Худшая: O(N) (вырожденное дерево)
+        """
+        if self.root == NIL:
+            self.root = self._new_node(key)
+            return
+
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while True:
+            if key < keys[node]:
+                if left[node] == NIL:
+                    left[node] = self._new_node(key)
+                    return
+                node = left[node]
+            else:
+                if right[node] == NIL:
+                    right[node] = self._new_node(key)
+                    return
+                node = right[node]
+
+    def search(self, key: int) -> Optional[int]:
+        """
+        Ищет узел с заданным значением.
+
+        Временная сложность:
+            - Средняя: O(log N)
+            - Худшая: O(N)
+
+        :return: индекс узла или None, если значения нет
+        """
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while node != NIL:
+            node_key = keys[node]
+            if node_key == key:
+                return node
+            node = left[node] if key < node_key else right[node]
+        return None
+
+    def find_min(self, node: int) -> int:
+        """
+        Находит узел с минимальным значением в поддереве.
+
+        Сложность: O(H), где H - высота дерева.
+        """
+        left = self.left
+        while left[node] != NIL:
+            node = left[node]
+        return node
+
+    def delete(self, key: int) -> None:
+        """
+        Удаляет значение из дерева.
+
+        Временная сложность:
+            - Средняя: O(log N)
+            - Худшая: O(N)
+        """
+        keys, left, right = self.keys, self.left, self.right
+        parent = NIL
+        node = self.root
+        while node != NIL and keys[node] != key:
+            parent = node
+            node = left[node] if key < keys[node] else right[node]
+        if node == NIL:
+            return
+
+        # Два ребенка: переносим ключ преемника и удаляем его узел
+        if left[node] != NIL and right[node] != NIL:
+            parent = node
+            successor = right[node]
+            while left[successor] != NIL:
+                parent = successor
+                successor = left[successor]
+            keys[node] = keys[successor]
+            node = successor
+
+        # Нет детей или один ребенок
+        child = left[node] if left[node] != NIL else right[node]
+        if parent == NIL:
+            self.root = child
+        elif left[parent] == node:
+            left[parent] = child
+        else:
+            right[parent] = child
+        self._release(node)
+
+    def is_valid_bst(self) -> bool:
+        """
+        Проверяет, является ли дерево корректным BST.
+
+        Сложность: O(N).
+        """
+        stack = [(self.root, float('-inf'), float('inf'))]
+        while stack:
+            node, min_val, max_val = stack.pop()
+            if node == NIL:
+                continue
+            key = self.keys[node]
+            if not (min_val < key < max_val):
+                return False
+            stack.append((self.left[node], min_val, key))
+            stack.append((self.right[node], key, max_val))
+        return True
@@ -0,0 +1,401 @@
+from typing import Optional
+from binary_search_tree import BinarySearchTree, TreeNode
+
+RED = True
+BLACK = False
+
+
+class AVLNode(TreeNode):
+    """
+    Узел AVL-дерева: хранит высоту своего поддерева.
+    """
+
+    __slots__ = ('height',)
+
+    def __init__(self, key: int) -> None:
+        super().__init__(key)
+        self.height: int = 1
+        self.left: Optional['AVLNode'] = None
+        self.right: Optional['AVLNode'] = None
+
+
+class AVLTree(BinarySearchTree):
+    """
+    AVL-дерево: высоты поддеревьев любого узла отличаются не более чем
+    на 1, поэтому высота дерева не превышает 1.44 * log2(N).
+    Повторные ключи не вставляются.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.root: Optional[AVLNode] = None
+
+    def insert(self, key: int) -> None:
+        """
+        Вставляет значение в дерево и восстанавливает баланс поворотами.
+
+        Временная сложность: O(log N) в худшем случае.
+        """
+        self.root = self._insert_avl(self.root, key)
+
+    def _insert_avl(self, node: Optional[AVLNode], key: int) -> AVLNode:
+        if node is None:
+            return AVLNode(key)
+        if key < node.val:
+            node.left = self._insert_avl(node.left, key)
+        elif key > node.val:
+            node.right = self._insert_avl(node.right, key)
+        else:
+            return node
+        return self._rebalance(node)
+
+    def delete(self, key: int) -> None:
+        """
+        Удаляет значение из дерева и восстанавливает баланс поворотами.
+
+        Временная сложность: O(log N) в худшем случае.
+        """
+        self.root = self._delete_avl(self.root, key)
+
+    def _delete_avl(self, node: Optional[AVLNode],
+                    key: int) -> Optional[AVLNode]:
+        if node is None:
+            return None
+
+        if key < node.val:
+            node.left = self._delete_avl(node.left, key)
+        elif key > node.val:
+            node.right = self._delete_avl(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # Два ребенка: заменяем значением преемника
+            temp = self.find_min(node.right)
+            node.val = temp.val
+            node.right = self._delete_avl(node.right, temp.val)
+
+        return self._rebalance(node)
+
+    def _build_node(self, key: int, parent: Optional[AVLNode], count: int,
+                    depth: int, max_depth: int) -> AVLNode:
+        node = AVLNode(key)
+        node.size = count
+        # Поддерево из count ключей, построенное делением пополам,
+        # имеет высоту floor(log2(count)) + 1
+        node.height = count.bit_length()
+        return node
+
+    @staticmethod
+    def _height(node: Optional[AVLNode]) -> int:
+        return node.height if node is not None else 0
+
+    def _update(self, node: AVLNode) -> None:
+        node.height = 1 + max(self._height(node.left),
+                              self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def _rotate_left(self, node: AVLNode) -> AVLNode:
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node: AVLNode) -> AVLNode:
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        """
+        Пересчитывает высоту узла и выполняет малый или большой поворот,
+        если разница высот поддеревьев стала равна 2.
+
+        Сложность: O(1).
+        """
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < \
+                    self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def is_balanced(self) -> bool:
+        """
+        Проверяет AVL-свойство и корректность сохранённых высот.
+
+        Сложность: O(N).
+        """
+        def check(node: Optional[AVLNode]) -> int:
+            # Возвращает высоту поддерева или -1, если свойство нарушено
+            if node is None:
+                return 0
+            left, right = check(node.left), check(node.right)
+            if left < 0 or right < 0 or abs(left - right) > 1 or \
+                    node.height != 1 + max(left, right):
+                return -1
+            return node.height
+
+        return check(self.root) >= 0
+
+
+class RBNode(TreeNode):
+    """
+    Узел красно-черного дерева: цвет и ссылка на родителя.
+    """
+
+    __slots__ = ('color', 'parent')
+
+    def __init__(self, key: int, parent: Optional['RBNode'] = None) -> None:
+        super().__init__(key)
+        self.color: bool = RED
+        self.parent: Optional['RBNode'] = parent
+        self.left: Optional['RBNode'] = None
+        self.right: Optional['RBNode'] = None
+
+
+def _color(node: Optional[RBNode]) -> bool:
+    """Цвет узла; отсутствующий лист считается черным."""
+    return node.color if node is not None else BLACK
+
+
+class RedBlackTree(BinarySearchTree):
+    """
+    Красно-черное дерево (по Кормену): корень черный, у красного узла
+    нет красных детей, на всех путях от узла до листьев одинаковое число
+    черных узлов. Высота не превышает 2 * log2(N + 1).
+    Повторные ключи не вставляются.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.root: Optional[RBNode] = None
+
+    def insert(self, key: int) -> None:
+        """
+        Вставляет значение и восстанавливает свойства перекрашиванием
+        и не более чем двумя поворотами.
+
+        Временная сложность: O(log N) в худшем случае.
+        """
+        parent = None
+        node = self.root
+        while node is not None:
+            parent = node
+            if key < node.val:
+                node = node.left
+            elif key > node.val:
+                node = node.right
+            else:
+                return
+
+        new_node = RBNode(key, parent)
+        ancestor = parent
+        while ancestor is not None:
+            ancestor.size += 1
+            ancestor = ancestor.parent
+        if parent is None:
+            self.root = new_node
+        elif key < parent.val:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._fix_after_insert(new_node)
+
+    def _build_node(self, key: int, parent: Optional[RBNode], count: int,
+                    depth: int, max_depth: int) -> RBNode:
+        node = RBNode(key, parent)
+        node.size = count
+        # Пустые ссылки в дереве из from_sorted находятся на двух нижних
+        # уровнях, поэтому черная высота одинакова, если покрасить
+        # в красный только узлы самого нижнего уровня (кроме корня)
+        node.color = RED if depth == max_depth and depth > 0 else BLACK
+        return node
+
+    def _fix_after_insert(self, node: RBNode) -> None:
+        while node is not self.root and node.parent.color == RED:
+            parent = node.parent
+            grand = parent.parent
+            if parent is grand.left:
+                uncle = grand.right
+                if _color(uncle) == RED:
+                    # Красный дядя: перекрашиваем и поднимаемся выше
+                    parent.color = uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
+                    continue
+                if node is parent.right:
+                    node = parent
+                    self._rotate_left(node)
+                    parent = node.parent
+                parent.color = BLACK
+                grand.color = RED
+                self._rotate_right(grand)
+            else:
+                uncle = grand.left
+                if _color(uncle) == RED:
+                    parent.color = uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
+                    continue
+                if node is parent.left:
+                    node = parent
+                    self._rotate_right(node)
+                    parent = node.parent
+                parent.color = BLACK
+                grand.color = RED
+                self._rotate_left(grand)
+        self.root.color = BLACK
+
+    def delete(self, key: int) -> None:
+        """
+        Удаляет значение и восстанавливает свойства перекрашиванием
+        и не более чем тремя поворотами.
+
+        Временная сложность: O(log N) в худшем случае.
+        """
+        node = self.search(key)
+        if node is None:
+            return
+
+        # Два ребенка: заменяем значением преемника и удаляем преемника
+        if node.left is not None and node.right is not None:
+            successor = self.find_min(node.right)
+            node.val = successor.val
+            node = successor
+
+        ancestor = node.parent
+        while ancestor is not None:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+
+        replacement = node.left if node.left is not None else node.right
+        if replacement is not None:
+            self._replace(node, replacement)
+            if node.color == BLACK:
+                self._fix_after_delete(replacement)
+        elif node.parent is None:
+            self.root = None
+        else:
+            # Черный лист сначала участвует в балансировке как фиктивный
+            # узел; размер 0, чтобы повороты не учитывали его в поддеревьях
+            node.size = 0
+            if node.color == BLACK:
+                self._fix_after_delete(node)
+            self._replace(node, None)
+
+    def _fix_after_delete(self, node: RBNode) -> None:
+        while node is not self.root and _color(node) == BLACK:
+            parent = node.parent
+            if node is parent.left:
+                sibling = parent.right
+                if _color(sibling) == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self._rotate_left(parent)
+                    sibling = parent.right
+                if _color(sibling.left) == BLACK and \
+                        _color(sibling.right) == BLACK:
+                    sibling.color = RED
+                    node = parent
+                    continue
+                if _color(sibling.right) == BLACK:
+                    sibling.left.color = BLACK
+                    sibling.color = RED
+                    self._rotate_right(sibling)
+                    sibling = parent.right
+                sibling.color = parent.color
+                parent.color = BLACK
+                sibling.right.color = BLACK
+                self._rotate_left(parent)
+            else:
+                sibling = parent.left
+                if _color(sibling) == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self._rotate_right(parent)
+                    sibling = parent.left
+                if _color(sibling.left) == BLACK and \
+                        _color(sibling.right) == BLACK:
+                    sibling.color = RED
+                    node = parent
+                    continue
+                if _color(sibling.left) == BLACK:
+                    sibling.right.color = BLACK
+                    sibling.color = RED
+                    self._rotate_left(sibling)
+                    sibling = parent.left
+                sibling.color = parent.color
+                parent.color = BLACK
+                sibling.left.color = BLACK
+                self._rotate_right(parent)
+            node = self.root
+        node.color = BLACK
+
+    def _replace(self, node: RBNode, child: Optional[RBNode]) -> None:
+        """Ставит child (или пустую ссылку) на место node у его родителя."""
+        parent = node.parent
+        if child is not None:
+            child.parent = parent
+        if parent is None:
+            self.root = child
+        elif node is parent.left:
+            parent.left = child
+        else:
+            parent.right = child
+        node.parent = None
+
+    def _rotate_left(self, node: RBNode) -> None:
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+        self._replace(node, pivot)
+        pivot.left = node
+        node.parent = pivot
+        pivot.size = node.size
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def _rotate_right(self, node: RBNode) -> None:
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+        self._replace(node, pivot)
+        pivot.right = node
+        node.parent = pivot
+        pivot.size = node.size
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def is_balanced(self) -> bool:
+        """
+        Проверяет свойства красно-черного дерева.
+
+        Сложность: O(N).
+        """
+        def black_height(node: Optional[RBNode]) -> int:
+            # Возвращает черную высоту или -1, если свойство нарушено
+            if node is None:
+                return 1
+            if node.color == RED and (_color(node.left) == RED or
+                                      _color(node.right) == RED):
+                return -1
+            left, right = black_height(node.left), black_height(node.right)
+            if left < 0 or left != right:
+                return -1
+            return left + (1 if node.color == BLACK else 0)
+
+        return _color(self.root) == BLACK and black_height(self.root) > 0
+
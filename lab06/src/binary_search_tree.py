@@ -1,15 +1,20 @@
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
 
 class TreeNode:
     """
     Узел бинарного дерева поиска.
+    __slots__ убирает словарь атрибутов у каждого узла.
+    size - количество узлов в поддереве (для порядковых статистик).
     """
 
+    __slots__ = ('val', 'left', 'right', 'size')
+
     def __init__(self, key: int) -> None:
         self.val: int = key
         self.left: Optional['TreeNode'] = None
         self.right: Optional['TreeNode'] = None
+        self.size: int = 1
 
 
 class BinarySearchTree:
@@ -20,9 +25,127 @@ class BinarySearchTree:
     def __init__(self) -> None:
         self.root: Optional[TreeNode] = None
 
+    def __len__(self) -> int:
+        return self._size(self.root)
+
+    def __iter__(self) -> Iterator[int]:
+        """Ключи по возрастанию (ленивый центрированный обход)."""
+        stack: List[TreeNode] = []
+        node = self.root
+        while node is not None or stack:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.val
+            node = node.right
+
+    @classmethod
+    def from_sorted(cls, keys: Sequence[int]) -> 'BinarySearchTree':
+        """
+        Строит идеально сбалансированное дерево из строго возрастающих
+        ключей: корень поддерева - середина своего отрезка. Итеративно,
+        без сравнений ключей между собой.
+
+        Временная сложность: O(N).
+        """
+        for i in range(1, len(keys)):
+            if not keys[i - 1] < keys[i]:
+                raise ValueError('keys must be strictly increasing')
+        tree = cls()
+        n = len(keys)
+        if n == 0:
+            return tree
+
+        max_depth = n.bit_length() - 1
+        # Отрезки [lo, hi), которые осталось превратить в поддеревья:
+        # (lo, hi, родитель, левый ли ребенок, глубина)
+        stack: List[Tuple[int, int, Optional[TreeNode], bool, int]] = \
+            [(0, n, None, False, 0)]
+        while stack:
+            lo, hi, parent, is_left, depth = stack.pop()
+            mid = (lo + hi) // 2
+            node = tree._build_node(keys[mid], parent, hi - lo,
+                                    depth, max_depth)
+            if parent is None:
+                tree.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            if lo < mid:
+                stack.append((lo, mid, node, True, depth + 1))
+            if mid + 1 < hi:
+                stack.append((mid + 1, hi, node, False, depth + 1))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, keys: Iterable[int]) -> 'BinarySearchTree':
+        """
+        Строит сбалансированное дерево из ключей в любом порядке.
+        Повторяющиеся ключи сохраняются один раз.
+
+        Временная сложность: O(N log N) на сортировку, O(N) на построение.
+        """
+        return cls.from_sorted(sorted(set(keys)))
+
+    def _build_node(self, key: int, parent: Optional[TreeNode], count: int,
+                    depth: int, max_depth: int) -> TreeNode:
+        """
+        Хук для from_sorted: создает корень поддерева из count ключей на
+        глубине depth (max_depth - глубина нижнего уровня дерева).
+        Наследники заполняют здесь свои служебные поля узла.
+        """
+        node = TreeNode(key)
+        node.size = count
+        return node
+
+    def union(self, other: 'BinarySearchTree') -> 'BinarySearchTree':
+        """
+        Новое сбалансированное дерево того же типа с ключами обоих
+        деревьев: слияние двух отсортированных обходов и from_sorted.
+
+        Временная сложность: O(N + M).
+        """
+        merged: List[int] = []
+        left, right = iter(self), iter(other)
+        a = next(left, None)
+        b = next(right, None)
+        while a is not None or b is not None:
+            if b is None or (a is not None and a < b):
+                key, a = a, next(left, None)
+            elif a is None or b < a:
+                key, b = b, next(right, None)
+            else:
+                key, a, b = a, next(left, None), next(right, None)
+            if not merged or merged[-1] != key:
+                merged.append(key)
+        return type(self).from_sorted(merged)
+
+    def merge(self, other: 'BinarySearchTree') -> None:
+        """
+        Добавляет в дерево все ключи other, перестраивая его
+        сбалансированным. other не изменяется.
+
+        Временная сложность: O(N + M).
+        """
+        self.root = self.union(other).root
+
+    @staticmethod
+    def _size(node: Optional[TreeNode]) -> int:
+        return node.size if node is not None else 0
+
+    def _update(self, node: TreeNode) -> None:
+        """
+        Пересчитывает служебные поля узла по его детям.
+        Наследники дополняют его своими полями (высота в AVL).
+        """
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
     def insert(self, key: int) -> None:
         """
         Вставляет значение в дерево.
+        Итеративная версия: глубина дерева не ограничена лимитом рекурсии.
 
         Временная сложность:
             - Средняя: O(log N)
@@ -30,20 +153,22 @@ class BinarySearchTree:
         """
         if self.root is None:
             self.root = TreeNode(key)
-        else:
-            self._insert_recursive(self.root, key)
+            return
 
-    def _insert_recursive(self, node: TreeNode, key: int) -> None:
-        if key < node.val:
-            if node.left is None:
-                node.left = TreeNode(key)
-            else:
-                self._insert_recursive(node.left, key)
-        else:
-            if node.right is None:
-                node.right = TreeNode(key)
+        node = self.root
+        while True:
+            # Новый узел окажется в поддереве каждого узла на пути
+            node.size += 1
+            if key < node.val:
+                if node.left is None:
+                    node.left = TreeNode(key)
+                    return
+                node = node.left
             else:
-                self._insert_recursive(node.right, key)
+                if node.right is None:
+                    node.right = TreeNode(key)
+                    return
+                node = node.right
 
     def search(self, key: int) -> Optional[TreeNode]:
         """
@@ -53,15 +178,10 @@ class BinarySearchTree:
             - Средняя: O(log N)
             - Худшая: O(N)
         """
-        return self._search_recursive(self.root, key)
-
-    def _search_recursive(self, node: Optional[TreeNode],
-                          key: int) -> Optional[TreeNode]:
-        if node is None or node.val == key:
-            return node
-        if key < node.val:
-            return self._search_recursive(node.left, key)
-        return self._search_recursive(node.right, key)
+        node = self.root
+        while node is not None and node.val != key:
+            node = node.left if key < node.val else node.right
+        return node
 
     def find_min(self, node: TreeNode) -> TreeNode:
         """
@@ -82,32 +202,40 @@ class BinarySearchTree:
             - Средняя: O(log N)
             - Худшая: O(N)
         """
-        self.root = self._delete_recursive(self.root, key)
-
-    def _delete_recursive(self, node: Optional[TreeNode],
-                          key: int) -> Optional[TreeNode]:
+        # Путь от корня до физически удаляемого узла: размеры поддеревьев
+        # на нем уменьшаются только если ключ найден
+        path = []
+        node = self.root
+        while node is not None and node.val != key:
+            path.append(node)
+            node = node.left if key < node.val else node.right
         if node is None:
-            return node
+            return
 
-        if key < node.val:
-            node.left = self._delete_recursive(node.left, key)
-        elif key > node.val:
-            node.right = self._delete_recursive(node.right, key)
-        else:
-            # Случай 1: Нет детей или один ребенок
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-
-            # Случай 2: Два ребенка
-            # Находим минимальный элемент в правом поддереве
-            temp = self.find_min(node.right)
-            node.val = temp.val
-            # Удаляем этот минимальный элемент
-            node.right = self._delete_recursive(node.right, temp.val)
+        # Случай 2: Два ребенка
+        # Переносим значение минимального элемента правого поддерева
+        # и удаляем его узел (у него нет левого ребенка)
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.val = successor.val
+            node = successor
 
-        return node
+        for ancestor in path:
+            ancestor.size -= 1
+        parent = path[-1] if path else None
+
+        # Случай 1: Нет детей или один ребенок
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
 
     def is_valid_bst(self) -> bool:
         """
@@ -115,15 +243,101 @@ class BinarySearchTree:
 
         Сложность: O(N), так как посещаем каждый узел.
         """
-        return self._is_valid_helper(self.root, float('-inf'), float('inf'))
+        # Стек из (узел, нижняя граница, верхняя граница)
+        stack = [(self.root, float('-inf'), float('inf'))]
+        while stack:
+            node, min_val, max_val = stack.pop()
+            if node is None:
+                continue
+            if not (min_val < node.val < max_val):
+                return False
+            stack.append((node.left, min_val, node.val))
+            stack.append((node.right, node.val, max_val))
+        return True
 
-    def _is_valid_helper(self, node: Optional[TreeNode],
-                         min_val: float, max_val: float) -> bool:
-        if node is None:
-            return True
+    def select(self, k: int) -> int:
+        """
+        Возвращает k-й по возрастанию ключ (k с нуля, как индекс
+        в отсортированном списке).
 
-        if not (min_val < node.val < max_val):
-            return False
+        Временная сложность: O(H).
+        """
+        if not 0 <= k < len(self):
+            raise IndexError('select index out of range')
+        node = self.root
+        while True:
+            left_size = self._size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.val
+            else:
+                k -= left_size + 1
+                node = node.right
 
-        return (self._is_valid_helper(node.left, min_val, node.val) and
-                self._is_valid_helper(node.right, node.val, max_val))
+    def rank(self, key: int) -> int:
+        """
+        Количество ключей, строго меньших key.
+
+        Временная сложность: O(H).
+        """
+        result = 0
+        node = self.root
+        while node is not None:
+            if key <= node.val:
+                node = node.left
+            else:
+                result += self._size(node.left) + 1
+                node = node.right
+        return result
+
+    def _count_not_greater(self, key: int) -> int:
+        """Количество ключей, не больших key. Сложность: O(H)."""
+        result = 0
+        node = self.root
+        while node is not None:
+            if key < node.val:
+                node = node.left
+            else:
+                result += self._size(node.left) + 1
+                node = node.right
+        return result
+
+    def count_range(self, lo: int, hi: int) -> int:
+        """
+        Количество ключей в отрезке [lo, hi].
+
+        Временная сложность: O(H).
+        """
+        if lo > hi:
+            return 0
+        return self._count_not_greater(hi) - self.rank(lo)
+
+    def range_iter(self, lo: int, hi: int) -> Iterator[int]:
+        """
+        Лениво выдает ключи из отрезка [lo, hi] по возрастанию.
+        Поддеревья вне отрезка не посещаются.
+
+        Временная сложность: O(H + K), K - количество выданных ключей.
+        """
+        stack = []
+        node = self.root
+        # Спуск к наименьшему ключу >= lo; в стеке - узлы, ждущие выдачи
+        while node is not None:
+            if node.val >= lo:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            if node.val > hi:
+                return
+            yield node.val
+            node = node.right
+            while node is not None:
+                if node.val >= lo:
+                    stack.append(node)
+                    node = node.left
+                else:
+                    node = node.right
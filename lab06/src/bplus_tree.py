@@ -0,0 +1,363 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+
+class BPlusLeaf:
+    """
+    Лист B+-дерева: отсортированный список ключей и ссылка на следующий
+    лист для последовательного просмотра диапазонов.
+    """
+
+    __slots__ = ('keys', 'next')
+
+    def __init__(self, keys: Optional[List[int]] = None) -> None:
+        self.keys: List[int] = keys if keys is not None else []
+        self.next: Optional['BPlusLeaf'] = None
+
+
+class BPlusInternal:
+    """
+    Внутренний узел: keys[i] разделяет children[i] (ключи < keys[i])
+    и children[i + 1] (ключи >= keys[i]).
+    """
+
+    __slots__ = ('keys', 'children')
+
+    def __init__(self, keys: List[int],
+                 children: List[Union['BPlusInternal', BPlusLeaf]]) -> None:
+        self.keys: List[int] = keys
+        self.children: List[Union['BPlusInternal', BPlusLeaf]] = children
+
+
+BPlusNode = Union[BPlusInternal, BPlusLeaf]
+
+
+class BPlusTree:
+    """
+    B+-дерево в памяти. Узел хранит до fanout ключей (лист) или до fanout
+    детей (внутренний узел) в обычном списке, поиск внутри узла - bisect.
+    Высота дерева log_fanout(N), поэтому на поиск приходится в несколько
+    раз меньше переходов по ссылкам, чем в бинарном дереве.
+    API совпадает с BinarySearchTree; повторные ключи не вставляются.
+    """
+
+    def __init__(self, fanout: int = 64) -> None:
+        if fanout < 4:
+            raise ValueError('fanout must be at least 4')
+        self.fanout: int = fanout
+        self.min_leaf_keys: int = fanout // 2
+        self.min_children: int = (fanout + 1) // 2
+        self.root: BPlusNode = BPlusLeaf()
+        self.size: int = 0
+        # Количество уровней внутренних узлов: все листья на этой глубине,
+        # поэтому спуск обходится без проверки типа узла
+        self.depth: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[int]:
+        """Ключи по возрастанию - проход по цепочке листьев."""
+        leaf: Optional[BPlusLeaf] = self._first_leaf()
+        while leaf is not None:
+            yield from leaf.keys
+            leaf = leaf.next
+
+    def _first_leaf(self) -> BPlusLeaf:
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[0]
+        return node
+
+    def _find_leaf(self, key: int) -> BPlusLeaf:
+        node = self.root
+        for _ in range(self.depth):
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def search(self, key: int) -> Optional[BPlusLeaf]:
+        """
+        Ищет лист, содержащий значение.
+
+        Временная сложность: O(log N) - log_fanout(N) узлов
+        и бинарный поиск в каждом.
+        """
+        leaf = self._find_leaf(key)
+        keys = leaf.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return leaf
+        return None
+
+    def find_min(self) -> Optional[int]:
+        """
+        Минимальный ключ дерева.
+
+        Сложность: O(H), где H - высота дерева.
+        """
+        keys = self._first_leaf().keys
+        return keys[0] if keys else None
+
+    def insert(self, key: int) -> None:
+        """
+        Вставляет значение. Переполненный узел делится пополам,
+        разделитель поднимается в родителя.
+
+        Временная сложность: O(fanout * log N).
+        """
+        path: List[Tuple[BPlusInternal, int]] = []
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            index = bisect_right(node.keys, key)
+            path.append((node, index))
+            node = node.children[index]
+
+        keys = node.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return
+        keys.insert(i, key)
+        self.size += 1
+        if len(keys) <= self.fanout:
+            return
+
+        # Деление листа: правая половина уходит в новый лист
+        mid = len(keys) // 2
+        right: BPlusNode = BPlusLeaf(keys[mid:])
+        del keys[mid:]
+        right.next = node.next
+        node.next = right
+        separator = right.keys[0]
+
+        while path:
+            parent, index = path.pop()
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, right)
+            if len(parent.children) <= self.fanout:
+                return
+            # Деление внутреннего узла: средний ключ поднимается выше
+            mid = len(parent.keys) // 2
+            separator = parent.keys[mid]
+            right = BPlusInternal(parent.keys[mid + 1:],
+                                  parent.children[mid + 1:])
+            del parent.keys[mid:]
+            del parent.children[mid + 1:]
+
+        self.root = BPlusInternal([separator], [self.root, right])
+        self.depth += 1
+
+    def delete(self, key: int) -> None:
+        """
+        Удаляет значение. Недозаполненный узел занимает ключ у соседа
+        или сливается с ним.
+
+        Временная сложность: O(fanout * log N).
+        """
+        path: List[Tuple[BPlusInternal, int]] = []
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            index = bisect_right(node.keys, key)
+            path.append((node, index))
+            node = node.children[index]
+
+        keys = node.keys
+        i = bisect_left(keys, key)
+        if i == len(keys) or keys[i] != key:
+            return
+        del keys[i]
+        self.size -= 1
+
+        child: BPlusNode = node
+        while path:
+            parent, index = path.pop()
+            if isinstance(child, BPlusLeaf):
+                if len(child.keys) >= self.min_leaf_keys:
+                    return
+                self._fix_leaf(parent, index)
+            else:
+                if len(child.children) >= self.min_children:
+                    return
+                self._fix_internal(parent, index)
+            child = parent
+
+        # Корень с единственным ребенком больше не нужен
+        if isinstance(self.root, BPlusInternal) and \
+                len(self.root.children) == 1:
+            self.root = self.root.children[0]
+            self.depth -= 1
+
+    def _fix_leaf(self, parent: BPlusInternal, index: int) -> None:
+        """Восстанавливает заполнение листа parent.children[index]."""
+        leaf = parent.children[index]
+        left = parent.children[index - 1] if index > 0 else None
+        right = parent.children[index + 1] \
+            if index + 1 < len(parent.children) else None
+
+        if left is not None and len(left.keys) > self.min_leaf_keys:
+            leaf.keys.insert(0, left.keys.pop())
+            parent.keys[index - 1] = leaf.keys[0]
+        elif right is not None and len(right.keys) > self.min_leaf_keys:
+            leaf.keys.append(right.keys.pop(0))
+            parent.keys[index] = right.keys[0]
+        elif left is not None:
+            left.keys.extend(leaf.keys)
+            left.next = leaf.next
+            del parent.keys[index - 1]
+            del parent.children[index]
+        else:
+            leaf.keys.extend(right.keys)
+            leaf.next = right.next
+            del parent.keys[index]
+            del parent.children[index + 1]
+
+    def _fix_internal(self, parent: BPlusInternal, index: int) -> None:
+        """Восстанавливает заполнение узла parent.children[index]."""
+        node = parent.children[index]
+        left = parent.children[index - 1] if index > 0 else None
+        right = parent.children[index + 1] \
+            if index + 1 < len(parent.children) else None
+
+        if left is not None and len(left.children) > self.min_children:
+            # Разделитель родителя опускается, крайний ключ соседа
+            # поднимается на его место
+            node.keys.insert(0, parent.keys[index - 1])
+            parent.keys[index - 1] = left.keys.pop()
+            node.children.insert(0, left.children.pop())
+        elif right is not None and len(right.children) > self.min_children:
+            node.keys.append(parent.keys[index])
+            parent.keys[index] = right.keys.pop(0)
+            node.children.append(right.children.pop(0))
+        elif left is not None:
+            left.keys.append(parent.keys[index - 1])
+            left.keys.extend(node.keys)
+            left.children.extend(node.children)
+            del parent.keys[index - 1]
+            del parent.children[index]
+        else:
+            node.keys.append(parent.keys[index])
+            node.keys.extend(right.keys)
+            node.children.extend(right.children)
+            del parent.keys[index]
+            del parent.children[index + 1]
+
+    def range_iter(self, lo: int, hi: int) -> Iterator[int]:
+        """
+        Лениво выдает ключи из отрезка [lo, hi] по возрастанию: спуск
+        к первому листу и проход по цепочке листьев.
+
+        Временная сложность: O(log N + K), K - количество выданных ключей.
+        """
+        leaf: Optional[BPlusLeaf] = self._find_leaf(lo)
+        i = bisect_left(leaf.keys, lo)
+        while leaf is not None:
+            keys = leaf.keys
+            end = bisect_right(keys, hi)
+            yield from keys[i:end]
+            if end < len(keys):
+                return
+            leaf = leaf.next
+            i = 0
+
+    @classmethod
+    def from_sorted(cls, keys: Sequence[int],
+                    fanout: int = 64) -> 'BPlusTree':
+        """
+        Пакетная загрузка из строго возрастающих ключей: листья
+        заполняются целиком и связываются, затем уровни внутренних узлов
+        строятся снизу вверх.
+
+        Временная сложность: O(N).
+        """
+        for i in range(1, len(keys)):
+            if not keys[i - 1] < keys[i]:
+                raise ValueError('keys must be strictly increasing')
+        tree = cls(fanout)
+        if not keys:
+            return tree
+
+        # Уровень - список (узел, минимальный ключ поддерева)
+        level: List[Tuple[BPlusNode, int]] = []
+        previous: Optional[BPlusLeaf] = None
+        for lo, hi in cls._chunks(len(keys), fanout):
+            leaf = BPlusLeaf(list(keys[lo:hi]))
+            if previous is not None:
+                previous.next = leaf
+            previous = leaf
+            level.append((leaf, leaf.keys[0]))
+
+        while len(level) > 1:
+            parents: List[Tuple[BPlusNode, int]] = []
+            for lo, hi in cls._chunks(len(level), fanout):
+                group = level[lo:hi]
+                node = BPlusInternal([low for _, low in group[1:]],
+                                     [child for child, _ in group])
+                parents.append((node, group[0][1]))
+            level = parents
+            tree.depth += 1
+
+        tree.root = level[0][0]
+        tree.size = len(keys)
+        return tree
+
+    @staticmethod
+    def _chunks(count: int, capacity: int) -> List[Tuple[int, int]]:
+        """
+        Делит count элементов на минимальное число групп не больше
+        capacity, размеры групп отличаются не более чем на 1 - поэтому
+        каждая группа заполнена хотя бы наполовину.
+        """
+        groups = -(-count // capacity)
+        base, extra = divmod(count, groups)
+        bounds = []
+        lo = 0
+        for g in range(groups):
+            hi = lo + base + (1 if g < extra else 0)
+            bounds.append((lo, hi))
+            lo = hi
+        return bounds
+
+    @property
+    def height(self) -> int:
+        """Количество уровней дерева."""
+        return self.depth + 1
+
+    def is_valid_bst(self) -> bool:
+        """
+        Проверяет инварианты B+-дерева (имя - для совместимости с
+        BinarySearchTree): порядок ключей, границы разделителей,
+        заполнение узлов, одинаковую глубину листьев и цепочку листьев.
+
+        Сложность: O(N).
+        """
+        leaves: List[BPlusLeaf] = []
+        # Стек из (узел, нижняя граница, верхняя граница, глубина)
+        stack = [(self.root, float('-inf'), float('inf'), 0)]
+        depths = set()
+        while stack:
+            node, lo, hi, depth = stack.pop()
+            keys = node.keys
+            if any(not a < b for a, b in zip(keys, keys[1:])):
+                return False
+            if keys and not (lo <= keys[0] and keys[-1] < hi):
+                return False
+            is_root = node is self.root
+            if isinstance(node, BPlusLeaf):
+                if len(keys) > self.fanout or \
+                        (not is_root and len(keys) < self.min_leaf_keys):
+                    return False
+                depths.add(depth)
+                leaves.append(node)
+                continue
+            children = node.children
+            if len(children) != len(keys) + 1 or \
+                    len(children) > self.fanout or \
+                    len(children) < (2 if is_root else self.min_children):
+                return False
+            bounds = [lo] + keys + [hi]
+            # В обратном порядке, чтобы листья собирались слева направо
+            for i in range(len(children) - 1, -1, -1):
+                stack.append((children[i], bounds[i], bounds[i + 1],
+                              depth + 1))
+        chained = all(a.next is b for a, b in zip(leaves, leaves[1:]))
+        return depths == {self.depth} and chained and leaves[-1].next is None \
+            and sum(len(leaf.keys) for leaf in leaves) == self.size
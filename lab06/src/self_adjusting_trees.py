@@ -0,0 +1,291 @@
+import random
+from typing import Optional
+from binary_search_tree import BinarySearchTree, TreeNode
+
+
+class ParentTreeNode(TreeNode):
+    """
+    Узел со ссылкой на родителя - для поворотов снизу вверх.
+    """
+
+    __slots__ = ('parent',)
+
+    def __init__(self, key: int,
+                 parent: Optional['ParentTreeNode'] = None) -> None:
+        super().__init__(key)
+        self.parent: Optional['ParentTreeNode'] = parent
+        self.left: Optional['ParentTreeNode'] = None
+        self.right: Optional['ParentTreeNode'] = None
+
+
+class TreapNode(ParentTreeNode):
+    """
+    Узел декартова дерева: ключ упорядочен как в BST, priority - как
+    в куче (у родителя не меньше, чем у детей).
+    """
+
+    __slots__ = ('priority',)
+
+    def __init__(self, key: int, priority: float,
+                 parent: Optional['TreapNode'] = None) -> None:
+        super().__init__(key, parent)
+        self.priority: float = priority
+
+
+class _RotatingTree(BinarySearchTree):
+    """
+    Общие операции деревьев, которые поднимают узлы поворотами.
+    Повторные ключи не вставляются.
+    """
+
+    def _rotate_up(self, node: ParentTreeNode) -> None:
+        """
+        Поворачивает ребро (node, родитель): node занимает место
+        родителя. Размеры поддеревьев пересчитываются.
+
+        Сложность: O(1).
+        """
+        parent = node.parent
+        grand = parent.parent
+        if node is parent.left:
+            parent.left = node.right
+            if node.right is not None:
+                node.right.parent = parent
+            node.right = parent
+        else:
+            parent.right = node.left
+            if node.left is not None:
+                node.left.parent = parent
+            node.left = parent
+        parent.parent = node
+        node.parent = grand
+        if grand is None:
+            self.root = node
+        elif grand.left is parent:
+            grand.left = node
+        else:
+            grand.right = node
+        node.size = parent.size
+        parent.size = 1 + self._size(parent.left) + self._size(parent.right)
+
+    def _descend(self, key: int) -> Optional[ParentTreeNode]:
+        """Узел с ключом key или последний узел на пути поиска."""
+        node = self.root
+        last = None
+        while node is not None:
+            last = node
+            if key < node.val:
+                node = node.left
+            elif key > node.val:
+                node = node.right
+            else:
+                return node
+        return last
+
+    def _attach(self, parent: Optional[ParentTreeNode],
+                node: ParentTreeNode) -> None:
+        """Подвешивает новый лист к parent и обновляет размеры на пути."""
+        node.parent = parent
+        if parent is None:
+            self.root = node
+            return
+        if node.val < parent.val:
+            parent.left = node
+        else:
+            parent.right = node
+        while parent is not None:
+            parent.size += 1
+            parent = parent.parent
+
+    def _detach_ancestors(self, node: ParentTreeNode) -> None:
+        """Уменьшает размеры поддеревьев всех предков node."""
+        ancestor = node.parent
+        while ancestor is not None:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+
+
+class SplayTree(_RotatingTree):
+    """
+    Расширяющееся (splay) дерево: каждый найденный или вставленный
+    узел поворотами поднимается в корень, поэтому часто запрашиваемые
+    ключи оказываются у корня.
+    Амортизированная сложность операций: O(log N).
+    """
+
+    def _splay(self, node: ParentTreeNode) -> None:
+        """
+        Поднимает node в корень его дерева поворотами zig, zig-zig
+        и zig-zag.
+
+        Амортизированная сложность: O(log N).
+        """
+        while node.parent is not None:
+            parent = node.parent
+            grand = parent.parent
+            if grand is None:
+                self._rotate_up(node)
+            elif (node is parent.left) == (parent is grand.left):
+                self._rotate_up(parent)
+                self._rotate_up(node)
+            else:
+                self._rotate_up(node)
+                self._rotate_up(node)
+
+    def search(self, key: int) -> Optional[ParentTreeNode]:
+        """
+        Ищет узел и поднимает в корень его (или последний узел пути).
+
+        Амортизированная сложность: O(log N).
+        """
+        node = self._descend(key)
+        if node is None:
+            return None
+        self._splay(node)
+        return node if node.val == key else None
+
+    def insert(self, key: int) -> None:
+        """
+        Вставляет значение как в BST и поднимает новый узел в корень.
+
+        Амортизированная сложность: O(log N).
+        """
+        parent = self._descend(key)
+        if parent is not None and parent.val == key:
+            self._splay(parent)
+            return
+        node = ParentTreeNode(key)
+        self._attach(parent, node)
+        self._splay(node)
+
+    def delete(self, key: int) -> None:
+        """
+        Поднимает удаляемый узел в корень, затем поднимает максимум
+        левого поддерева и подвешивает к нему правое поддерево.
+
+        Амортизированная сложность: O(log N).
+        """
+        root = self.search(key)
+        if root is None:
+            return
+        left, right = root.left, root.right
+        if left is None:
+            self.root = right
+            if right is not None:
+                right.parent = None
+            return
+        left.parent = None
+        self.root = left
+        largest = left
+        while largest.right is not None:
+            largest = largest.right
+        self._splay(largest)
+        largest.right = right
+        if right is not None:
+            right.parent = largest
+        largest.size += self._size(right)
+
+    def _build_node(self, key: int, parent: Optional[ParentTreeNode],
+                    count: int, depth: int,
+                    max_depth: int) -> ParentTreeNode:
+        node = ParentTreeNode(key, parent)
+        node.size = count
+        return node
+
+
+class Treap(_RotatingTree):
+    """
+    Декартово дерево (treap): BST по ключам и куча по приоритетам.
+    При случайных приоритетах ожидаемая высота O(log N).
+    С by_frequency=True каждое успешное обращение увеличивает приоритет
+    узла на 1 и поднимает его, поэтому частые ключи оказываются у корня.
+    """
+
+    def __init__(self, by_frequency: bool = False,
+                 seed: Optional[int] = None) -> None:
+        super().__init__()
+        self.by_frequency: bool = by_frequency
+        self._rng = random.Random(seed)
+
+    def _bubble_up(self, node: TreapNode) -> None:
+        """Поднимает узел, пока его приоритет больше, чем у родителя."""
+        while node.parent is not None and \
+                node.priority > node.parent.priority:
+            self._rotate_up(node)
+
+    def search(self, key: int) -> Optional[TreapNode]:
+        """
+        Ищет узел с заданным значением.
+
+        Временная сложность: O(log N) в среднем.
+        """
+        node = super().search(key)
+        if node is not None and self.by_frequency:
+            node.priority += 1
+            self._bubble_up(node)
+        return node
+
+    def insert(self, key: int) -> None:
+        """
+        Вставляет лист со случайным приоритетом и поднимает его
+        поворотами до восстановления свойства кучи.
+
+        Временная сложность: O(log N) в среднем.
+        """
+        parent = self._descend(key)
+        if parent is not None and parent.val == key:
+            return
+        node = TreapNode(key, self._rng.random())
+        self._attach(parent, node)
+        self._bubble_up(node)
+
+    def delete(self, key: int) -> None:
+        """
+        Опускает узел поворотами (вверх поднимается ребенок с большим
+        приоритетом), пока он не станет листом, затем отрезает его.
+
+        Временная сложность: O(log N) в среднем.
+        """
+        node = super().search(key)
+        if node is None:
+            return
+        while node.left is not None or node.right is not None:
+            if node.right is None or (node.left is not None and
+                                      node.left.priority >
+                                      node.right.priority):
+                self._rotate_up(node.left)
+            else:
+                self._rotate_up(node.right)
+        self._detach_ancestors(node)
+        parent = node.parent
+        if parent is None:
+            self.root = None
+        elif parent.left is node:
+            parent.left = None
+        else:
+            parent.right = None
+
+    def _build_node(self, key: int, parent: Optional[TreapNode],
+                    count: int, depth: int, max_depth: int) -> TreapNode:
+        # Приоритет убывает с глубиной, поэтому свойство кучи выполнено
+        node = TreapNode(key, max_depth - depth + self._rng.random(),
+                         parent)
+        node.size = count
+        return node
+
+    def is_heap_ordered(self) -> bool:
+        """
+        Проверяет свойство кучи по приоритетам.
+
+        Сложность: O(N).
+        """
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            for child in (node.left, node.right):
+                if child is not None:
+                    if child.priority > node.priority or \
+                            child.parent is not node:
+                        return False
+                    stack.append(child)
+        return True
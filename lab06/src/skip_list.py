@@ -0,0 +1,241 @@
+import random
+import threading
+from typing import Iterator, List, Optional
+
+
+class SkipListNode:
+    """
+    Узел списка с пропусками: forward[i] - следующий узел на уровне i.
+    """
+
+    __slots__ = ('val', 'forward')
+
+    def __init__(self, key: Optional[int], level: int) -> None:
+        self.val: Optional[int] = key
+        self.forward: List[Optional['SkipListNode']] = [None] * level
+
+
+class SkipList:
+    """
+    Список с пропусками (skip list): упорядоченное множество без
+    перебалансировки. Узел попадает на уровень i + 1 с вероятностью p,
+    поэтому ожидаемая высота - log_{1/p}(N).
+    API совпадает с BinarySearchTree; повторные ключи не вставляются.
+    """
+
+    MAX_LEVEL = 32
+
+    def __init__(self, p: float = 0.5, seed: Optional[int] = None) -> None:
+        if not 0 < p < 1:
+            raise ValueError('p must be in (0, 1)')
+        self.p: float = p
+        self.head = SkipListNode(None, self.MAX_LEVEL)
+        # Количество используемых уровней
+        self.level: int = 1
+        self.size: int = 0
+        self._rng = random.Random(seed)
+        # Палец: предшественники последнего найденного ключа по уровням
+        self._finger: List[SkipListNode] = [self.head] * self.MAX_LEVEL
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[int]:
+        """Ключи по возрастанию - проход по нижнему уровню."""
+        node = self.head.forward[0]
+        while node is not None:
+            yield node.val
+            node = node.forward[0]
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < self.MAX_LEVEL and self._rng.random() < self.p:
+            level += 1
+        return level
+
+    def _predecessors(self, key: int) -> List[SkipListNode]:
+        """
+        Для каждого уровня - последний узел с ключом меньше key.
+
+        Временная сложность: O(log N) в среднем.
+        """
+        update = [self.head] * self.MAX_LEVEL
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            nxt = node.forward[i]
+            while nxt is not None and nxt.val < key:
+                node = nxt
+                nxt = node.forward[i]
+            update[i] = node
+        return update
+
+    def search(self, key: int) -> Optional[SkipListNode]:
+        """
+        Ищет узел с заданным значением.
+
+        Временная сложность: O(log N) в среднем.
+        """
+        node = self.head
+        nxt = None
+        for i in range(self.level - 1, -1, -1):
+            nxt = node.forward[i]
+            while nxt is not None and nxt.val < key:
+                node = nxt
+                nxt = node.forward[i]
+        # Используется уже прочитанная ссылка: повторное чтение
+        # node.forward[0] могло бы увидеть узел, вставленный после проверки
+        return nxt if nxt is not None and nxt.val == key else None
+
+    def finger_search(self, key: int) -> Optional[SkipListNode]:
+        """
+        Поиск от "пальца" - предшественников предыдущего найденного ключа.
+        Если key больше предыдущего, подъем идет только до уровня, на
+        котором можно перепрыгнуть к key, поэтому серия близких запросов
+        по возрастанию обходится в O(log D), D - расстояние между ключами.
+        Иначе поиск начинается от головы.
+
+        Временная сложность: O(log D) в среднем для возрастающих запросов.
+        """
+        finger = self._finger
+        start = finger[0]
+        if start is not self.head and start.val >= key:
+            finger = self._predecessors(key)
+            self._finger = finger
+        else:
+            # Поднимаемся, пока уровнем выше можно продвинуться к key
+            top = 0
+            while top + 1 < self.level:
+                nxt = finger[top + 1].forward[top + 1]
+                if nxt is None or nxt.val >= key:
+                    break
+                top += 1
+            node = finger[top]
+            for i in range(top, -1, -1):
+                if finger[i] is not self.head and \
+                        (node is self.head or finger[i].val > node.val):
+                    node = finger[i]
+                nxt = node.forward[i]
+                while nxt is not None and nxt.val < key:
+                    node = nxt
+                    nxt = node.forward[i]
+                finger[i] = node
+        node = finger[0].forward[0]
+        return node if node is not None and node.val == key else None
+
+    def find_min(self) -> Optional[int]:
+        """
+        Минимальный ключ.
+
+        Сложность: O(1).
+        """
+        node = self.head.forward[0]
+        return node.val if node is not None else None
+
+    def insert(self, key: int) -> None:
+        """
+        Вставляет значение: уровень узла выбирается случайно, узел
+        вставляется в списки всех уровней до своего.
+
+        Временная сложность: O(log N) в среднем.
+        """
+        update = self._predecessors(key)
+        nxt = update[0].forward[0]
+        if nxt is not None and nxt.val == key:
+            return
+        level = self._random_level()
+        if level > self.level:
+            self.level = level
+        node = SkipListNode(key, level)
+        for i in range(level):
+            node.forward[i] = update[i].forward[i]
+        # Узел связывается снизу вверх, когда его ссылки уже заполнены:
+        # читатель без блокировки видит либо старый список, либо новый
+        for i in range(level):
+            update[i].forward[i] = node
+        self.size += 1
+
+    def delete(self, key: int) -> None:
+        """
+        Удаляет значение из списков всех уровней.
+
+        Временная сложность: O(log N) в среднем.
+        """
+        update = self._predecessors(key)
+        node = update[0].forward[0]
+        if node is None or node.val != key:
+            return
+        # Сверху вниз; ссылки удаленного узла сохраняются, чтобы читатель,
+        # стоящий на нем, мог продолжить проход
+        for i in range(len(node.forward) - 1, -1, -1):
+            update[i].forward[i] = node.forward[i]
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        # Палец мог указывать на удаленный узел
+        self._finger = [self.head] * self.MAX_LEVEL
+
+    def range_iter(self, lo: int, hi: int) -> Iterator[int]:
+        """
+        Лениво выдает ключи из отрезка [lo, hi] по возрастанию.
+
+        Временная сложность: O(log N + K), K - количество выданных ключей.
+        """
+        node = self._predecessors(lo)[0].forward[0]
+        while node is not None and node.val <= hi:
+            yield node.val
+            node = node.forward[0]
+
+    def is_valid_bst(self) -> bool:
+        """
+        Проверяет упорядоченность всех уровней и то, что каждый уровень -
+        подсписок нижнего (имя - для совместимости с BinarySearchTree).
+
+        Сложность: O(N * H).
+        """
+        below = None
+        for i in range(self.MAX_LEVEL):
+            keys = []
+            node = self.head.forward[i]
+            while node is not None:
+                keys.append(node.val)
+                node = node.forward[i]
+            if any(not a < b for a, b in zip(keys, keys[1:])):
+                return False
+            if below is not None and not set(keys) <= below:
+                return False
+            if i == 0 and len(keys) != self.size:
+                return False
+            if i >= self.level and keys:
+                return False
+            below = set(keys)
+        return True
+
+
+class ConcurrentSkipList(SkipList):
+    """
+    Список с пропусками для одного писателя и многих читателей.
+    Изменения выполняются под блокировкой, чтение - без нее: вставка
+    заполняет ссылки нового узла до того, как связать его со списком,
+    а удаление не трогает ссылки удаленного узла. Присваивание элемента
+    списка атомарно в CPython, поэтому читатель всегда идет по корректной
+    цепочке узлов.
+    """
+
+    def __init__(self, p: float = 0.5, seed: Optional[int] = None) -> None:
+        super().__init__(p, seed)
+        self.write_lock = threading.Lock()
+
+    def insert(self, key: int) -> None:
+        with self.write_lock:
+            super().insert(key)
+
+    def delete(self, key: int) -> None:
+        with self.write_lock:
+            super().delete(key)
+
+    def finger_search(self, key: int) -> Optional[SkipListNode]:
+        """
+        Палец - общее изменяемое состояние и может указывать на узел,
+        удаленный другим потоком, поэтому здесь это обычный поиск.
+        """
+        return self.search(key)
@@ -0,0 +1,154 @@
+"""
+Простые юнит-тесты сериализации деревьев в компактный двоичный формат.
+Тесты не используют pytest, можно запускать напрямую.
+Каждый тест возвращает True при успехе, иначе — False.
+"""
+
+import os
+import random
+import tempfile
+from typing import Optional
+from balanced_trees import AVLTree, RedBlackTree
+from binary_search_tree import BinarySearchTree, TreeNode
+from self_adjusting_trees import SplayTree, Treap
+from tree_serialization import (HEADER, dump, from_bytes, load,
+                                to_bytes)
+
+
+def shape(node: Optional[TreeNode]) -> Optional[tuple]:
+    """
+    Форма поддерева вместе со служебными полями узлов.
+    """
+    if node is None:
+        return None
+    return (node.val, node.size, getattr(node, 'height', None),
+            getattr(node, 'color', None), shape(node.left),
+            shape(node.right))
+
+
+def random_tree(tree_class, count: int, seed: int) -> BinarySearchTree:
+    """
+    Дерево из count случайных ключей (в том числе отрицательных).
+    """
+    rng = random.Random(seed)
+    tree = tree_class()
+    for key in rng.sample(range(-10 ** 15, 10 ** 15), count):
+        tree.insert(key)
+    return tree
+
+
+def test_round_trip_bytes() -> bool:
+    """
+    Форма, размеры поддеревьев, высоты и цвета совпадают после
+    to_bytes/from_bytes для всех видов деревьев.
+    """
+    for tree_class in (BinarySearchTree, AVLTree, RedBlackTree,
+                       SplayTree, Treap):
+        tree = random_tree(tree_class, 300, seed=1)
+        restored = from_bytes(to_bytes(tree), tree_class)
+        assert type(restored) is tree_class
+        assert shape(restored.root) == shape(tree.root)
+        assert restored.is_valid_bst()
+        assert list(restored) == list(tree)
+    return True
+
+
+def test_round_trip_file() -> bool:
+    """
+    Запись в файл и загрузка через отображение в память.
+    """
+    tree = random_tree(RedBlackTree, 1000, seed=2)
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        dump(tree, path)
+        assert os.path.getsize(path) == HEADER.size + 9 * len(tree)
+        restored = load(path, RedBlackTree)
+    finally:
+        os.remove(path)
+    assert shape(restored.root) == shape(tree.root)
+    return True
+
+
+def test_restored_tree_is_usable() -> bool:
+    """
+    Восстановленные деревья сохраняют свои инварианты при изменениях.
+    """
+    avl = from_bytes(to_bytes(random_tree(AVLTree, 200, seed=3)), AVLTree)
+    rb = from_bytes(to_bytes(random_tree(RedBlackTree, 200, seed=3)),
+                    RedBlackTree)
+    treap = from_bytes(to_bytes(random_tree(Treap, 200, seed=3)), Treap)
+    splay = from_bytes(to_bytes(random_tree(SplayTree, 200, seed=3)),
+                       SplayTree)
+    for key in range(100):
+        for tree in (avl, rb, treap, splay):
+            tree.insert(key)
+    for key in range(0, 100, 2):
+        for tree in (avl, rb, treap, splay):
+            tree.delete(key)
+    assert avl.is_balanced() and rb.is_balanced()
+    assert treap.is_heap_ordered()
+    assert splay.search(51) is not None and splay.root.val == 51
+    for tree in (avl, rb, treap, splay):
+        assert tree.is_valid_bst() and len(tree) == 250
+        assert tree.select(0) == min(tree)
+    return True
+
+
+def test_degenerate_and_empty() -> bool:
+    """
+    Пустое дерево и вырожденная цепочка (без рекурсии при загрузке).
+    """
+    empty = from_bytes(to_bytes(BinarySearchTree()))
+    assert empty.root is None and len(empty) == 0
+
+    chain = BinarySearchTree()
+    for key in range(3000):
+        chain.insert(key)
+    restored = from_bytes(to_bytes(chain))
+    assert len(restored) == 3000
+    assert list(restored) == list(range(3000))
+    return True
+
+
+def test_corrupted_snapshot() -> bool:
+    """
+    Чужие и обрезанные данные отвергаются с ValueError.
+    """
+    data = to_bytes(random_tree(BinarySearchTree, 10, seed=4))
+    for bad in (b'', b'not a snapshot at all', data[:-1]):
+        try:
+            from_bytes(bad)
+        except ValueError:
+            pass
+        else:
+            return False
+    return True
+
+
+if __name__ == "__main__":
+    all_tests = [
+        ("Round Trip Bytes", test_round_trip_bytes),
+        ("Round Trip File", test_round_trip_file),
+        ("Restored Tree Is Usable", test_restored_tree_is_usable),
+        ("Degenerate And Empty", test_degenerate_and_empty),
+        ("Corrupted Snapshot", test_corrupted_snapshot),
+    ]
+
+    passed = 0
+    total = len(all_tests)
+
+    for test_name, test_func in all_tests:
+        try:
+            result = test_func()
+            if result:
+                print(f"[✓] {test_name}: Пройден")
+                passed += 1
+            else:
+                print(f"[✗] {test_name}: Провал (функция вернула False)")
+        except AssertionError as e:
+            print(f"[✗] {test_name}: Ошибка утверждения -> {e}")
+        except Exception as e:
+            print(f"[✗] {test_name}: Исключение -> {e}")
+
+    print(f"\nРезультат: {passed}/{total} тестов пройдено.")
@@ -0,0 +1,154 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import List, Optional, Tuple, Type
+
+from balanced_trees import RED
+from binary_search_tree import BinarySearchTree, TreeNode
+
+# Заголовок: сигнатура, версия формата, количество узлов, глубина
+# нижнего уровня (нужна хуку _build_node)
+MAGIC = b'BSTSNAP1'
+VERSION = 1
+HEADER = struct.Struct('<8sIQI')
+
+# Биты байта структуры узла
+HAS_LEFT = 1
+HAS_RIGHT = 2
+IS_RED = 4
+
+
+def to_bytes(tree: BinarySearchTree) -> bytes:
+    """
+    Сериализует форму дерева: заголовок, затем ключи в прямом порядке
+    обхода (int64, little-endian), затем по байту на узел с флагами
+    HAS_LEFT, HAS_RIGHT и IS_RED (цвет узла красно-черного дерева).
+    Ключи лежат одним непрерывным блоком со смещения HEADER.size,
+    поэтому файл можно отобразить в память и читать ключи без копирования.
+    Узел занимает 9 байт.
+
+    Временная сложность: O(N).
+    """
+    keys = array('q')
+    flags = bytearray()
+    max_depth = 0
+    stack: List[Tuple[TreeNode, int]] = \
+        [(tree.root, 0)] if tree.root is not None else []
+    while stack:
+        node, depth = stack.pop()
+        if depth > max_depth:
+            max_depth = depth
+        keys.append(node.val)
+        flag = 0
+        if node.left is not None:
+            flag |= HAS_LEFT
+        if node.right is not None:
+            flag |= HAS_RIGHT
+            stack.append((node.right, depth + 1))
+        if node.left is not None:
+            stack.append((node.left, depth + 1))
+        if getattr(node, 'color', None) == RED:
+            flag |= IS_RED
+        flags.append(flag)
+    if sys.byteorder != 'little':
+        keys.byteswap()
+    header = HEADER.pack(MAGIC, VERSION, len(keys), max_depth)
+    return header + keys.tobytes() + bytes(flags)
+
+
+def from_bytes(data, tree_class: Type[BinarySearchTree] = BinarySearchTree
+               ) -> BinarySearchTree:
+    """
+    Восстанавливает дерево той же формы из буфера to_bytes (bytes,
+    memoryview или mmap). Ключи не сравниваются: байт флагов каждого
+    узла говорит, какие дети следуют за ним в прямом порядке.
+    Узлы создаются хуком _build_node (родитель, глубина), размеры
+    поддеревьев и высоты AVL пересчитываются через _update, цвет
+    красно-черного дерева берется из флагов. Приоритеты декартова дерева
+    не сохраняются - _build_node назначает их по глубине.
+
+    Временная сложность: O(N).
+    """
+    view = memoryview(data)
+    if len(view) < HEADER.size:
+        raise ValueError('truncated tree snapshot')
+    magic, version, n, max_depth = HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('not a tree snapshot')
+    keys_end = HEADER.size + 8 * n
+    if len(view) < keys_end + n:
+        raise ValueError('truncated tree snapshot')
+    if sys.byteorder == 'little':
+        keys = view[HEADER.size:keys_end].cast('q')
+    else:
+        keys = array('q', view[HEADER.size:keys_end].tobytes())
+        keys.byteswap()
+    flags = view[keys_end:keys_end + n]
+
+    tree = tree_class()
+    if n == 0:
+        return tree
+
+    build = tree._build_node
+    # Места для следующих узлов: (родитель, левый ли ребенок, глубина)
+    slots: List[Tuple[Optional[TreeNode], bool, int]] = [(None, False, 0)]
+    nodes: List[TreeNode] = []
+    for i in range(n):
+        if not slots:
+            raise ValueError('corrupted tree snapshot')
+        parent, is_left, depth = slots.pop()
+        node = build(keys[i], parent, 1, depth, max_depth)
+        if parent is None:
+            tree.root = node
+        elif is_left:
+            parent.left = node
+        else:
+            parent.right = node
+        flag = flags[i]
+        if flag & HAS_RIGHT:
+            slots.append((node, False, depth + 1))
+        if flag & HAS_LEFT:
+            slots.append((node, True, depth + 1))
+        nodes.append(node)
+    if slots:
+        raise ValueError('corrupted tree snapshot')
+
+    if hasattr(tree.root, 'color'):
+        for node, flag in zip(nodes, flags):
+            node.color = bool(flag & IS_RED)
+    # В прямом порядке дети идут после родителя, поэтому в обратном
+    # порядке поля детей уже пересчитаны
+    update = tree._update
+    for node in reversed(nodes):
+        update(node)
+    return tree
+
+
+def dump(tree: BinarySearchTree, path: str) -> None:
+    """
+    Записывает снимок дерева в файл.
+
+    Временная сложность: O(N).
+    """
+    with open(path, 'wb') as f:
+        f.write(to_bytes(tree))
+
+
+def load(path: str, tree_class: Type[BinarySearchTree] = BinarySearchTree
+         ) -> BinarySearchTree:
+    """
+    Загружает снимок из файла, отображенного в память: ключи читаются
+    прямо из отображения, без промежуточной копии файла.
+
+    Временная сложность: O(N).
+    """
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            raise ValueError('truncated tree snapshot')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return from_bytes(view, tree_class)
+            finally:
+                view.release()
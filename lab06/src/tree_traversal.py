@@ -1,4 +1,5 @@
-from typing import List, Optional
+from collections import deque
+from typing import Iterator, List, Optional
 from binary_search_tree import TreeNode
 
 
@@ -73,3 +74,117 @@ class TreeTraversal:
             curr = curr.right
 
         return res
+
+    @staticmethod
+    def iter_in_order(root: Optional[TreeNode]) -> Iterator[int]:
+        """
+        Ленивый центрированный обход: значения выдаются по одному,
+        стек хранит только путь от корня.
+
+        Сложность: O(N) по времени, O(H) по памяти.
+        """
+        stack: List[TreeNode] = []
+        curr = root
+        while curr is not None or stack:
+            while curr is not None:
+                stack.append(curr)
+                curr = curr.left
+            curr = stack.pop()
+            yield curr.val
+            curr = curr.right
+
+    @staticmethod
+    def iter_pre_order(root: Optional[TreeNode]) -> Iterator[int]:
+        """
+        Ленивый прямой обход.
+
+        Сложность: O(N) по времени, O(H) по памяти.
+        """
+        stack: List[TreeNode] = [root] if root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.val
+            # Правый ребенок кладется первым, чтобы левый вышел раньше
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    @staticmethod
+    def iter_post_order(root: Optional[TreeNode]) -> Iterator[int]:
+        """
+        Ленивый обратный обход с одним стеком: узел выдается, когда
+        его правое поддерево уже пройдено.
+
+        Сложность: O(N) по времени, O(H) по памяти.
+        """
+        stack: List[TreeNode] = []
+        last: Optional[TreeNode] = None
+        curr = root
+        while curr is not None or stack:
+            if curr is not None:
+                stack.append(curr)
+                curr = curr.left
+                continue
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                curr = top.right
+            else:
+                yield top.val
+                last = stack.pop()
+
+    @staticmethod
+    def iter_level_order(root: Optional[TreeNode]) -> Iterator[int]:
+        """
+        Ленивый обход в ширину (по уровням).
+
+        Сложность: O(N) по времени, O(W) по памяти, W - ширина уровня.
+        """
+        queue = deque([root] if root is not None else [])
+        while queue:
+            node = queue.popleft()
+            yield node.val
+            if node.left is not None:
+                queue.append(node.left)
+            if node.right is not None:
+                queue.append(node.right)
+
+    @staticmethod
+    def morris_in_order(root: Optional[TreeNode]) -> Iterator[int]:
+        """
+        Центрированный обход Морриса без стека: путь назад хранится во
+        временных ссылках right у предшественников ("прошивка").
+        Если генератор остановлен досрочно, обход дочитывается без выдачи
+        значений, и все временные ссылки снимаются - дерево
+        восстанавливается.
+
+        Сложность: O(N) по времени, O(1) дополнительной памяти.
+        """
+        steps = TreeTraversal._morris_steps(root)
+        try:
+            for node in steps:
+                yield node.val
+        finally:
+            for _ in steps:
+                pass
+
+    @staticmethod
+    def _morris_steps(root: Optional[TreeNode]) -> Iterator[TreeNode]:
+        curr = root
+        while curr is not None:
+            if curr.left is None:
+                yield curr
+                curr = curr.right
+                continue
+            pred = curr.left
+            while pred.right is not None and pred.right is not curr:
+                pred = pred.right
+            if pred.right is None:
+                # Первый визит: прошиваем путь назад и спускаемся влево
+                pred.right = curr
+                curr = curr.left
+            else:
+                # Второй визит: левое поддерево пройдено, снимаем прошивку
+                pred.right = None
+                yield curr
+                curr = curr.right
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 
 class MinHeap:
@@ -29,37 +29,45 @@ class MinHeap:
     def _sift_up(self, index: int) -> None:
         """
         Поднимает элемент вверх по дереву для восстановления свойств кучи.
+        Вместо обменов по пути сдвигается "дырка": большие родители
+        опускаются на ее место, элемент записывается один раз в конце.
 
         Временная сложность: O(log N) в худшем случае проход от листа до корня.
         """
-        while index > 0 and self.heap[index] < self.heap[self._parent(index)]:
-            parent_idx = self._parent(index)
-            self._swap(index, parent_idx)
-            index = parent_idx
+        heap = self.heap
+        value = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_val = heap[parent]
+            if not value < parent_val:
+                break
+            heap[index] = parent_val
+            index = parent
+        heap[index] = value
 
     def _sift_down(self, index: int) -> None:
         """
         Опускает элемент вниз по дереву для восстановления свойств кучи.
+        Дырка спускается на место меньшего потомка, элемент записывается
+        один раз в конце.
 
         Временная сложность: O(log N) - высота дерева.
         """
-        size = len(self.heap)
-        while True:
-            left = self._left_child(index)
-            right = self._right_child(index)
-            smallest = index
-
-            if left < size and self.heap[left] < self.heap[smallest]:
-                smallest = left
-
-            if right < size and self.heap[right] < self.heap[smallest]:
-                smallest = right
-
-            if smallest != index:
-                self._swap(index, smallest)
-                index = smallest
-            else:
+        heap = self.heap
+        size = len(heap)
+        value = heap[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size and heap[right] < heap[child]:
+                child = right
+            child_val = heap[child]
+            if not child_val < value:
                 break
+            heap[index] = child_val
+            index = child
+            child = 2 * index + 1
+        heap[index] = value
 
     def insert(self, value: int) -> None:
         """
@@ -96,6 +104,54 @@ class MinHeap:
         """
         return self.heap[0] if self.heap else None
 
+    def pushpop(self, value: int) -> int:
+        """
+        Вставляет элемент и сразу извлекает минимум - быстрее, чем
+        insert и extract по отдельности: если value не больше корня,
+        куча не меняется, иначе выполняется одно просеивание вниз.
+
+        Временная сложность: O(log N).
+        """
+        heap = self.heap
+        if heap and heap[0] < value:
+            value, heap[0] = heap[0], value
+            self._sift_down(0)
+        return value
+
+    def replace(self, value: int) -> Optional[int]:
+        """
+        Извлекает минимум и вставляет value одним просеиванием вниз.
+        В отличие от pushpop, возвращает прежний минимум, даже если он
+        больше value. Для пустой кучи просто вставляет value.
+
+        Временная сложность: O(log N).
+        """
+        heap = self.heap
+        if not heap:
+            heap.append(value)
+            return None
+        min_val = heap[0]
+        heap[0] = value
+        self._sift_down(0)
+        return min_val
+
+    def insert_many(self, values: Iterable[int]) -> None:
+        """
+        Вставляет пачку элементов. Если пачка не меньше кучи, вся куча
+        перестраивается алгоритмом Флойда за O(N + K), иначе каждый
+        элемент поднимается отдельно за O(K log(N + K)).
+        """
+        heap = self.heap
+        size = len(heap)
+        heap.extend(values)
+        added = len(heap) - size
+        if added >= size:
+            for i in range(len(heap) // 2 - 1, -1, -1):
+                self._sift_down(i)
+        else:
+            for i in range(size, len(heap)):
+                self._sift_up(i)
+
     def build_heap(self, array: List[int]) -> None:
         """
         Строит кучу из произвольного массива.
@@ -0,0 +1,375 @@
+from typing import List, Optional
+
+
+class DaryHeap:
+    """
+    Минимальная d-арная куча на основе массива: у узла i потомки
+    d*i + 1 ... d*i + d, родитель (i - 1) // d. Высота log_d(N), поэтому
+    вставка и уменьшение ключа дешевле, чем в бинарной куче, а извлечение
+    сравнивает до d потомков на каждом уровне.
+    """
+
+    def __init__(self, d: int = 4) -> None:
+        """Инициализация пустой кучи арности d."""
+        if d < 2:
+            raise ValueError('d must be at least 2')
+        self.d: int = d
+        self.heap: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def _sift_up(self, index: int) -> None:
+        """
+        Поднимает элемент: большие родители сдвигаются вниз, элемент
+        записывается один раз.
+
+        Временная сложность: O(log_d N).
+        """
+        heap, d = self.heap, self.d
+        value = heap[index]
+        while index > 0:
+            parent = (index - 1) // d
+            if not value < heap[parent]:
+                break
+            heap[index] = heap[parent]
+            index = parent
+        heap[index] = value
+
+    def _sift_down(self, index: int) -> None:
+        """
+        Опускает элемент на место наименьшего из d потомков.
+        Минимум среди потомков ищется встроенными min и index по срезу,
+        а не циклом Python.
+
+        Временная сложность: O(d * log_d N).
+        """
+        heap, d = self.heap, self.d
+        size = len(heap)
+        value = heap[index]
+        while True:
+            first = d * index + 1
+            if first >= size:
+                break
+            children = heap[first:first + d]
+            least = min(children)
+            if not least < value:
+                break
+            heap[index] = least
+            index = first + children.index(least)
+        heap[index] = value
+
+    def insert(self, value: int) -> None:
+        """
+        Вставляет элемент в кучу.
+
+        Временная сложность: O(log_d N).
+        """
+        self.heap.append(value)
+        self._sift_up(len(self.heap) - 1)
+
+    def extract(self) -> Optional[int]:
+        """
+        Удаляет и возвращает минимальный элемент (корень).
+
+        Временная сложность: O(d * log_d N).
+        """
+        if not self.heap:
+            return None
+        min_val = self.heap[0]
+        last_val = self.heap.pop()
+        if self.heap:
+            self.heap[0] = last_val
+            self._sift_down(0)
+        return min_val
+
+    def peek(self) -> Optional[int]:
+        """
+        Возвращает минимальный элемент без удаления.
+
+        Временная сложность: O(1).
+        """
+        return self.heap[0] if self.heap else None
+
+    def build_heap(self, array: List[int]) -> None:
+        """
+        Строит кучу из произвольного массива (просеивание вниз
+        с последнего узла, у которого есть потомки).
+
+        Временная сложность: O(N).
+        """
+        self.heap = array[:]
+        for i in range((len(self.heap) - 2) // self.d, -1, -1):
+            self._sift_down(i)
+
+
+class PairingNode:
+    """
+    Узел парной кучи: первый ребенок, следующий брат и prev - левый брат
+    или родитель (для самого левого ребенка).
+    """
+
+    __slots__ = ('val', 'child', 'sibling', 'prev')
+
+    def __init__(self, value: int) -> None:
+        self.val: int = value
+        self.child: Optional['PairingNode'] = None
+        self.sibling: Optional['PairingNode'] = None
+        self.prev: Optional['PairingNode'] = None
+
+
+class PairingHeap:
+    """
+    Парная куча (pairing heap): дерево с произвольным числом детей.
+    Вставка и слияние - O(1), извлечение минимума - O(log N)
+    амортизированно (двухпроходное попарное слияние детей корня),
+    уменьшение ключа - o(log N) амортизированно.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустой кучи."""
+        self.root: Optional[PairingNode] = None
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    @staticmethod
+    def _link(a: PairingNode, b: PairingNode) -> PairingNode:
+        """
+        Сливает два дерева: корень с большим ключом становится первым
+        ребенком другого. Сложность: O(1).
+        """
+        if b.val < a.val:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        a.sibling = None
+        a.prev = None
+        return a
+
+    def insert(self, value: int) -> PairingNode:
+        """
+        Вставляет элемент и возвращает его узел (для decrease_key).
+
+        Временная сложность: O(1).
+        """
+        node = PairingNode(value)
+        self.root = node if self.root is None else \
+            self._link(self.root, node)
+        self.size += 1
+        return node
+
+    def peek(self) -> Optional[int]:
+        """
+        Возвращает минимальный элемент без удаления.
+
+        Временная сложность: O(1).
+        """
+        return self.root.val if self.root is not None else None
+
+    def extract(self) -> Optional[int]:
+        """
+        Удаляет корень и сливает его детей: сначала попарно слева
+        направо, затем результаты справа налево.
+
+        Временная сложность: O(log N) амортизированно.
+        """
+        root = self.root
+        if root is None:
+            return None
+        self.root = self._merge_pairs(root.child)
+        self.size -= 1
+        return root.val
+
+    def _merge_pairs(self, first: Optional[PairingNode]
+                     ) -> Optional[PairingNode]:
+        """Двухпроходное слияние списка братьев (итеративно)."""
+        pairs: List[PairingNode] = []
+        node = first
+        while node is not None:
+            a = node
+            b = a.sibling
+            if b is None:
+                pairs.append(a)
+                break
+            node = b.sibling
+            pairs.append(self._link(a, b))
+        if not pairs:
+            return None
+        result = pairs.pop()
+        while pairs:
+            result = self._link(pairs.pop(), result)
+        result.prev = None
+        result.sibling = None
+        return result
+
+    def decrease_key(self, node: PairingNode, value: int) -> None:
+        """
+        Уменьшает ключ узла: поддерево узла отрезается от родителя
+        и сливается с корнем.
+
+        Временная сложность: O(1) фактически, o(log N) амортизированно.
+        """
+        if node.val < value:
+            raise ValueError('new value is greater than the current one')
+        node.val = value
+        if node is self.root:
+            return
+        # Вырезаем узел из списка братьев
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = None
+        node.sibling = None
+        self.root = self._link(self.root, node)
+
+    def meld(self, other: 'PairingHeap') -> None:
+        """
+        Забирает все элементы other (other становится пустой).
+
+        Временная сложность: O(1).
+        """
+        if other.root is not None:
+            self.root = other.root if self.root is None else \
+                self._link(self.root, other.root)
+        self.size += other.size
+        other.root = None
+        other.size = 0
+
+    def build_heap(self, array: List[int]) -> None:
+        """
+        Строит кучу из произвольного массива вставками по O(1).
+
+        Временная сложность: O(N).
+        """
+        self.root = None
+        self.size = 0
+        for value in array:
+            self.insert(value)
+
+
+class LeftistNode:
+    """
+    Узел левосторонней кучи: rank - длина правого пути до пустого
+    поддерева (s-value).
+    """
+
+    __slots__ = ('val', 'left', 'right', 'rank')
+
+    def __init__(self, value: int) -> None:
+        self.val: int = value
+        self.left: Optional['LeftistNode'] = None
+        self.right: Optional['LeftistNode'] = None
+        self.rank: int = 1
+
+
+def _rank(node: Optional[LeftistNode]) -> int:
+    """Ранг узла; пустое поддерево имеет ранг 0."""
+    return node.rank if node is not None else 0
+
+
+class LeftistHeap:
+    """
+    Левосторонняя куча (leftist heap): у каждого узла ранг левого
+    ребенка не меньше ранга правого, поэтому правый путь имеет длину
+    O(log N). Слияние идет только по правым путям двух куч, отсюда
+    meld, insert и extract за O(log N).
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустой кучи."""
+        self.root: Optional[LeftistNode] = None
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    @staticmethod
+    def _merge(a: Optional[LeftistNode],
+               b: Optional[LeftistNode]) -> Optional[LeftistNode]:
+        """
+        Сливает две кучи итеративно: спуск по правым путям с выбором
+        меньшего корня, затем подъем с пересчетом рангов и обменом
+        детей там, где левый ранг стал меньше правого.
+
+        Временная сложность: O(log N + log M).
+        """
+        path: List[LeftistNode] = []
+        while a is not None and b is not None:
+            if b.val < a.val:
+                a, b = b, a
+            path.append(a)
+            a = a.right
+        child = a if a is not None else b
+        for node in reversed(path):
+            node.right = child
+            if _rank(node.left) < _rank(child):
+                node.left, node.right = child, node.left
+            node.rank = _rank(node.right) + 1
+            child = node
+        return child
+
+    def insert(self, value: int) -> None:
+        """
+        Вставляет элемент слиянием с одноузловой кучей.
+
+        Временная сложность: O(log N).
+        """
+        self.root = self._merge(self.root, LeftistNode(value))
+        self.size += 1
+
+    def extract(self) -> Optional[int]:
+        """
+        Удаляет корень и сливает его поддеревья.
+
+        Временная сложность: O(log N).
+        """
+        root = self.root
+        if root is None:
+            return None
+        self.root = self._merge(root.left, root.right)
+        self.size -= 1
+        return root.val
+
+    def peek(self) -> Optional[int]:
+        """
+        Возвращает минимальный элемент без удаления.
+
+        Временная сложность: O(1).
+        """
+        return self.root.val if self.root is not None else None
+
+    def meld(self, other: 'LeftistHeap') -> None:
+        """
+        Забирает все элементы other (other становится пустой).
+
+        Временная сложность: O(log N + log M).
+        """
+        self.root = self._merge(self.root, other.root)
+        self.size += other.size
+        other.root = None
+        other.size = 0
+
+    def build_heap(self, array: List[int]) -> None:
+        """
+        Строит кучу попарными слияниями очереди одноузловых куч
+        (по уровням, как восходящая сортировка слиянием).
+
+        Временная сложность: O(N).
+        """
+        queue = [LeftistNode(value) for value in array]
+        while len(queue) > 1:
+            merged = [self._merge(queue[i], queue[i + 1])
+                      for i in range(0, len(queue) - 1, 2)]
+            if len(queue) % 2:
+                merged.append(queue[-1])
+            queue = merged
+        self.root = queue[0] if queue else None
+        self.size = len(array)
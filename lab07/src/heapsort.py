@@ -1,4 +1,5 @@
-from typing import List
+from itertools import islice
+from typing import Iterable, List, MutableSequence
 from asa_heap import MinHeap
 
 
@@ -24,3 +25,87 @@ def heapsort(array: List[int]) -> List[int]:
         sorted_array.append(val)
 
     return sorted_array
+
+
+def _sift_down_max(arr: MutableSequence[int], index: int, size: int) -> None:
+    """
+    Опускает элемент в max-куче arr[:size] ("дыркой", с одной записью
+    элемента в конце).
+
+    Временная сложность: O(log N).
+    """
+    value = arr[index]
+    child = 2 * index + 1
+    while child < size:
+        right = child + 1
+        if right < size and arr[child] < arr[right]:
+            child = right
+        child_val = arr[child]
+        if not value < child_val:
+            break
+        arr[index] = child_val
+        index = child
+        child = 2 * index + 1
+    arr[index] = value
+
+
+def heapsort_in_place(arr: MutableSequence[int]) -> None:
+    """
+    Сортирует список или array.array на месте: строит max-кучу,
+    затем N раз переносит максимум в конец неотсортированной части.
+
+    Временная сложность: O(N log N).
+    Пространственная: O(1) дополнительной памяти.
+    """
+    n = len(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        _sift_down_max(arr, i, n)
+    for end in range(n - 1, 0, -1):
+        arr[0], arr[end] = arr[end], arr[0]
+        _sift_down_max(arr, 0, end)
+
+
+def top_k(iterable: Iterable[int], k: int) -> List[int]:
+    """
+    k наибольших элементов по убыванию. Вход читается потоком через
+    MinHeap из k элементов: новый элемент больше корня вытесняет его
+    (pushpop).
+
+    Временная сложность: O(N log k).
+    Пространственная: O(k).
+    """
+    if k <= 0:
+        return []
+    it = iter(iterable)
+    heap = MinHeap()
+    heap.build_heap(list(islice(it, k)))
+    for value in it:
+        if heap.heap[0] < value:
+            heap.replace(value)
+    result = heap.heap
+    heapsort_in_place(result)
+    result.reverse()
+    return result
+
+
+def partial_sort(arr: MutableSequence[int], k: int) -> None:
+    """
+    Переставляет arr на месте так, что arr[:k] - k наименьших
+    элементов по возрастанию; порядок остальных не определен.
+    Max-куча из первых k элементов вытесняет свой максимум каждым
+    меньшим элементом хвоста, затем сортируется на месте.
+
+    Временная сложность: O(N log k).
+    Пространственная: O(1) дополнительной памяти.
+    """
+    n = len(arr)
+    k = max(0, min(k, n))
+    for i in range(k // 2 - 1, -1, -1):
+        _sift_down_max(arr, i, k)
+    for i in range(k, n):
+        if arr[i] < arr[0]:
+            arr[0], arr[i] = arr[i], arr[0]
+            _sift_down_max(arr, 0, k)
+    for end in range(k - 1, 0, -1):
+        arr[0], arr[end] = arr[end], arr[0]
+        _sift_down_max(arr, 0, end)
@@ -0,0 +1,202 @@
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class IndexedMinHeap:
+    """
+    Индексированная минимальная куча: хранит пары (приоритет, элемент)
+    и словарь "элемент -> позиция в массиве", поэтому приоритет
+    элемента можно изменить или удалить элемент за O(log N).
+    Элемент - любой хешируемый дескриптор (например, номер вершины),
+    приоритет - любое сравнимое значение. Каждый элемент хранится
+    в куче не более одного раза.
+    Арность d настраивается: при частых decrease_key выгоднее d = 4..8.
+    """
+
+    def __init__(self, d: int = 2) -> None:
+        """Инициализация пустой кучи арности d."""
+        if d < 2:
+            raise ValueError('d must be at least 2')
+        self.d: int = d
+        self.priorities: List[Any] = []
+        self.items: List[Hashable] = []
+        self.position: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.position
+
+    def contains(self, item: Hashable) -> bool:
+        """
+        Проверяет, есть ли элемент в куче.
+
+        Временная сложность: O(1).
+        """
+        return item in self.position
+
+    def priority(self, item: Hashable) -> Any:
+        """
+        Возвращает текущий приоритет элемента (KeyError, если его нет).
+
+        Временная сложность: O(1).
+        """
+        return self.priorities[self.position[item]]
+
+    def _sift_up(self, index: int) -> None:
+        """
+        Поднимает элемент: родители с большим приоритетом сдвигаются
+        вниз, элемент записывается один раз на освободившееся место.
+
+        Временная сложность: O(log N).
+        """
+        priorities, items, position = self.priorities, self.items, \
+            self.position
+        d = self.d
+        priority, item = priorities[index], items[index]
+        while index > 0:
+            parent = (index - 1) // d
+            if not priority < priorities[parent]:
+                break
+            priorities[index] = priorities[parent]
+            items[index] = items[parent]
+            position[items[index]] = index
+            index = parent
+        priorities[index] = priority
+        items[index] = item
+        position[item] = index
+
+    def _sift_down(self, index: int) -> None:
+        """
+        Опускает элемент на место меньшего из потомков.
+
+        Временная сложность: O(d * log_d N).
+        """
+        priorities, items, position = self.priorities, self.items, \
+            self.position
+        d = self.d
+        size = len(items)
+        priority, item = priorities[index], items[index]
+        while True:
+            first = d * index + 1
+            if first >= size:
+                break
+            child = first
+            for other in range(first + 1, min(first + d, size)):
+                if priorities[other] < priorities[child]:
+                    child = other
+            if not priorities[child] < priority:
+                break
+            priorities[index] = priorities[child]
+            items[index] = items[child]
+            position[items[index]] = index
+            index = child
+        priorities[index] = priority
+        items[index] = item
+        position[item] = index
+
+    def insert(self, item: Hashable, priority: Any) -> None:
+        """
+        Вставляет элемент с приоритетом.
+
+        Временная сложность: O(log N).
+        """
+        if item in self.position:
+            raise KeyError(f'item {item!r} is already in the heap')
+        self.priorities.append(priority)
+        self.items.append(item)
+        self._sift_up(len(self.items) - 1)
+
+    def extract(self) -> Optional[Tuple[Any, Hashable]]:
+        """
+        Удаляет и возвращает пару (приоритет, элемент) с минимальным
+        приоритетом.
+
+        Временная сложность: O(log N).
+        """
+        if not self.items:
+            return None
+        top = (self.priorities[0], self.items[0])
+        self._remove_at(0)
+        return top
+
+    def peek(self) -> Optional[Tuple[Any, Hashable]]:
+        """
+        Возвращает пару с минимальным приоритетом без удаления.
+
+        Временная сложность: O(1).
+        """
+        if not self.items:
+            return None
+        return self.priorities[0], self.items[0]
+
+    def build_heap(self, pairs: Iterable[Tuple[Any, Hashable]]) -> None:
+        """
+        Строит кучу из пар (приоритет, элемент) алгоритмом Флойда.
+
+        Временная сложность: O(N).
+        """
+        self.priorities = []
+        self.items = []
+        self.position = {}
+        for priority, item in pairs:
+            if item in self.position:
+                raise KeyError(f'item {item!r} is duplicated')
+            self.position[item] = len(self.items)
+            self.priorities.append(priority)
+            self.items.append(item)
+        for i in range((len(self.items) - 2) // self.d, -1, -1):
+            self._sift_down(i)
+
+    def decrease_key(self, item: Hashable, priority: Any) -> None:
+        """
+        Уменьшает приоритет элемента и поднимает его.
+
+        Временная сложность: O(log N).
+        """
+        index = self.position[item]
+        if self.priorities[index] < priority:
+            raise ValueError('new priority is greater than the current one')
+        self.priorities[index] = priority
+        self._sift_up(index)
+
+    def increase_key(self, item: Hashable, priority: Any) -> None:
+        """
+        Увеличивает приоритет элемента и опускает его.
+
+        Временная сложность: O(log N).
+        """
+        index = self.position[item]
+        if priority < self.priorities[index]:
+            raise ValueError('new priority is less than the current one')
+        self.priorities[index] = priority
+        self._sift_down(index)
+
+    def remove(self, item: Hashable) -> Any:
+        """
+        Удаляет элемент из кучи и возвращает его приоритет.
+
+        Временная сложность: O(log N).
+        """
+        index = self.position[item]
+        priority = self.priorities[index]
+        self._remove_at(index)
+        return priority
+
+    def _remove_at(self, index: int) -> None:
+        """
+        Ставит на место index последний элемент массива и восстанавливает
+        свойство кучи в нужную сторону.
+        """
+        del self.position[self.items[index]]
+        last_priority = self.priorities.pop()
+        last_item = self.items.pop()
+        if index == len(self.items):
+            return
+        self.priorities[index] = last_priority
+        self.items[index] = last_item
+        if index > 0 and \
+                last_priority < self.priorities[(index - 1) // self.d]:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
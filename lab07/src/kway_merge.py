@@ -0,0 +1,136 @@
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+from asa_heap import MinHeap
+
+
+class _Exhausted:
+    """Ключ исчерпанного источника: больше любого значения."""
+
+    def __lt__(self, other: Any) -> bool:
+        return False
+
+    def __gt__(self, other: Any) -> bool:
+        return other is not self
+
+
+_EXHAUSTED = _Exhausted()
+
+
+def _chunks(iterable: Iterable[Any], buffer_size: int) -> Iterator[List[Any]]:
+    """Читает итератор порциями не больше buffer_size элементов."""
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, buffer_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def merge(*iterables: Iterable[Any],
+          key: Optional[Callable[[Any], Any]] = None,
+          buffer_size: int = 64) -> Iterator[Any]:
+    """
+    Лениво сливает отсортированные итераторы с помощью дерева
+    проигравших (loser tree). Внутренний узел хранит номер источника,
+    проигравшего в нем; общий победитель хранится отдельно. После выдачи
+    элемента победитель переигрывает только свой путь к корню:
+    ровно log2(k) сравнений, без перестановок соседних узлов, как
+    в куче. При равных ключах первым идет источник с меньшим номером,
+    поэтому слияние устойчиво.
+    Из каждого источника в памяти не больше buffer_size элементов.
+
+    Временная сложность: O(N log k), N - общее число элементов.
+    Пространственная: O(k * buffer_size).
+    """
+    if buffer_size < 1:
+        raise ValueError('buffer_size must be at least 1')
+    k = len(iterables)
+    if k == 0:
+        return
+    if k == 1:
+        yield from iterables[0]
+        return
+
+    readers = [_chunks(it, buffer_size) for it in iterables]
+    buffers: List[List[Any]] = []
+    keys: List[Any] = []
+    for reader in readers:
+        buffer = next(reader, None)
+        if buffer is None:
+            buffers.append([])
+            keys.append(_EXHAUSTED)
+        else:
+            buffers.append(buffer)
+            keys.append(buffer[0] if key is None else key(buffer[0]))
+    positions = [0] * k
+
+    # Начальный турнир снизу вверх: лист источника i - узел k + i
+    winners = [0] * (2 * k)
+    for source in range(k):
+        winners[k + source] = source
+    losers = [0] * k
+    for node in range(k - 1, 0, -1):
+        a, b = winners[2 * node], winners[2 * node + 1]
+        if keys[b] < keys[a] or (b < a and not keys[a] < keys[b]):
+            a, b = b, a
+        winners[node], losers[node] = a, b
+    winner = winners[1]
+    del winners
+
+    # Горячий цикл без вызовов функций: исчерпанный источник получает
+    # ключ _EXHAUSTED, который больше любого другого
+    while keys[winner] is not _EXHAUSTED:
+        buffer = buffers[winner]
+        pos = positions[winner] + 1
+        yield buffer[pos - 1]
+        if pos == len(buffer):
+            buffer = next(readers[winner], None)
+            pos = 0
+        if buffer is None:
+            buffers[winner] = []
+            key_w = _EXHAUSTED
+        else:
+            buffers[winner] = buffer
+            key_w = buffer[pos] if key is None else key(buffer[pos])
+        positions[winner] = pos
+        keys[winner] = key_w
+        # Переигровка пути от листа победителя к корню
+        node = (winner + k) >> 1
+        while node:
+            other = losers[node]
+            key_o = keys[other]
+            if key_o < key_w or (other < winner and not key_w < key_o):
+                losers[node] = winner
+                winner = other
+                key_w = key_o
+            node >>= 1
+
+
+def heap_merge(*iterables: Iterable[Any],
+               key: Optional[Callable[[Any], Any]] = None) -> Iterator[Any]:
+    """
+    Лениво сливает отсортированные итераторы через MinHeap из троек
+    (ключ, номер источника, значение): номер источника - метка
+    и устойчивый разрыв равенства ключей. Следующий элемент того же
+    источника занимает корень через replace (одно просеивание вниз).
+
+    Временная сложность: O(N log k).
+    Пространственная: O(k).
+    """
+    sources = [iter(it) for it in iterables]
+    heap = MinHeap()
+    entries = []
+    for index, source in enumerate(sources):
+        for value in source:
+            entries.append((value if key is None else key(value),
+                            index, value))
+            break
+    heap.build_heap(entries)
+    while heap.heap:
+        _, index, value = heap.heap[0]
+        yield value
+        for nxt in sources[index]:
+            heap.replace((nxt if key is None else key(nxt), index, nxt))
+            break
+        else:
+            heap.extract()
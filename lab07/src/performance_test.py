@@ -1,9 +1,52 @@
 # performance_test.py
+import asyncio
+import heapq
+import queue
+import threading
 import timeit
 import random
 import matplotlib.pyplot as plt
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
+from array import array
 from asa_heap import MinHeap
+from heapsort import heapsort, heapsort_in_place, partial_sort, top_k
+from kway_merge import heap_merge, merge
+from priority_queues import AsyncPriorityQueue, ThreadSafePriorityQueue
+from timer_wheel import HeapScheduler, TimerWheel
+from heap_variants import DaryHeap, LeftistHeap, PairingHeap
+from indexed_heap import IndexedMinHeap
+
+# Граф: для каждой вершины список (сосед, вес)
+Graph = List[List[Tuple[int, int]]]
+
+
+class SwapMinHeap(MinHeap):
+    """
+    Прежнее просеивание MinHeap: на каждом шаге вызываются методы
+    _parent, _left_child, _right_child и _swap (для сравнения).
+    """
+
+    def _sift_up(self, index: int) -> None:
+        while index > 0 and self.heap[index] < self.heap[self._parent(index)]:
+            parent_idx = self._parent(index)
+            self._swap(index, parent_idx)
+            index = parent_idx
+
+    def _sift_down(self, index: int) -> None:
+        size = len(self.heap)
+        while True:
+            left = self._left_child(index)
+            right = self._right_child(index)
+            smallest = index
+            if left < size and self.heap[left] < self.heap[smallest]:
+                smallest = left
+            if right < size and self.heap[right] < self.heap[smallest]:
+                smallest = right
+            if smallest != index:
+                self._swap(index, smallest)
+                index = smallest
+            else:
+                break
 
 
 def measure_build_time_sequential(data: List[int]) -> float:
@@ -72,5 +115,514 @@ def run_experiments() -> None:
     plt.show()
 
 
+def make_dense_graph(num_vertices: int, density: float,
+                     seed: int = 0) -> Graph:
+    """
+    Случайный ориентированный граф: каждое ребро (u, v) есть
+    с вероятностью density, веса - от 1 до 1000.
+    """
+    rng = random.Random(seed)
+    return [[(v, rng.randint(1, 1000)) for v in range(num_vertices)
+             if v != u and rng.random() < density]
+            for u in range(num_vertices)]
+
+
+def dijkstra_lazy(graph: Graph, start: int) -> Tuple[List[float], int]:
+    """
+    Дейкстра с "ленивым удалением" (как в lab10): при каждом улучшении
+    в heapq добавляется новая пара, устаревшие пары пропускаются.
+    Возвращает расстояния и наибольший размер кучи - до O(E).
+    """
+    distances = [float('inf')] * len(graph)
+    distances[start] = 0
+    queue = [(0, start)]
+    peak = 1
+    while queue:
+        dist, node = heapq.heappop(queue)
+        if dist > distances[node]:
+            continue
+        for neighbor, weight in graph[node]:
+            candidate = dist + weight
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                heapq.heappush(queue, (candidate, neighbor))
+        if len(queue) > peak:
+            peak = len(queue)
+    return distances, peak
+
+
+def dijkstra_indexed(graph: Graph, start: int) -> Tuple[List[float], int]:
+    """
+    Дейкстра на IndexedMinHeap: вершина хранится в куче один раз,
+    улучшение расстояния - decrease_key. Размер кучи не больше V.
+    """
+    distances = [float('inf')] * len(graph)
+    distances[start] = 0
+    queue = IndexedMinHeap()
+    queue.insert(start, 0)
+    peak = 1
+    while queue:
+        dist, node = queue.extract()
+        for neighbor, weight in graph[node]:
+            candidate = dist + weight
+            if candidate < distances[neighbor]:
+                if neighbor in queue:
+                    queue.decrease_key(neighbor, candidate)
+                else:
+                    queue.insert(neighbor, candidate)
+                distances[neighbor] = candidate
+        if len(queue) > peak:
+            peak = len(queue)
+    return distances, peak
+
+
+def run_dijkstra_experiments() -> None:
+    """
+    Сравнивает Дейкстру с ленивым удалением и с decrease_key
+    на плотных графах: время и наибольший размер очереди.
+    """
+    cases = [(500, 0.5), (1000, 0.5), (2000, 0.5), (2000, 1.0)]
+
+    print(f"\n{'V':<6} | {'E':<9} | {'Lazy heapq (s)':<15} | "
+          f"{'Indexed (s)':<12} | {'Lazy peak':<10} | {'Indexed peak':<12}")
+    print("-" * 80)
+
+    for num_vertices, density in cases:
+        graph = make_dense_graph(num_vertices, density)
+        edges = sum(len(neighbors) for neighbors in graph)
+        lazy, lazy_peak = dijkstra_lazy(graph, 0)
+        indexed, indexed_peak = dijkstra_indexed(graph, 0)
+        assert lazy == indexed
+
+        t_lazy = timeit.timeit(lambda: dijkstra_lazy(graph, 0),
+                               number=3) / 3
+        t_indexed = timeit.timeit(lambda: dijkstra_indexed(graph, 0),
+                                  number=3) / 3
+        print(f"{num_vertices:<6} | {edges:<9} | {t_lazy:<15.5f} | "
+              f"{t_indexed:<12.5f} | {lazy_peak:<10} | {indexed_peak:<12}")
+
+
+# Арности, которые перебирает run_arity_experiments
+ARITIES = [2, 3, 4, 8, 16]
+
+
+def mix_insert_heavy(heap, data: List[int]) -> None:
+    """Четыре вставки на одно извлечение, затем опустошение кучи."""
+    for i, value in enumerate(data):
+        heap.insert(value)
+        if i % 4 == 3:
+            heap.extract()
+    while heap.extract() is not None:
+        pass
+
+
+def mix_balanced(heap, data: List[int]) -> None:
+    """Куча из половины данных, затем чередование вставки и извлечения."""
+    half = len(data) // 2
+    heap.build_heap(data[:half])
+    for value in data[half:]:
+        heap.insert(value)
+        heap.extract()
+
+
+def mix_extract_heavy(heap, data: List[int]) -> None:
+    """build_heap и извлечение всех элементов."""
+    heap.build_heap(data)
+    while heap.extract() is not None:
+        pass
+
+
+def mix_decrease_key(heap, data: List[int]) -> None:
+    """
+    Вставка всех элементов, по два уменьшения ключа на элемент,
+    затем опустошение (IndexedMinHeap или PairingHeap).
+    """
+    rng = random.Random(1)
+    if isinstance(heap, PairingHeap):
+        handles = [heap.insert(value) for value in data]
+        for _ in range(2 * len(data)):
+            node = handles[rng.randrange(len(handles))]
+            heap.decrease_key(node, node.val - rng.randint(0, 1000))
+    else:
+        for item, value in enumerate(data):
+            heap.insert(item, value)
+        for _ in range(2 * len(data)):
+            item = rng.randrange(len(data))
+            heap.decrease_key(item, heap.priority(item) -
+                              rng.randint(0, 1000))
+    while heap.extract() is not None:
+        pass
+
+
+def run_arity_experiments(size: int = 100000) -> None:
+    """
+    Перебирает арность d и смеси операций, печатает время каждой
+    структуры и лучшую для каждой смеси.
+    """
+    mixes: Dict[str, Callable[[object, List[int]], None]] = {
+        'insert-heavy': mix_insert_heavy,
+        'balanced': mix_balanced,
+        'extract-heavy': mix_extract_heavy,
+        'decrease-key': mix_decrease_key,
+    }
+    # Для смеси decrease-key вместо DaryHeap - IndexedMinHeap той же
+    # арности, у MinHeap такой операции нет
+    structures: Dict[str, Tuple[Callable[[], object],
+                                Optional[Callable[[], object]]]] = {
+        'MinHeap': (MinHeap, None),
+    }
+    for d in ARITIES:
+        structures[f'{d}-ary heap'] = (
+            lambda d=d: DaryHeap(d), lambda d=d: IndexedMinHeap(d))
+    structures['Pairing heap'] = (PairingHeap, PairingHeap)
+
+    data = [random.randint(0, 1000000) for _ in range(size)]
+    times: Dict[str, Dict[str, float]] = {mix: {} for mix in mixes}
+
+    print(f"\nOperation mixes, N={size} (seconds)")
+    print(f"{'Structure':<14}" + "".join(f" | {mix:<13}" for mix in mixes))
+    print("-" * (14 + 16 * len(mixes)))
+    for name, (plain, indexed) in structures.items():
+        row = []
+        for mix, run in mixes.items():
+            factory = indexed if mix == 'decrease-key' else plain
+            if factory is None:
+                row.append(f" | {'-':<13}")
+                continue
+            # Минимум из трех запусков сглаживает шум измерений
+            elapsed = min(timeit.repeat(lambda: run(factory(), data),
+                                        number=1, repeat=3))
+            times[mix][name] = elapsed
+            row.append(f" | {elapsed:<13.4f}")
+        print(f"{name:<14}" + "".join(row))
+
+    print("\nBest structure for each mix:")
+    for mix, results in times.items():
+        best = min(results, key=results.get)
+        print(f"  {mix:<14}: {best} ({results[best]:.4f} s)")
+
+
+def run_sift_experiments(size: int = 200000) -> None:
+    """
+    Сравнивает прежнее просеивание обменами, просеивание "дыркой"
+    и heapq на вставках, извлечениях, pushpop и пакетной вставке.
+    """
+    data = [random.randint(0, 1000000) for _ in range(size)]
+    stream = [random.randint(0, 1000000) for _ in range(size)]
+
+    def heap_ops(factory: Callable[[], MinHeap]) -> List[float]:
+        heap = factory()
+        start = timeit.default_timer()
+        for value in data:
+            heap.insert(value)
+        t_insert = timeit.default_timer() - start
+
+        start = timeit.default_timer()
+        for value in stream:
+            heap.pushpop(value)
+        t_pushpop = timeit.default_timer() - start
+
+        start = timeit.default_timer()
+        while heap.extract() is not None:
+            pass
+        t_extract = timeit.default_timer() - start
+
+        heap.build_heap(data[:size // 2])
+        start = timeit.default_timer()
+        heap.insert_many(data[size // 2:])
+        t_batch = timeit.default_timer() - start
+        return [t_insert, t_pushpop, t_extract, t_batch]
+
+    def heapq_ops() -> List[float]:
+        heap: List[int] = []
+        start = timeit.default_timer()
+        for value in data:
+            heapq.heappush(heap, value)
+        t_insert = timeit.default_timer() - start
+
+        start = timeit.default_timer()
+        for value in stream:
+            heapq.heappushpop(heap, value)
+        t_pushpop = timeit.default_timer() - start
+
+        start = timeit.default_timer()
+        while heap:
+            heapq.heappop(heap)
+        t_extract = timeit.default_timer() - start
+
+        heap = data[:size // 2]
+        heapq.heapify(heap)
+        start = timeit.default_timer()
+        heap.extend(data[size // 2:])
+        heapq.heapify(heap)
+        t_batch = timeit.default_timer() - start
+        return [t_insert, t_pushpop, t_extract, t_batch]
+
+    print(f"\nSift loops, N={size} (seconds)")
+    print(f"{'Variant':<16} | {'insert':<8} | {'pushpop':<8} | "
+          f"{'extract':<8} | {'insert_many':<11}")
+    print("-" * 64)
+    for name, measure in (('Swap methods', lambda: heap_ops(SwapMinHeap)),
+                          ('Hole (MinHeap)', lambda: heap_ops(MinHeap)),
+                          ('heapq', heapq_ops)):
+        times = measure()
+        print(f"{name:<16}" + "".join(f" | {t:<8.4f}" for t in times[:3]) +
+              f" | {times[3]:<11.4f}")
+
+
+def run_sorting_experiments(size: int = 200000,
+                            ks: Tuple[int, ...] = (10, 1000, 20000)) -> None:
+    """
+    Сравнивает heapsort с копированием в MinHeap, сортировку на месте
+    (список и array.array) и sorted; затем top_k и partial_sort
+    с sorted(...)[:k].
+    """
+    data = [random.randint(0, 1000000) for _ in range(size)]
+
+    def timed(func: Callable[[], object]) -> float:
+        return min(timeit.repeat(func, number=1, repeat=3))
+
+    print(f"\nFull sort, N={size} (seconds)")
+    print(f"{'Variant':<24} | {'Time (s)':<10}")
+    print("-" * 37)
+    for name, func in (
+            ('heapsort (MinHeap copy)', lambda: heapsort(data)),
+            ('heapsort_in_place list', lambda: heapsort_in_place(data[:])),
+            ('heapsort_in_place array',
+             lambda: heapsort_in_place(array('q', data))),
+            ('sorted', lambda: sorted(data))):
+        print(f"{name:<24} | {timed(func):<10.4f}")
+
+    print(f"\nTop-k and partial sort, N={size} (seconds)")
+    print(f"{'k':<7} | {'top_k':<8} | {'sorted(rev)[:k]':<15} | "
+          f"{'partial_sort':<12} | {'sorted()[:k]':<12}")
+    print("-" * 65)
+    for k in ks:
+        t_top = timed(lambda: top_k(iter(data), k))
+        t_top_ref = timed(lambda: sorted(data, reverse=True)[:k])
+        t_partial = timed(lambda: partial_sort(data[:], k))
+        t_partial_ref = timed(lambda: sorted(data)[:k])
+        print(f"{k:<7} | {t_top:<8.4f} | {t_top_ref:<15.4f} | "
+              f"{t_partial:<12.4f} | {t_partial_ref:<12.4f}")
+
+
+def run_merge_experiments(total: int = 200000,
+                          ks: Tuple[int, ...] = (2, 10, 100, 1000, 10000)
+                          ) -> None:
+    """
+    Слияние k отсортированных итераторов (всего total элементов):
+    дерево проигравших, MinHeap с метками источников и heapq.merge.
+    """
+    print(f"\nK-way merge, {total} elements (seconds)")
+    print(f"{'k':<7} | {'loser tree':<10} | {'MinHeap':<10} | "
+          f"{'heapq.merge':<11}")
+    print("-" * 47)
+    for k in ks:
+        shards = [sorted(random.randint(0, 1000000)
+                         for _ in range(total // k)) for _ in range(k)]
+        times = []
+        for func in (merge, heap_merge, heapq.merge):
+            times.append(min(timeit.repeat(
+                lambda: sum(1 for _ in func(*(iter(s) for s in shards))),
+                number=1, repeat=3)))
+        print(f"{k:<7} | {times[0]:<10.4f} | {times[1]:<10.4f} | "
+              f"{times[2]:<11.4f}")
+
+
+def meld_min_heaps(target: MinHeap, other: MinHeap) -> None:
+    """Слияние MinHeap: конкатенация массивов и build_heap за O(N + M)."""
+    target.build_heap(target.heap + other.heap)
+    other.heap = []
+
+
+def run_meld_experiments(heap_size: int = 100,
+                         workers: Tuple[int, ...] = (10, 100, 1000)
+                         ) -> None:
+    """
+    Последовательно сливает в одну кучу workers маленьких куч
+    по heap_size элементов: перестройка массива MinHeap против meld
+    левосторонней и парной куч.
+    """
+    print(f"\nRepeated melds of {heap_size}-element heaps (seconds)")
+    print(f"{'Heaps':<7} | {'MinHeap rebuild':<15} | {'Leftist meld':<12} | "
+          f"{'Pairing meld':<12}")
+    print("-" * 57)
+    for count in workers:
+        data = [[random.randint(0, 1000000) for _ in range(heap_size)]
+                for _ in range(count)]
+        times = []
+        for factory, meld in (
+                (MinHeap, meld_min_heaps),
+                (LeftistHeap, LeftistHeap.meld),
+                (PairingHeap, PairingHeap.meld)):
+            heaps = []
+            for values in data:
+                heap = factory()
+                heap.build_heap(values)
+                heaps.append(heap)
+            total = heaps[0]
+            start = timeit.default_timer()
+            for heap in heaps[1:]:
+                meld(total, heap)
+            times.append(timeit.default_timer() - start)
+            assert total.peek() == min(min(values) for values in data)
+        print(f"{count:<7} | {times[0]:<15.5f} | {times[1]:<12.5f} | "
+              f"{times[2]:<12.5f}")
+
+
+def thread_throughput(factory: Callable[[], object], workers: int,
+                      items: int) -> float:
+    """
+    workers потоков-производителей и столько же потребителей
+    передают items элементов через очередь; возвращает элементов/с.
+    """
+    shared = factory()
+    per_worker = items // workers
+    data = [random.randint(0, 1000000) for _ in range(per_worker)]
+
+    def produce() -> None:
+        for value in data:
+            shared.put(value)
+
+    def consume() -> None:
+        for _ in range(per_worker):
+            shared.get()
+
+    threads = [threading.Thread(target=target)
+               for target in (produce, consume) for _ in range(workers)]
+    start = timeit.default_timer()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return per_worker * workers / (timeit.default_timer() - start)
+
+
+def task_throughput(factory: Callable[[], object], tasks: int,
+                    items: int) -> float:
+    """
+    То же для задач asyncio: tasks производителей и tasks потребителей.
+    """
+    per_task = items // tasks
+    data = [random.randint(0, 1000000) for _ in range(per_task)]
+
+    async def main() -> float:
+        shared = factory()
+
+        async def produce() -> None:
+            for value in data:
+                await shared.put(value)
+
+        async def consume() -> None:
+            for _ in range(per_task):
+                await shared.get()
+
+        start = timeit.default_timer()
+        await asyncio.gather(*(produce() for _ in range(tasks)),
+                             *(consume() for _ in range(tasks)))
+        return per_task * tasks / (timeit.default_timer() - start)
+
+    return asyncio.run(main())
+
+
+def run_queue_experiments(items: int = 100000,
+                          counts: Tuple[int, ...] = (1, 2, 4, 8),
+                          maxsize: int = 1000) -> None:
+    """
+    Пропускная способность очередей с приоритетом (элементов в секунду)
+    в зависимости от числа потоков и задач: очереди на MinHeap против
+    queue.PriorityQueue и asyncio.PriorityQueue. Емкость ограничена
+    maxsize, поэтому работают обе стороны ожидания.
+    """
+    print(f"\nThreads (producers = consumers), {items} items, "
+          f"maxsize={maxsize} (items/s)")
+    print(f"{'Threads':<8} | {'MinHeap queue':<14} | "
+          f"{'queue.PriorityQueue':<19}")
+    print("-" * 47)
+    for count in counts:
+        ours = thread_throughput(
+            lambda: ThreadSafePriorityQueue(maxsize), count, items)
+        base = thread_throughput(
+            lambda: queue.PriorityQueue(maxsize), count, items)
+        print(f"{count:<8} | {ours:<14.0f} | {base:<19.0f}")
+
+    print(f"\nAsyncio tasks (producers = consumers), {items} items, "
+          f"maxsize={maxsize} (items/s)")
+    print(f"{'Tasks':<8} | {'MinHeap queue':<14} | "
+          f"{'asyncio.PriorityQueue':<21}")
+    print("-" * 49)
+    for count in counts + (100,):
+        ours = task_throughput(
+            lambda: AsyncPriorityQueue(maxsize), count, items)
+        base = task_throughput(
+            lambda: asyncio.PriorityQueue(maxsize), count, items)
+        print(f"{count:<8} | {ours:<14.0f} | {base:<21.0f}")
+
+
+def churn_workload(scheduler, timers: int, cancel_ratio: float,
+                   max_delay: int, per_tick: int) -> Tuple[float, int]:
+    """
+    Планирует timers таймеров со случайной задержкой, доля cancel_ratio
+    отменяется вскоре после планирования; каждые per_tick операций
+    время сдвигается на тик. Возвращает время и наибольшее количество
+    записей, хранимых планировщиком.
+    """
+    rng = random.Random(0)
+    delays = [rng.randint(1, max_delay) for _ in range(timers)]
+    cancels = [rng.random() < cancel_ratio for _ in range(timers)]
+    stored = (lambda: len(scheduler.heap.heap)) \
+        if isinstance(scheduler, HeapScheduler) else (lambda: len(scheduler))
+    callback = int
+    pending: List[object] = []
+    peak = 0
+    start = timeit.default_timer()
+    for i in range(timers):
+        handle = scheduler.schedule(delays[i], callback)
+        if cancels[i]:
+            pending.append(handle)
+        if i % per_tick == per_tick - 1:
+            # Отмены текущего тика - как у таймаутов запросов,
+            # на которые пришел ответ
+            for old in pending:
+                scheduler.cancel(old)
+            pending.clear()
+            scheduler.advance(1)
+            if i % (per_tick * 64) == per_tick - 1:
+                peak = max(peak, stored())
+    for old in pending:
+        scheduler.cancel(old)
+    peak = max(peak, stored())
+    scheduler.advance(max_delay + 1)
+    return timeit.default_timer() - start, peak
+
+
+def run_timer_experiments(timers: int = 1000000, cancel_ratio: float = 0.9,
+                          max_delays: Tuple[int, ...] = (1000, 100000)
+                          ) -> None:
+    """
+    Высокая текучесть таймеров: колесо таймеров против планировщика
+    на MinHeap с ленивой отменой.
+    """
+    print(f"\nTimers: {timers} scheduled, {cancel_ratio:.0%} cancelled")
+    print(f"{'Max delay':<10} | {'Scheduler':<12} | {'Time (s)':<9} | "
+          f"{'Peak stored':<11}")
+    print("-" * 51)
+    for max_delay in max_delays:
+        for name, factory in (('Timer wheel', TimerWheel),
+                              ('MinHeap', HeapScheduler)):
+            elapsed, peak = churn_workload(factory(), timers, cancel_ratio,
+                                           max_delay, per_tick=100)
+            print(f"{max_delay:<10} | {name:<12} | {elapsed:<9.3f} | "
+                  f"{peak:<11}")
+
+
 if __name__ == '__main__':
     run_experiments()
+    run_dijkstra_experiments()
+    run_arity_experiments()
+    run_sift_experiments()
+    run_sorting_experiments()
+    run_merge_experiments()
+    run_meld_experiments()
+    run_queue_experiments()
+    run_timer_experiments()
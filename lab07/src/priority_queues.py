@@ -0,0 +1,202 @@
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Deque, Optional
+from asa_heap import MinHeap
+
+
+class ThreadSafePriorityQueue:
+    """
+    Очередь с приоритетом для потоков на основе MinHeap: get выдает
+    наименьший элемент. Все операции выполняются под одной блокировкой,
+    ожидание - на двух условиях (not_empty и not_full), поэтому
+    потребители и производители просыпаются только при изменении
+    очереди, без опроса. maxsize <= 0 - очередь без ограничения.
+    Исключения - queue.Empty и queue.Full, как у queue.PriorityQueue.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize: int = maxsize
+        self._heap = MinHeap()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def qsize(self) -> int:
+        with self._lock:
+            return len(self._heap.heap)
+
+    def empty(self) -> bool:
+        with self._lock:
+            return not self._heap.heap
+
+    def full(self) -> bool:
+        with self._lock:
+            return 0 < self.maxsize <= len(self._heap.heap)
+
+    def put(self, item: Any, block: bool = True,
+            timeout: Optional[float] = None) -> None:
+        """
+        Добавляет элемент; если очередь заполнена, ждет освобождения
+        места не дольше timeout секунд (None - без ограничения).
+
+        Временная сложность: O(log N) без учета ожидания.
+        """
+        with self._not_full:
+            if self.maxsize > 0:
+                if not block:
+                    if len(self._heap.heap) >= self.maxsize:
+                        raise queue.Full
+                elif timeout is None:
+                    while len(self._heap.heap) >= self.maxsize:
+                        self._not_full.wait()
+                else:
+                    deadline = time.monotonic() + timeout
+                    while len(self._heap.heap) >= self.maxsize:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise queue.Full
+                        self._not_full.wait(remaining)
+            self._heap.insert(item)
+            self._not_empty.notify()
+
+    def get(self, block: bool = True,
+            timeout: Optional[float] = None) -> Any:
+        """
+        Извлекает наименьший элемент; если очередь пуста, ждет
+        не дольше timeout секунд (None - без ограничения).
+
+        Временная сложность: O(log N) без учета ожидания.
+        """
+        with self._not_empty:
+            if not block:
+                if not self._heap.heap:
+                    raise queue.Empty
+            elif timeout is None:
+                while not self._heap.heap:
+                    self._not_empty.wait()
+            else:
+                deadline = time.monotonic() + timeout
+                while not self._heap.heap:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise queue.Empty
+                    self._not_empty.wait(remaining)
+            item = self._heap.extract()
+            self._not_full.notify()
+            return item
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+
+class AsyncPriorityQueue:
+    """
+    Очередь с приоритетом для задач asyncio на основе MinHeap.
+    Ожидающий get (или put при заполненной очереди) - future в очереди
+    ожидающих; put и get будят ровно одного ожидающего, опроса нет.
+    Таймаут - через asyncio.wait_for. Производители из других потоков
+    используют put_threadsafe. Исключения - asyncio.QueueEmpty
+    и asyncio.QueueFull.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize: int = maxsize
+        self._heap = MinHeap()
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+
+    def qsize(self) -> int:
+        return len(self._heap.heap)
+
+    def empty(self) -> bool:
+        return not self._heap.heap
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._heap.heap)
+
+    @staticmethod
+    def _wakeup_next(waiters: Deque[asyncio.Future]) -> None:
+        """Будит первого еще ожидающего (не отмененного)."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    @staticmethod
+    async def _wait(waiters: Deque[asyncio.Future]) -> None:
+        """
+        Ставит future в очередь ожидающих и ждет его. При отмене
+        (например, по таймауту wait_for) future убирается из очереди.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            raise
+
+    async def put(self, item: Any) -> None:
+        """
+        Добавляет элемент, ожидая места в ограниченной очереди.
+
+        Временная сложность: O(log N) без учета ожидания.
+        """
+        while self.full():
+            try:
+                await self._wait(self._putters)
+            except BaseException:
+                # Нас разбудили, но мы отменены - передаем сигнал дальше
+                if not self.full():
+                    self._wakeup_next(self._putters)
+                raise
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Any) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        self._heap.insert(item)
+        self._wakeup_next(self._getters)
+
+    async def get(self) -> Any:
+        """
+        Извлекает наименьший элемент, ожидая его появления.
+
+        Временная сложность: O(log N) без учета ожидания.
+        """
+        while self.empty():
+            try:
+                await self._wait(self._getters)
+            except BaseException:
+                if not self.empty():
+                    self._wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    def get_nowait(self) -> Any:
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self._heap.extract()
+        self._wakeup_next(self._putters)
+        return item
+
+    def put_threadsafe(self, item: Any,
+                       loop: asyncio.AbstractEventLoop) -> Future:
+        """
+        Добавляет элемент из другого потока: put выполняется в цикле
+        событий loop. Возвращает concurrent.futures.Future - поток может
+        дождаться места в ограниченной очереди через result(timeout).
+        """
+        return asyncio.run_coroutine_threadsafe(self.put(item), loop)
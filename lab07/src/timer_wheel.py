@@ -0,0 +1,236 @@
+from itertools import count
+from typing import Callable, List, Optional, Set
+from asa_heap import MinHeap
+
+
+class TimerHandle:
+    """
+    Таймер, возвращаемый schedule: срок (в тиках), функция и bucket -
+    множество слота колеса, в котором таймер сейчас лежит (None, если
+    таймер в резервной куче, сработал или отменен).
+    """
+
+    __slots__ = ('deadline', 'callback', 'bucket', 'cancelled')
+
+    def __init__(self, deadline: int, callback: Callable[[], None]) -> None:
+        self.deadline: int = deadline
+        self.callback: Callable[[], None] = callback
+        self.bucket: Optional[Set['TimerHandle']] = None
+        self.cancelled: bool = False
+
+
+class TimerWheel:
+    """
+    Иерархическое колесо таймеров (Varghese, Lauck). Время дискретно,
+    текущий тик - now. Уровень l состоит из SLOTS слотов по SLOTS^l
+    тиков: таймер кладется на нижний уровень, чей оборот покрывает
+    его срок, в слот по соответствующей "цифре" срока. Когда время
+    доходит до слота верхнего уровня, его таймеры раскладываются
+    по нижним уровням (каскад). Таймеры дальше горизонта SLOTS^LEVELS
+    лежат в резервной MinHeap и переносятся в колесо по мере
+    приближения срока.
+    Слот - множество, поэтому schedule и cancel выполняются за O(1).
+    В пределах одного тика порядок срабатывания не гарантируется.
+    """
+
+    BITS = 6
+    SLOTS = 1 << BITS
+    LEVELS = 4
+
+    def __init__(self, now: int = 0) -> None:
+        self.now: int = now
+        self.wheels: List[List[Set[TimerHandle]]] = [
+            [set() for _ in range(self.SLOTS)] for _ in range(self.LEVELS)
+        ]
+        # Резервная куча для дальних таймеров: (срок, номер, таймер)
+        self.overflow = MinHeap()
+        self._sequence = count()
+        self.horizon: int = self.SLOTS ** self.LEVELS
+        # Тиков в одном слоте верхнего уровня
+        self.top_span: int = self.SLOTS ** (self.LEVELS - 1)
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _place(self, handle: TimerHandle) -> None:
+        """
+        Кладет таймер в слот колеса или в резервную кучу.
+
+        Сложность: O(1) для колеса, O(log M) для кучи из M таймеров.
+        """
+        delta = handle.deadline - self.now
+        if delta >= self.horizon:
+            handle.bucket = None
+            self.overflow.insert((handle.deadline, next(self._sequence),
+                                  handle))
+            return
+        level = 0
+        span = self.SLOTS
+        while delta >= span:
+            span <<= self.BITS
+            level += 1
+        slot = (handle.deadline >> (self.BITS * level)) & (self.SLOTS - 1)
+        bucket = self.wheels[level][slot]
+        bucket.add(handle)
+        handle.bucket = bucket
+
+    def schedule(self, delay: int,
+                 callback: Callable[[], None]) -> TimerHandle:
+        """
+        Планирует вызов callback через delay тиков (не меньше одного:
+        слот текущего тика уже обработан).
+
+        Временная сложность: O(1) в пределах горизонта колеса.
+        """
+        handle = TimerHandle(self.now + max(delay, 1), callback)
+        self._place(handle)
+        self.size += 1
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> bool:
+        """
+        Отменяет таймер. Таймер из резервной кучи только помечается
+        и выбрасывается при переносе в колесо.
+
+        Временная сложность: O(1).
+        :return: False, если таймер уже сработал или отменен
+        """
+        if handle.cancelled or handle.callback is None:
+            return False
+        handle.cancelled = True
+        if handle.bucket is not None:
+            handle.bucket.discard(handle)
+            handle.bucket = None
+        self.size -= 1
+        return True
+
+    def _pull_overflow(self) -> None:
+        """Переносит в колесо таймеры кучи, попавшие в горизонт."""
+        heap = self.overflow
+        limit = self.now + self.horizon
+        while heap.heap and heap.heap[0][0] < limit:
+            handle = heap.extract()[2]
+            if not handle.cancelled:
+                self._place(handle)
+
+    def _tick(self) -> int:
+        """
+        Сдвигает время на один тик: каскады верхних уровней, затем
+        срабатывание слота нижнего уровня.
+
+        :return: количество сработавших таймеров
+        """
+        self.now += 1
+        now = self.now
+        mask = self.SLOTS - 1
+        if now & mask == 0:
+            level = 1
+            while level < self.LEVELS:
+                slot = (now >> (self.BITS * level)) & mask
+                bucket = self.wheels[level][slot]
+                if bucket:
+                    self.wheels[level][slot] = set()
+                    for handle in bucket:
+                        self._place(handle)
+                if slot:
+                    break
+                level += 1
+            # Верхний уровень сдвинулся на слот - горизонт тоже
+            if self.overflow.heap and now & (self.top_span - 1) == 0:
+                self._pull_overflow()
+
+        slot = now & mask
+        bucket = self.wheels[0][slot]
+        if not bucket:
+            return 0
+        self.wheels[0][slot] = set()
+        # Сначала таймеры отвязываются от слота: callback может отменить
+        # другой таймер этого же тика
+        for handle in bucket:
+            handle.bucket = None
+        fired = 0
+        for handle in bucket:
+            if handle.cancelled:
+                continue
+            callback = handle.callback
+            handle.callback = None
+            callback()
+            fired += 1
+        self.size -= fired
+        return fired
+
+    def advance(self, ticks: int) -> int:
+        """
+        Продвигает время на ticks тиков и вызывает истекшие таймеры.
+
+        Временная сложность: O(ticks + K), K - количество сработавших
+        и перенесенных каскадом таймеров.
+        :return: количество сработавших таймеров
+        """
+        fired = 0
+        for _ in range(ticks):
+            fired += self._tick()
+        return fired
+
+
+class HeapScheduler:
+    """
+    Планировщик на MinHeap из троек (срок, номер, таймер) с тем же API.
+    Отмена только помечает таймер: запись остается в куче до своего
+    срока, поэтому при частых отменах куча растет.
+    """
+
+    def __init__(self, now: int = 0) -> None:
+        self.now: int = now
+        self.heap = MinHeap()
+        self._sequence = count()
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def schedule(self, delay: int,
+                 callback: Callable[[], None]) -> TimerHandle:
+        """
+        Планирует вызов callback через delay тиков (не меньше одного).
+
+        Временная сложность: O(log N).
+        """
+        handle = TimerHandle(self.now + max(delay, 1), callback)
+        self.heap.insert((handle.deadline, next(self._sequence), handle))
+        self.size += 1
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> bool:
+        """
+        Помечает таймер отмененным.
+
+        Временная сложность: O(1), запись в куче остается.
+        """
+        if handle.cancelled or handle.callback is None:
+            return False
+        handle.cancelled = True
+        self.size -= 1
+        return True
+
+    def advance(self, ticks: int) -> int:
+        """
+        Продвигает время и вызывает истекшие таймеры, выбрасывая
+        отмененные записи.
+
+        Временная сложность: O((K + C) log N), C - отмененные записи.
+        """
+        self.now += ticks
+        heap = self.heap
+        fired = 0
+        while heap.heap and heap.heap[0][0] <= self.now:
+            handle = heap.extract()[2]
+            if handle.cancelled:
+                continue
+            callback = handle.callback
+            handle.callback = None
+            callback()
+            fired += 1
+        self.size -= fired
+        return fired
@@ -2,12 +2,14 @@
 import timeit
 import random
 import string
+from typing import Dict
 from greedy_algorithms import (
     interval_scheduling,
     fractional_knapsack,
     huffman_coding,
     Item
 )
+from huffman_codec import compress, decompress
 
 
 def test_knapsack_01_failure():
@@ -61,6 +63,61 @@ def benchmark_huffman():
         print(f"{size:<15} | {t:<15.5f}")
 
 
+def dict_encode(text: str, codes: Dict[str, str]) -> str:
+    """Кодирование словарем huffman_coding: строка из '0' и '1'."""
+    return ''.join(codes[char] for char in text)
+
+
+def dict_decode(bits: str, codes: Dict[str, str]) -> str:
+    """Декодирование по одному биту с поиском префикса в словаре."""
+    reverse = {code: char for char, code in codes.items()}
+    result = []
+    current = ''
+    for bit in bits:
+        current += bit
+        if current in reverse:
+            result.append(reverse[current])
+            current = ''
+    return ''.join(result)
+
+
+def benchmark_huffman_codec():
+    """
+    Кодек с каноническими кодами и упаковкой битов против словаря
+    huffman_coding: скорость сжатия и распаковки (МБ/с) и степень
+    сжатия (размер результата / размер входа).
+    """
+    print("\n=== Huffman codec vs dict of '0'/'1' strings ===")
+    sizes = [100000, 1000000]
+    # Частоты букв убывают как 1 / ранг - похоже на текст
+    alphabet = string.ascii_lowercase + ' '
+    weights = [1 / (rank + 1) for rank in range(len(alphabet))]
+    print(f"{'Size':<9} | {'Method':<6} | {'Enc MB/s':<9} | "
+          f"{'Dec MB/s':<9} | {'Ratio':<6}")
+    print("-" * 50)
+
+    for size in sizes:
+        text = ''.join(random.choices(alphabet, weights, k=size))
+        data = text.encode('ascii')
+        mb = size / 1e6
+
+        codes = huffman_coding(text)
+        t_enc = timeit.timeit(lambda: dict_encode(text, codes), number=1)
+        bits = dict_encode(text, codes)
+        t_dec = timeit.timeit(lambda: dict_decode(bits, codes), number=1)
+        assert dict_decode(bits, codes) == text
+        # Результат словарного подхода - строка, символ на бит
+        print(f"{size:<9} | {'dict':<6} | {mb / t_enc:<9.2f} | "
+              f"{mb / t_dec:<9.2f} | {len(bits) / size:<6.3f}")
+
+        t_enc = timeit.timeit(lambda: compress(data), number=1)
+        packed = compress(data)
+        t_dec = timeit.timeit(lambda: decompress(packed), number=1)
+        assert decompress(packed) == data
+        print(f"{size:<9} | {'codec':<6} | {mb / t_enc:<9.2f} | "
+              f"{mb / t_dec:<9.2f} | {len(packed) / size:<6.3f}")
+
+
 if __name__ == "__main__":
     # 1. Тест интервалов
     intervals = [(1, 4), (3, 5),
@@ -82,3 +139,4 @@ if __name__ == "__main__":
     # 4. Демонстрация проблемы 0-1 и замеры
     test_knapsack_01_failure()
     benchmark_huffman()
+    benchmark_huffman_codec()
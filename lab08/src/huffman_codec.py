@@ -0,0 +1,251 @@
+import heapq
+import struct
+from collections import Counter
+from typing import List, Tuple
+
+# Наибольшая длина кода: длины помещаются в 4 бита заголовка,
+# а таблица декодирования - не больше 2^15 элементов
+MAX_CODE_LENGTH = 15
+# Заголовок: длина исходных данных, затем 256 длин кодов по 4 бита
+HEADER = struct.Struct('<Q')
+LENGTHS_SIZE = 128
+# Сколько байтов входа кодируется за один проход join
+ENCODE_CHUNK = 1 << 16
+# Наименьшая ширина индекса таблицы декодирования: при коротких кодах
+# одно обращение выдает несколько символов
+MULTI_TABLE_BITS = 12
+
+
+def _tree_lengths(frequency: List[int]) -> List[int]:
+    """
+    Длины кодов Хаффмана (глубины листьев) без построения кодов:
+    узлы хранятся индексами, глубины считаются от корня к листьям
+    в обратном порядке создания узлов.
+
+    Сложность: O(K log K), K - количество различных символов.
+    """
+    lengths = [0] * 256
+    heap = [(freq, symbol) for symbol, freq in enumerate(frequency) if freq]
+    if not heap:
+        return lengths
+    if len(heap) == 1:
+        # Единственному символу нужен хотя бы один бит
+        lengths[heap[0][1]] = 1
+        return lengths
+
+    heapq.heapify(heap)
+    # Узлы 0..255 - листья, дальше - внутренние, parent[i] - родитель
+    parent = [-1] * 512
+    next_node = 256
+    while len(heap) > 1:
+        freq_a, a = heapq.heappop(heap)
+        freq_b, b = heapq.heappop(heap)
+        parent[a] = parent[b] = next_node
+        heapq.heappush(heap, (freq_a + freq_b, next_node))
+        next_node += 1
+
+    depth = [0] * next_node
+    for node in range(next_node - 2, 255, -1):
+        depth[node] = depth[parent[node]] + 1
+    for symbol in range(256):
+        if frequency[symbol]:
+            lengths[symbol] = depth[parent[symbol]] + 1
+    return lengths
+
+
+def code_lengths(data: bytes) -> List[int]:
+    """
+    Длины кодов Хаффмана для 256 значений байта (0 - байт не встречается).
+    Если какой-то код длиннее MAX_CODE_LENGTH, частоты делятся пополам
+    (оставаясь не меньше 1) и дерево строится заново: коды остаются
+    почти оптимальными, а длина ограничена.
+
+    Сложность: O(N + K log K).
+    """
+    counts = Counter(data)
+    frequency = [counts.get(symbol, 0) for symbol in range(256)]
+    lengths = _tree_lengths(frequency)
+    while max(lengths) > MAX_CODE_LENGTH:
+        frequency = [(freq + 1) // 2 for freq in frequency]
+        lengths = _tree_lengths(frequency)
+    return lengths
+
+
+def canonical_codes(lengths: List[int]) -> List[int]:
+    """
+    Канонические коды: символы упорядочиваются по (длина, значение),
+    каждый следующий код - предыдущий + 1, сдвинутый влево при росте
+    длины. Коды восстанавливаются по одним длинам, поэтому в заголовке
+    хранятся только длины.
+
+    Сложность: O(K log K).
+    """
+    codes = [0] * 256
+    code = 0
+    previous = 0
+    for length, symbol in sorted((length, symbol)
+                                 for symbol, length in enumerate(lengths)
+                                 if length):
+        code <<= length - previous
+        codes[symbol] = code
+        code += 1
+        previous = length
+    return codes
+
+
+def _pack_lengths(lengths: List[int]) -> bytes:
+    return bytes((lengths[i] << 4) | lengths[i + 1]
+                 for i in range(0, 256, 2))
+
+
+def _unpack_lengths(packed: bytes) -> List[int]:
+    lengths = []
+    for byte in packed:
+        lengths.append(byte >> 4)
+        lengths.append(byte & 15)
+    return lengths
+
+
+def compress(data: bytes) -> bytearray:
+    """
+    Сжимает байты: заголовок (длина данных и длины кодов), затем коды,
+    упакованные в байты старшим битом вперед. Битовая строка каждой
+    порции входа собирается join по таблице кодов и превращается в байты
+    одним int(..., 2), без цикла Python по битам.
+
+    Временная сложность: O(N).
+    """
+    lengths = code_lengths(data)
+    codes = canonical_codes(lengths)
+    table = [format(codes[symbol], f'0{lengths[symbol]}b')
+             if lengths[symbol] else '' for symbol in range(256)]
+    out = bytearray(HEADER.pack(len(data)))
+    out += _pack_lengths(lengths)
+
+    rest = ''
+    for start in range(0, len(data), ENCODE_CHUNK):
+        bits = rest + ''.join(map(table.__getitem__,
+                                  data[start:start + ENCODE_CHUNK]))
+        whole = len(bits) - len(bits) % 8
+        if whole:
+            out += int(bits[:whole], 2).to_bytes(whole // 8, 'big')
+        rest = bits[whole:]
+    if rest:
+        out.append(int(rest, 2) << (8 - len(rest)))
+    return out
+
+
+def _decode_table(lengths: List[int], bits: int) -> List[int]:
+    """
+    Таблица декодирования по bits битам (не меньше максимальной длины
+    кода): элемент для каждого значения следующих bits битов хранит
+    (символ << 4) | длина кода, которым эти биты начинаются.
+    """
+    codes = canonical_codes(lengths)
+    table = [0] * (1 << bits)
+    for symbol in range(256):
+        length = lengths[symbol]
+        if length:
+            start = codes[symbol] << (bits - length)
+            table[start:start + (1 << (bits - length))] = \
+                [((symbol << 4) | length)] * (1 << (bits - length))
+    return table
+
+
+def _multi_table(single: List[int], bits: int) -> List[Tuple[bytes, int]]:
+    """
+    Таблица, декодирующая за одно обращение все символы, коды которых
+    целиком помещаются в следующие bits битов: (символы, сколько битов
+    они занимают).
+    """
+    mask = (1 << bits) - 1
+    table = []
+    for value in range(1 << bits):
+        symbols = bytearray()
+        used = 0
+        while True:
+            entry = single[(value << used) & mask]
+            length = entry & 15
+            # Длина 0 - биты не начинают ни один код
+            if not length or used + length > bits:
+                break
+            symbols.append(entry >> 4)
+            used += length
+        table.append((bytes(symbols), used))
+    return table
+
+
+def decompress(blob: bytes) -> bytearray:
+    """
+    Восстанавливает данные compress. Вместо спуска по дереву по одному
+    биту следующие bits битов буфера - индекс таблицы, которая выдает
+    сразу все коды, целиком попавшие в эти биты. Последние символы
+    декодируются по одному, чтобы не читать биты дополнения.
+    Буфер пополняется сразу по 4 байта.
+
+    Временная сложность: O(N).
+    """
+    if len(blob) < HEADER.size + LENGTHS_SIZE:
+        raise ValueError('truncated Huffman stream')
+    (size,) = HEADER.unpack_from(blob)
+    lengths = _unpack_lengths(
+        blob[HEADER.size:HEADER.size + LENGTHS_SIZE])
+    out = bytearray()
+    if size == 0:
+        return out
+    if not any(lengths):
+        raise ValueError('corrupted Huffman stream')
+    # Неравенство Крафта: сумма 2^-длина не больше 1, иначе канонические
+    # коды не помещаются в свои длины и перекрывают друг друга
+    if sum(1 << (MAX_CODE_LENGTH - length) for length in lengths
+           if length) > 1 << MAX_CODE_LENGTH:
+        raise ValueError('corrupted Huffman stream')
+    # Каждый символ занимает не меньше кратчайшего кода: заявленный размер,
+    # не помещающийся в полезные биты, отвергается до декодирования
+    # (иначе чтение за концом дает нули и цикл идет до исчерпания памяти)
+    payload_bits = (len(blob) - HEADER.size - LENGTHS_SIZE) * 8
+    if size > payload_bits // min(length for length in lengths if length):
+        raise ValueError('truncated Huffman stream')
+
+    bits = max(max(lengths), MULTI_TABLE_BITS)
+    single = _decode_table(lengths, bits)
+    # Нули в конце позволяют читать по 4 байта без проверки границы
+    payload = bytes(blob[HEADER.size + LENGTHS_SIZE:]) + bytes(4)
+    end = len(payload) - 4
+    from_bytes = int.from_bytes
+    mask = (1 << bits) - 1
+    buffer = 0
+    count = 0
+    pos = 0
+
+    # Одно обращение выдает не больше bits символов
+    bulk = size - bits
+    if bulk > 0:
+        multi = _multi_table(single, bits)
+        while len(out) < bulk:
+            if count < bits:
+                buffer = (buffer << 32) | \
+                    from_bytes(payload[pos:pos + 4], 'big')
+                pos += 4
+                count += 32
+            symbols, used = multi[(buffer >> (count - bits)) & mask]
+            if not used:
+                raise ValueError('corrupted Huffman stream')
+            count -= used
+            buffer &= (1 << count) - 1
+            out += symbols
+
+    for _ in range(size - len(out)):
+        if count < bits:
+            buffer = (buffer << 32) | from_bytes(payload[pos:pos + 4], 'big')
+            pos += 4
+            count += 32
+        entry = single[(buffer >> (count - bits)) & mask]
+        if not entry & 15:
+            raise ValueError('corrupted Huffman stream')
+        count -= entry & 15
+        buffer &= (1 << count) - 1
+        out.append(entry >> 4)
+    if pos - (count >> 3) > end:
+        raise ValueError('truncated Huffman stream')
+    return out